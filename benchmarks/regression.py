@@ -0,0 +1,358 @@
+###############################################################################
+# regression.py: Performance regression gate against stored baselines.
+#
+# (c) Copyright 2022, Carlos Eduardo de Andrade. All Rights Reserved.
+#
+# This code is released under LICENSE.md.
+#
+# Created on:  Oct 19, 2026 by ceandrade
+# Last update: Oct 19, 2026 by ceandrade
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+###############################################################################
+"""
+Compares the results of the benchmark suite (see ``benchmarks.suite``) to a
+baseline, failing when the generations per second, the evaluations per
+second, or the peak memory regress beyond a threshold.
+
+The baselines are kept in ``benchmarks/baselines``, one JSON file per
+machine fingerprint (see ``machine_fingerprint()``), such that runs on
+different hardware are compared only to their own baseline. The baseline
+of a machine is recorded by
+
+.. code-block:: text
+
+    $ python -m benchmarks.regression record --preset quick --repeats 10
+
+and then the current code is checked by
+
+.. code-block:: text
+
+    $ python -m benchmarks.regression check --threshold 0.1
+
+which runs the matrix of the baseline again, prints a report, and exits
+with status 1 if some metric regressed, or 2 if there is no baseline for
+this machine. Instead of running the suite, ``check --results FILE``
+compares the results already written by ``benchmarks.suite``.
+
+A rate regresses when the confidence interval (95% by default) of the
+relative slowdown is entirely above the threshold, i.e., the slowdown is
+both larger than the threshold and statistically significant. The
+interval is computed with Welch's t-test from the repetitions of both
+runs. The peak memory is deterministic for a given code and environment,
+so it regresses when it grows more than ``memory_threshold``.
+"""
+
+from __future__ import annotations
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+from typing import Dict, List
+
+from benchmarks.suite import build_matrix, environment_metadata, \
+    parse_arguments, run_suite, write_results
+
+###############################################################################
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            "baselines")
+"""Directory of the baselines."""
+
+GATED_RATES = ("generations_per_second", "evaluations_per_second")
+"""Rates checked against the baseline. Higher is better."""
+
+# Two-sided critical values of the Student's t distribution at 95%
+# confidence, for 1 to 30 degrees of freedom.
+_T_95 = (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262,
+         2.228, 2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101,
+         2.093, 2.086, 2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052,
+         2.048, 2.045, 2.042)
+
+###############################################################################
+
+def machine_fingerprint(environment: Dict[str, object] = None) -> str:
+    """
+    Returns the fingerprint of the machine described by ``environment``
+    (see ``benchmarks.suite.environment_metadata()``), or of this machine.
+    It depends on the processor, the operating system, and the Python
+    interpreter (up to its minor version), but not on the revision of the
+    code nor on the time.
+    """
+    if environment is None:
+        environment = environment_metadata()
+    python_version = ".".join(
+        str(environment["python_version"]).split(".")[:2])
+    key = "|".join(str(item) for item in (
+        environment["machine"], environment["cpu_model"],
+        environment["cpu_count"], environment["system"],
+        environment["python_implementation"], python_version))
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+###############################################################################
+
+def baseline_filename(fingerprint: str, directory: str = None) -> str:
+    """
+    Returns the baseline file of the machine ``fingerprint``.
+    """
+    return os.path.join(directory or BASELINE_DIR, f"{fingerprint}.json")
+
+###############################################################################
+
+def t_critical(degrees_of_freedom: float) -> float:
+    """
+    Returns the two-sided critical value of the Student's t distribution at
+    95% confidence. Fractional degrees of freedom are rounded down, which is
+    conservative.
+    """
+    if degrees_of_freedom < 1.0:
+        return math.inf
+    index = int(degrees_of_freedom)
+    return _T_95[index - 1] if index <= len(_T_95) else 1.960
+
+###############################################################################
+
+def slowdown_interval(baseline: List[float], current: List[float]) \
+        -> tuple:
+    """
+    Returns the confidence interval (95%) of the relative slowdown of the
+    mean of ``current`` with respect to the mean of ``baseline``, i.e., of
+    ``(baseline - current) / baseline``, using Welch's t-test.
+    """
+    base_mean = sum(baseline) / len(baseline)
+    curr_mean = sum(current) / len(current)
+
+    def variance_of_mean(samples: List[float], mean: float) -> float:
+        if len(samples) < 2:
+            return 0.0
+        return sum((x - mean)**2 for x in samples) / \
+            (len(samples) - 1) / len(samples)
+
+    base_var = variance_of_mean(baseline, base_mean)
+    curr_var = variance_of_mean(current, curr_mean)
+    std_error = math.sqrt(base_var + curr_var)
+
+    if std_error == 0.0:
+        margin = 0.0
+    else:
+        # Welch-Satterthwaite degrees of freedom.
+        denominator = sum(
+            var**2 / (len(samples) - 1)
+            for var, samples in ((base_var, baseline), (curr_var, current))
+            if len(samples) > 1)
+        degrees_of_freedom = (std_error**4 / denominator) if denominator \
+            else 0.0
+        margin = t_critical(degrees_of_freedom) * std_error
+
+    slowdown = (base_mean - curr_mean) / base_mean
+    return slowdown - margin / base_mean, slowdown + margin / base_mean
+
+###############################################################################
+
+def compare(baseline: dict, current: dict, threshold: float = 0.1,
+            memory_threshold: float = 0.1) -> List[dict]:
+    """
+    Compares the ``current`` results of the suite to the ``baseline``
+    results, case by case.
+
+    Returns:
+        A list with one entry per case and gated metric: the case, the
+        metric, the baseline and current values (means for the rates),
+        the relative change, the confidence interval of the slowdown (for
+        the rates), whether the metric regressed, and whether the case is
+        missing in the current run. A baseline case missing in the current
+        run has a single entry, with metric ``"-"`` and no values, and
+        fails the gate. Cases missing in the baseline are skipped.
+    """
+    baseline_cases = {result["case"]: result
+                      for result in baseline["results"]}
+    current_cases = {result["case"] for result in current["results"]}
+    report = []
+    for result in current["results"]:
+        base_result = baseline_cases.get(result["case"])
+        if base_result is None:
+            continue
+
+        for metric in GATED_RATES:
+            base_samples = base_result["metrics"][metric]["samples"]
+            curr_samples = result["metrics"][metric]["samples"]
+            low, high = slowdown_interval(base_samples, curr_samples)
+            base_mean = sum(base_samples) / len(base_samples)
+            curr_mean = sum(curr_samples) / len(curr_samples)
+            report.append({
+                "case": result["case"],
+                "metric": metric,
+                "baseline": base_mean,
+                "current": curr_mean,
+                "change": (curr_mean - base_mean) / base_mean,
+                "slowdown_interval": (low, high),
+                "regressed": low > threshold,
+                "missing": False
+            })
+
+        base_memory = base_result.get("peak_memory")
+        curr_memory = result.get("peak_memory")
+        if base_memory and curr_memory:
+            change = (curr_memory - base_memory) / base_memory
+            report.append({
+                "case": result["case"],
+                "metric": "peak_memory",
+                "baseline": base_memory,
+                "current": curr_memory,
+                "change": change,
+                "slowdown_interval": None,
+                "regressed": change > memory_threshold,
+                "missing": False
+            })
+
+    for result in baseline["results"]:
+        if result["case"] not in current_cases:
+            report.append({
+                "case": result["case"],
+                "metric": "-",
+                "baseline": None,
+                "current": None,
+                "change": None,
+                "slowdown_interval": None,
+                "regressed": False,
+                "missing": True
+            })
+    return report
+
+###############################################################################
+
+def format_report(report: List[dict]) -> str:
+    """
+    Formats the comparison report as a table.
+    """
+    lines = [f"{'case':<56} {'metric':<24} {'baseline':>12} "
+             f"{'current':>12} {'change':>8}  status"]
+    for entry in report:
+        if entry.get("missing"):
+            lines.append(f"{entry['case']:<56} {entry['metric']:<24} "
+                         f"{'-':>12} {'-':>12} {'-':>8}  MISSING")
+            continue
+        status = "REGRESSED" if entry["regressed"] else "ok"
+        lines.append(f"{entry['case']:<56} {entry['metric']:<24} "
+                     f"{entry['baseline']:>12.6g} {entry['current']:>12.6g} "
+                     f"{entry['change']:>+8.1%}  {status}")
+    return "\n".join(lines)
+
+###############################################################################
+
+def record(results: dict, directory: str = None) -> str:
+    """
+    Stores ``results`` as the baseline of the machine that produced them,
+    and returns the baseline file.
+    """
+    filename = baseline_filename(
+        machine_fingerprint(results["environment"]), directory)
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    write_results(results, filename)
+    return filename
+
+###############################################################################
+
+def rerun_baseline(baseline: dict) -> dict:
+    """
+    Runs the suite again with the configuration and cases of ``baseline``.
+    """
+    cases = []
+    for result in baseline["results"]:
+        parameters = result["parameters"]
+        cases.extend(build_matrix(
+            [parameters["decoder"]], [parameters["population_size"]],
+            [parameters["chromosome_size"]], [parameters["bias_type"]],
+            [parameters["num_islands"]]))
+    config = baseline["config"]
+    memory = any(result.get("peak_memory") for result in baseline["results"])
+    return run_suite(cases, config["generations"], config["repeats"],
+                     config["seed"], memory, verbose=True)
+
+###############################################################################
+
+def main(argv: List[str] = None) -> int:
+    """
+    Runs the command line, and returns the exit status.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.regression",
+        description="Performance regression gate of BRKGA-MP-IPR.")
+    parser.add_argument("command", choices=["record", "check"])
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="tolerated slowdown of the rates "
+                             "(default: 0.1)")
+    parser.add_argument("--memory-threshold", type=float, default=0.1,
+                        help="tolerated growth of the peak memory "
+                             "(default: 0.1)")
+    parser.add_argument("--baseline-dir", default=BASELINE_DIR)
+    parser.add_argument("--results",
+                        help="results of benchmarks.suite to record or "
+                             "check, instead of running the suite")
+    arguments, suite_argv = parser.parse_known_args(argv)
+
+    if arguments.results is not None:
+        with open(arguments.results) as hd:
+            results = json.load(hd)
+    else:
+        results = None
+
+    if arguments.command == "record":
+        if results is None:
+            suite_arguments = parse_arguments(suite_argv)
+            cases = build_matrix(
+                suite_arguments.decoders, suite_arguments.population_sizes,
+                suite_arguments.chromosome_sizes, suite_arguments.bias_types,
+                suite_arguments.islands)
+            results = run_suite(cases, suite_arguments.generations,
+                                suite_arguments.repeats, suite_arguments.seed,
+                                not suite_arguments.no_memory, verbose=True)
+        filename = record(results, arguments.baseline_dir)
+        print(f"Baseline recorded in {filename}")
+        return 0
+
+    fingerprint = machine_fingerprint(
+        results["environment"] if results is not None else None)
+    filename = baseline_filename(fingerprint, arguments.baseline_dir)
+    if not os.path.exists(filename):
+        print(f"No baseline for this machine ({fingerprint}). Run "
+              f"'python -m benchmarks.regression record' first.",
+              file=sys.stderr)
+        return 2
+
+    with open(filename) as hd:
+        baseline = json.load(hd)
+    if results is None:
+        results = rerun_baseline(baseline)
+
+    report = compare(baseline, results, arguments.threshold,
+                     arguments.memory_threshold)
+    print(format_report(report))
+    regressions = sum(entry["regressed"] for entry in report)
+    missing = sum(entry.get("missing", False) for entry in report)
+    if regressions or missing:
+        if regressions:
+            print(f"\n{regressions} regression(s) beyond the thresholds")
+        if missing:
+            print(f"\n{missing} baseline case(s) missing in the current "
+                  f"results")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+###############################################################################
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,537 @@
+###############################################################################
+# scaling.py: Parallel scaling benchmarks of the decoding.
+#
+# (c) Copyright 2022, Carlos Eduardo de Andrade. All Rights Reserved.
+#
+# This code is released under LICENSE.md.
+#
+# Created on:  Oct 19, 2026 by ceandrade
+# Last update: Oct 19, 2026 by ceandrade
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+###############################################################################
+"""
+Measures how the evolution scales with the number of workers that decode
+the chromosomes. In this package, the chromosomes of each step are handed
+to the decoder in a single ``decode_batch()`` call (see ``BrkgaMpIpr``), and
+the decoder evaluates them in parallel. Here, ``SyntheticDecoder`` does so
+on a pool of threads or processes, with a tunable cost per evaluation, from
+microseconds to seconds. The cost is either spent sleeping, which releases
+the GIL like most native decoders, or spinning for a fixed CPU time, which
+holds the GIL like pure Python decoders. For instance,
+
+.. code-block:: text
+
+    $ python -m benchmarks.scaling --preset quick --output scaling.json
+    $ python -m benchmarks.scaling --modes strong --workers 1 2 4 8 \\
+          --costs 1e-5 1e-3 0.1 --gil hold --backends process
+
+For each decoder class (cost, GIL, and backend), the evolution runs with
+each number of workers, in two modes:
+
+- ``strong``: the population size is fixed. The speedup is the time per
+  generation with the base number of workers (the first of the list)
+  divided by the time with ``n`` workers, and the efficiency is the speedup
+  divided by the ratio of workers;
+
+- ``weak``: the population size grows with the number of workers. The
+  efficiency is the time per generation with the base number of workers
+  divided by the time with ``n`` workers, and the (scaled) speedup is the
+  efficiency times the ratio of workers.
+
+The overhead per evaluation is the worker time not spent decoding, divided
+by the number of evaluations, i.e., ``(workers * wall time - busy time) /
+evaluations``. It accounts for the dispatching and serialization of the
+chromosomes (IPC, in the process backend), the contention on the GIL, and
+the idle workers at the end of each batch.
+
+The time-to-target curve of each run is the best fitness after each
+generation, against the elapsed time. The time to target is the first
+elapsed time where the best fitness reaches the target, which is, by
+default, the final best fitness of the base number of workers. Since the
+decoder is deterministic, the strong scaling runs follow the same
+trajectory, and differ only on the time axis.
+"""
+
+from __future__ import annotations
+import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import statistics
+import sys
+import time
+from typing import List, NamedTuple, Sequence, Tuple
+
+from brkga_mp_ipr.algorithm import BrkgaMpIpr
+from brkga_mp_ipr.enums import BiasFunctionType, Sense
+from brkga_mp_ipr.types import BaseChromosome, BrkgaParams
+
+from benchmarks.suite import environment_metadata, summarize, write_results
+
+###############################################################################
+
+BACKENDS = ("thread", "process")
+"""Pools used by ``SyntheticDecoder`` to decode in parallel."""
+
+MODES = ("strong", "weak")
+"""Scaling modes."""
+
+PRESETS = {
+    "quick": {
+        "modes": ["strong", "weak"],
+        "workers": [1, 2, 4],
+        "costs": [1e-4, 1e-3],
+        "gil": ["release", "hold"],
+        "backends": ["thread", "process"],
+        "population_size": 100,
+        "chromosome_size": 100,
+        "generations": 5,
+        "repeats": 1
+    },
+    "full": {
+        "modes": ["strong", "weak"],
+        "workers": [1, 2, 4, 8, 16],
+        "costs": [1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0],
+        "gil": ["release", "hold"],
+        "backends": ["thread", "process"],
+        "population_size": 200,
+        "chromosome_size": 100,
+        "generations": 10,
+        "repeats": 3
+    }
+}
+"""Predefined scaling matrices."""
+
+###############################################################################
+
+def _synthetic_decode(keys: Sequence[float], cost: float,
+                      release_gil: bool) -> Tuple[float, float]:
+    """
+    Returns the fitness of ``keys`` (the sum of the keys), and the time
+    spent decoding, in seconds. The decoding takes ``cost`` seconds sleeping
+    (if ``release_gil``), or ``cost`` seconds of CPU time of the calling
+    thread, spinning. The CPU time, unlike the wall clock, advances only
+    while the thread holds the GIL, so spinning threads take turns and
+    their work serializes, as in a pure Python decoder.
+    """
+    if release_gil:
+        start_time = time.perf_counter()
+        fitness = sum(keys)
+        if cost > 0.0:
+            time.sleep(cost)
+        return fitness, time.perf_counter() - start_time
+
+    start_time = time.thread_time()
+    fitness = sum(keys)
+    end_time = start_time + cost
+    while time.thread_time() < end_time:
+        pass
+    return fitness, time.thread_time() - start_time
+
+###############################################################################
+
+class SyntheticDecoder:
+    """
+    Decoder of tunable cost, whose fitness is the sum of the keys (to be
+    maximized). ``decode_batch()`` evaluates the chromosomes on a pool of
+    ``num_workers`` threads or processes (``backend``), or in the calling
+    thread if ``num_workers == 1``. The pool is started (and warmed up) on
+    construction, and must be stopped by ``close()``. The decoder can also
+    be used as a context manager.
+
+    Attributes:
+        cost (float): seconds spent by each evaluation.
+
+        release_gil (bool): if true, the cost is spent sleeping, which
+            releases the GIL. Otherwise, it is CPU time spent spinning.
+
+        num_workers (int): number of workers of the pool.
+
+        backend (str): ``thread`` or ``process``.
+
+        evaluations (int): number of chromosomes decoded so far.
+
+        busy_time (float): time, in seconds, spent by the workers decoding
+            (CPU time, if spinning).
+
+        wall_time (float): time, in seconds, spent in ``decode_batch()``.
+    """
+
+    def __init__(self, cost: float, release_gil: bool = True,
+                 num_workers: int = 1, backend: str = "thread"):
+        """
+        Raises:
+            ``ValueError``: if ``cost < 0``, ``num_workers < 1``, or the
+                backend is unknown.
+        """
+        if cost < 0.0:
+            raise ValueError(f"Cost must be non-negative, current {cost}")
+        if num_workers < 1:
+            raise ValueError(f"Number of workers must be larger than zero, "
+                             f"current {num_workers}")
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+
+        self.cost = cost
+        self.release_gil = release_gil
+        self.num_workers = num_workers
+        self.backend = backend
+        self.evaluations = 0
+        self.busy_time = 0.0
+        self.wall_time = 0.0
+
+        self._executor = None
+        if num_workers > 1:
+            pool = ThreadPoolExecutor if backend == "thread" \
+                else ProcessPoolExecutor
+            self._executor = pool(max_workers=num_workers)
+            # Starts all workers before timing anything.
+            list(self._executor.map(time.sleep, [0.01] * num_workers))
+
+    ###########################################################################
+
+    def decode(self, chromosome: BaseChromosome, rewrite: bool) -> float:
+        return _synthetic_decode(chromosome, self.cost, self.release_gil)[0]
+
+    ###########################################################################
+
+    def decode_batch(self, chromosomes: List[BaseChromosome],
+                     rewrite: bool) -> List[float]:
+        start_time = time.perf_counter()
+        num_chromosomes = len(chromosomes)
+        costs = [self.cost] * num_chromosomes
+        release = [self.release_gil] * num_chromosomes
+        if self._executor is None:
+            results = list(map(_synthetic_decode, chromosomes, costs,
+                               release))
+        else:
+            # Chunks amortize the IPC, but leave enough of them to balance
+            # the load among the processes.
+            chunk_size = max(1, num_chromosomes // (4 * self.num_workers))
+            results = list(self._executor.map(
+                _synthetic_decode, [list(keys) for keys in chromosomes],
+                costs, release, chunksize=chunk_size))
+
+        self.evaluations += num_chromosomes
+        self.busy_time += sum(busy for _, busy in results)
+        self.wall_time += time.perf_counter() - start_time
+        return [fitness for fitness, _ in results]
+
+    ###########################################################################
+
+    def reset_counters(self) -> None:
+        """
+        Zeroes ``evaluations``, ``busy_time``, and ``wall_time``.
+        """
+        self.evaluations = 0
+        self.busy_time = 0.0
+        self.wall_time = 0.0
+
+    ###########################################################################
+
+    def overhead_per_evaluation(self) -> float:
+        """
+        Returns the worker time, in seconds, not spent decoding, per
+        evaluation since the last ``reset_counters()``.
+        """
+        if self.evaluations == 0:
+            return 0.0
+        return max(0.0, self.num_workers * self.wall_time - self.busy_time) \
+            / self.evaluations
+
+    ###########################################################################
+
+    def close(self) -> None:
+        """
+        Stops the pool. Calling ``close()`` more than once has no effect.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    ###########################################################################
+
+    def __enter__(self) -> "SyntheticDecoder":
+        return self
+
+    ###########################################################################
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+###############################################################################
+
+class ScalingCase(NamedTuple):
+    """
+    A decoder class of the scaling matrix.
+    """
+    cost: float
+    release_gil: bool
+    backend: str
+
+    @property
+    def name(self) -> str:
+        """
+        A unique name of the case.
+        """
+        gil = "release" if self.release_gil else "hold"
+        return f"cost={self.cost:g}/gil={gil}/backend={self.backend}"
+
+###############################################################################
+
+def build_matrix(costs: List[float], gil: List[str],
+                 backends: List[str]) -> List[ScalingCase]:
+    """
+    Returns the cases of the scaling matrix, where ``gil`` holds
+    ``release`` and/or ``hold``.
+
+    Raises:
+        ``ValueError``: if a GIL mode or a backend is unknown.
+    """
+    for mode in gil:
+        if mode not in ("release", "hold"):
+            raise ValueError(f"Unknown GIL mode: {mode}")
+    for backend in backends:
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+
+    return [ScalingCase(cost, mode == "release", backend)
+            for cost in costs for mode in gil for backend in backends]
+
+###############################################################################
+
+def time_run(case: ScalingCase, num_workers: int, population_size: int,
+             chromosome_size: int, generations: int, seed: int) -> dict:
+    """
+    Evolves a single population for ``generations`` generations, decoding
+    with ``num_workers`` workers, and returns the time per generation, the
+    evaluations per second, the overhead per evaluation, and the curve of
+    the best fitness after each generation, against the elapsed time (in
+    seconds). The initialization is not timed.
+    """
+    params = BrkgaParams()
+    params.population_size = population_size
+    params.elite_percentage = 0.15
+    params.mutants_percentage = 0.15
+    params.num_elite_parents = 2
+    params.total_parents = 3
+    params.bias_type = BiasFunctionType.LOGINVERSE
+    params.num_independent_populations = 1
+
+    with SyntheticDecoder(case.cost, case.release_gil, num_workers,
+                          case.backend) as decoder:
+        brkga = BrkgaMpIpr(decoder=decoder, sense=Sense.MAXIMIZE, seed=seed,
+                           chromosome_size=chromosome_size, params=params)
+        brkga.initialize()
+        decoder.reset_counters()
+
+        curve = []
+        start_time = time.perf_counter()
+        for _ in range(generations):
+            brkga.evolve(1)
+            curve.append([time.perf_counter() - start_time,
+                          brkga.get_best_fitness()])
+        evolve_time = time.perf_counter() - start_time
+
+        return {
+            "time_per_generation": evolve_time / generations,
+            "evaluations_per_second": decoder.evaluations / evolve_time,
+            "overhead_per_evaluation": decoder.overhead_per_evaluation(),
+            "curve": curve
+        }
+
+###############################################################################
+
+def time_to_target(curve: List[List[float]], target: float) -> float:
+    """
+    Returns the first elapsed time of ``curve`` where the best fitness
+    reaches ``target`` (maximizing), or ``None`` if it never does.
+    """
+    for elapsed, fitness in curve:
+        if fitness >= target:
+            return elapsed
+    return None
+
+###############################################################################
+
+def run_scaling(case: ScalingCase, mode: str, workers: List[int],
+                population_size: int, chromosome_size: int,
+                generations: int, repeats: int = 1, seed: int = 270001,
+                target: float = None) -> dict:
+    """
+    Runs ``case`` with each number of ``workers``, ``repeats`` times, and
+    returns the scaling of the median time per generation relative to
+    ``workers[0]``. In the weak mode, the population size is
+    ``population_size`` times the ratio of workers. The curves are the ones
+    of the first repetition.
+
+    Raises:
+        ``ValueError``: if the mode is unknown.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode: {mode}")
+
+    points = []
+    for num_workers in workers:
+        ratio = num_workers / workers[0]
+        size = population_size
+        if mode == "weak":
+            size = max(1, round(population_size * ratio))
+
+        runs = [time_run(case, num_workers, size, chromosome_size,
+                         generations, seed + repeat)
+                for repeat in range(repeats)]
+        times = [run["time_per_generation"] for run in runs]
+        points.append({
+            "workers": num_workers,
+            "population_size": size,
+            "time_per_generation": summarize(times),
+            "evaluations_per_second": statistics.median(
+                run["evaluations_per_second"] for run in runs),
+            "overhead_per_evaluation": statistics.median(
+                run["overhead_per_evaluation"] for run in runs),
+            "curve": runs[0]["curve"]
+        })
+
+    if target is None:
+        target = points[0]["curve"][-1][1]
+
+    base_time = points[0]["time_per_generation"]["median"]
+    for point in points:
+        ratio = point["workers"] / workers[0]
+        point_time = point["time_per_generation"]["median"]
+        if mode == "strong":
+            point["speedup"] = base_time / point_time
+            point["efficiency"] = point["speedup"] / ratio
+        else:
+            point["efficiency"] = base_time / point_time
+            point["speedup"] = point["efficiency"] * ratio
+        point["time_to_target"] = time_to_target(point["curve"], target)
+
+    return {
+        "case": case.name,
+        "parameters": case._asdict(),
+        "mode": mode,
+        "target": target,
+        "points": points
+    }
+
+###############################################################################
+
+def run_matrix(cases: List[ScalingCase], modes: List[str],
+               workers: List[int], population_size: int,
+               chromosome_size: int, generations: int, repeats: int = 1,
+               seed: int = 270001, target: float = None,
+               verbose: bool = False) -> dict:
+    """
+    Runs all ``cases`` in all ``modes`` and returns the results, with the
+    environment metadata, as a dictionary that can be serialized to JSON.
+    """
+    results = []
+    for case in cases:
+        for mode in modes:
+            if verbose:
+                print(f"Running {case.name} ({mode})...", file=sys.stderr,
+                      flush=True)
+            results.append(run_scaling(case, mode, workers, population_size,
+                                       chromosome_size, generations,
+                                       repeats, seed, target))
+
+    return {
+        "environment": environment_metadata(),
+        "config": {
+            "workers": workers,
+            "population_size": population_size,
+            "chromosome_size": chromosome_size,
+            "generations": generations,
+            "repeats": repeats,
+            "seed": seed
+        },
+        "results": results
+    }
+
+###############################################################################
+
+def format_report(results: dict) -> str:
+    """
+    Returns a table of the speedup, efficiency, and overhead per evaluation
+    of each case, mode, and number of workers.
+    """
+    lines = [f"{'case':<40} {'mode':<6} {'workers':>7} {'speedup':>8} "
+             f"{'effic.':>7} {'overhead':>10} {'to target':>10}"]
+    for result in results["results"]:
+        for point in result["points"]:
+            to_target = point["time_to_target"]
+            to_target = "-" if to_target is None else f"{to_target:.3g}s"
+            lines.append(
+                f"{result['case']:<40} {result['mode']:<6} "
+                f"{point['workers']:>7} {point['speedup']:>8.2f} "
+                f"{point['efficiency']:>7.2f} "
+                f"{point['overhead_per_evaluation'] * 1e6:>8.1f}us "
+                f"{to_target:>10}")
+    return "\n".join(lines)
+
+###############################################################################
+
+def parse_arguments(argv: List[str] = None) -> argparse.Namespace:
+    """
+    Parses the command-line arguments, filling the matrix from the preset.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.scaling",
+        description="Strong and weak scaling of the BRKGA-MP-IPR parallel "
+                    "decoding.")
+    parser.add_argument("--preset", choices=sorted(PRESETS),
+                        default="quick",
+                        help="predefined matrix (default: quick)")
+    parser.add_argument("--modes", nargs="+", choices=MODES)
+    parser.add_argument("--workers", nargs="+", type=int,
+                        help="numbers of workers; the first is the base")
+    parser.add_argument("--costs", nargs="+", type=float,
+                        help="seconds per evaluation")
+    parser.add_argument("--gil", nargs="+", choices=("release", "hold"))
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS)
+    parser.add_argument("--population-size", type=int,
+                        help="population size of the base number of "
+                             "workers")
+    parser.add_argument("--chromosome-size", type=int)
+    parser.add_argument("--generations", type=int)
+    parser.add_argument("--repeats", type=int)
+    parser.add_argument("--seed", type=int, default=270001)
+    parser.add_argument("--target", type=float,
+                        help="target fitness (default: the final best "
+                             "fitness of the base number of workers)")
+    parser.add_argument("--output", help="JSON file (default: stdout)")
+
+    arguments = parser.parse_args(argv)
+    for key, value in PRESETS[arguments.preset].items():
+        if getattr(arguments, key) is None:
+            setattr(arguments, key, value)
+    return arguments
+
+###############################################################################
+
+def main(argv: List[str] = None) -> None:
+    arguments = parse_arguments(argv)
+    cases = build_matrix(arguments.costs, arguments.gil, arguments.backends)
+    results = run_matrix(cases, arguments.modes, arguments.workers,
+                         arguments.population_size,
+                         arguments.chromosome_size, arguments.generations,
+                         arguments.repeats, arguments.seed,
+                         arguments.target, verbose=True)
+    print(format_report(results), file=sys.stderr)
+    write_results(results, arguments.output)
+
+###############################################################################
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,432 @@
+###############################################################################
+# suite.py: Benchmarks of the operators and generations.
+#
+# (c) Copyright 2022, Carlos Eduardo de Andrade. All Rights Reserved.
+#
+# This code is released under LICENSE.md.
+#
+# Created on:  Oct 19, 2026 by ceandrade
+# Last update: Oct 19, 2026 by ceandrade
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+###############################################################################
+"""
+Benchmarks ``initialize()``, ``evolve_population()``, the phases of the
+evolution (selection, crossover, mutant generation, and sorting), and
+``get_best_chromosome()``, over a matrix of decoders, population sizes,
+chromosome sizes, bias functions, and number of islands. The results are
+written as JSON, together with the metadata of the environment. For
+instance,
+
+.. code-block:: text
+
+    $ python -m benchmarks.suite --preset quick --output results.json
+    $ python -m benchmarks.suite --decoders sum tsp:rd400 \\
+          --population-sizes 100 1000 --islands 1 3 --repeats 5
+
+The decoders are ``sum`` and ``rank``, from ``tests/decoders.py``, and
+``tsp:<instance>``, the decoder of ``examples/tsp`` on the instance
+``examples/tsp/instances/<instance>.dat``. The chromosome size of the TSP
+decoder is the number of nodes of the instance.
+
+The phases are timed by the profiling of ``BrkgaMpIpr`` (see
+``BrkgaMpIpr.get_profile()``), which is on during the evolution. Each metric
+is measured once per repetition, and summarized by its mean, standard
+deviation, minimum, and median. The peak memory is measured by
+``tracemalloc`` in a separate, untimed, run.
+"""
+
+from __future__ import annotations
+import argparse
+import datetime
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, NamedTuple
+
+from brkga_mp_ipr.algorithm import BrkgaMpIpr
+from brkga_mp_ipr.enums import BiasFunctionType, Sense
+from brkga_mp_ipr.types import BrkgaParams
+
+from tests.decoders import RankDecode, SumDecode
+from tests.instance import Instance
+
+###############################################################################
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+"""Root of the repository."""
+
+TSP_DIR = os.path.join(ROOT_DIR, "examples", "tsp")
+"""Directory of the TSP example."""
+
+PRESETS = {
+    "quick": {
+        "decoders": ["sum", "rank", "tsp:burma14"],
+        "population_sizes": [100],
+        "chromosome_sizes": [100],
+        "bias_types": ["LOGINVERSE"],
+        "islands": [1, 3],
+        "generations": 5,
+        "repeats": 3
+    },
+    "full": {
+        "decoders": ["sum", "rank", "tsp:brazil58", "tsp:rd400"],
+        "population_sizes": [100, 500, 2000],
+        "chromosome_sizes": [100, 1000],
+        "bias_types": ["LOGINVERSE", "LINEAR", "CONSTANT"],
+        "islands": [1, 3],
+        "generations": 10,
+        "repeats": 5
+    }
+}
+"""Predefined benchmark matrices."""
+
+METRICS = ("initialize", "evolve_population", "selection", "crossover",
+           "mutants", "sorting", "get_best_chromosome",
+           "generations_per_second", "evaluations_per_second")
+"""Timed metrics of each case. The first seven are in seconds per call
+   (for the phases, per generation of each island), and the last two are
+   rates."""
+
+###############################################################################
+
+class BenchmarkCase(NamedTuple):
+    """
+    A point of the benchmark matrix.
+    """
+    decoder: str
+    population_size: int
+    chromosome_size: int
+    bias_type: str
+    num_islands: int
+
+    @property
+    def name(self) -> str:
+        """
+        A unique name of the case, used as key of the baselines.
+        """
+        return (f"{self.decoder}/pop={self.population_size}/"
+                f"chr={self.chromosome_size}/bias={self.bias_type}/"
+                f"islands={self.num_islands}")
+
+###############################################################################
+
+def build_matrix(decoders: List[str], population_sizes: List[int],
+                 chromosome_sizes: List[int], bias_types: List[str],
+                 islands: List[int]) -> List[BenchmarkCase]:
+    """
+    Returns the cases of the benchmark matrix. The chromosome size of the
+    TSP decoders is given by the instance, so they do not vary on
+    ``chromosome_sizes``.
+
+    Raises:
+        ``ValueError``: if a decoder or a bias type is unknown.
+    """
+    cases = []
+    for decoder in decoders:
+        if decoder.startswith("tsp:"):
+            sizes = [make_decoder(decoder, 0)[1]]
+        elif decoder in ("sum", "rank"):
+            sizes = chromosome_sizes
+        else:
+            raise ValueError(f"Unknown decoder: {decoder}")
+
+        for population_size, chromosome_size, bias_type, num_islands in \
+                itertools.product(population_sizes, sizes, bias_types,
+                                  islands):
+            if bias_type.upper() not in BiasFunctionType.__members__:
+                raise ValueError(f"Unknown bias type: {bias_type}")
+            cases.append(BenchmarkCase(decoder, population_size,
+                                       chromosome_size, bias_type.upper(),
+                                       num_islands))
+    return cases
+
+###############################################################################
+
+_tsp_instances = {}
+"""TSP instances already read, by name."""
+
+def make_decoder(decoder: str, chromosome_size: int) -> tuple:
+    """
+    Returns a tuple with the decoder, the chromosome size, and the
+    optimization sense of the decoder named ``decoder``.
+    """
+    if decoder == "sum":
+        return SumDecode(Instance(chromosome_size)), chromosome_size, \
+            Sense.MAXIMIZE
+    if decoder == "rank":
+        return RankDecode(Instance(chromosome_size)), chromosome_size, \
+            Sense.MAXIMIZE
+
+    # The TSP example is not a package.
+    if TSP_DIR not in sys.path:
+        sys.path.append(TSP_DIR)
+    from tsp_decoder import TSPDecoder
+    from tsp_instance import TSPInstance
+
+    name = decoder.split(":", 1)[1]
+    if name not in _tsp_instances:
+        _tsp_instances[name] = TSPInstance(
+            os.path.join(TSP_DIR, "instances", f"{name}.dat"))
+    instance = _tsp_instances[name]
+    return TSPDecoder(instance), instance.num_nodes, Sense.MINIMIZE
+
+###############################################################################
+
+def make_algorithm(case: BenchmarkCase, seed: int) -> BrkgaMpIpr:
+    """
+    Returns a non-initialized algorithm for ``case``.
+    """
+    decoder, chromosome_size, sense = make_decoder(case.decoder,
+                                                   case.chromosome_size)
+    params = BrkgaParams()
+    params.population_size = case.population_size
+    params.elite_percentage = 0.15
+    params.mutants_percentage = 0.15
+    params.num_elite_parents = 2
+    params.total_parents = 3
+    params.bias_type = BiasFunctionType[case.bias_type]
+    params.num_independent_populations = case.num_islands
+    return BrkgaMpIpr(decoder=decoder, sense=sense, seed=seed,
+                      chromosome_size=chromosome_size, params=params)
+
+###############################################################################
+
+def time_case(case: BenchmarkCase, generations: int, seed: int) \
+        -> Dict[str, float]:
+    """
+    Runs ``case`` once, and returns the value of each metric (see
+    ``METRICS``).
+    """
+    brkga = make_algorithm(case, seed)
+
+    start_time = time.perf_counter()
+    brkga.initialize()
+    initialize_time = time.perf_counter() - start_time
+
+    brkga.set_profiling(True)
+    brkga.reset_evaluation_stats()
+    start_time = time.perf_counter()
+    brkga.evolve(generations)
+    evolve_time = time.perf_counter() - start_time
+    evaluations = brkga.get_evaluation_stats().total_evaluations
+
+    num_calls = generations * case.num_islands
+    phases = {
+        phase: sum(profile[phase][0] for profile in brkga.get_profile())
+        / num_calls
+        for phase in ("selection", "crossover", "mutants", "sorting")
+    }
+
+    num_best_calls = 100
+    start_time = time.perf_counter()
+    for _ in range(num_best_calls):
+        brkga.get_best_chromosome()
+    best_time = (time.perf_counter() - start_time) / num_best_calls
+
+    metrics = {
+        "initialize": initialize_time,
+        "evolve_population": evolve_time / num_calls,
+        "get_best_chromosome": best_time,
+        "generations_per_second": generations / evolve_time,
+        "evaluations_per_second": evaluations / evolve_time
+    }
+    metrics.update(phases)
+    return metrics
+
+###############################################################################
+
+def measure_peak_memory(case: BenchmarkCase, seed: int) -> int:
+    """
+    Returns the peak of memory allocated by Python, in bytes, to build and
+    initialize the algorithm of ``case``, and to evolve one generation.
+    """
+    tracemalloc.start()
+    try:
+        brkga = make_algorithm(case, seed)
+        brkga.initialize()
+        brkga.evolve(1)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+###############################################################################
+
+def summarize(samples: List[float]) -> Dict[str, object]:
+    """
+    Returns the samples of a metric, their mean, standard deviation,
+    minimum, and median.
+    """
+    return {
+        "samples": samples,
+        "mean": statistics.mean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "min": min(samples),
+        "median": statistics.median(samples)
+    }
+
+###############################################################################
+
+def run_case(case: BenchmarkCase, generations: int, repeats: int,
+             seed: int = 270001, memory: bool = True) -> dict:
+    """
+    Runs ``case`` ``repeats`` times, each with its own seed, and returns
+    the summary of each metric, and the peak memory, in bytes (``None`` if
+    ``memory`` is false).
+    """
+    samples = {metric: [] for metric in METRICS}
+    for repeat in range(repeats):
+        for metric, value in time_case(case, generations,
+                                       seed + repeat).items():
+            samples[metric].append(value)
+
+    return {
+        "case": case.name,
+        "parameters": case._asdict(),
+        "generations": generations,
+        "repeats": repeats,
+        "metrics": {
+            metric: summarize(values) for metric, values in samples.items()
+        },
+        "peak_memory": measure_peak_memory(case, seed) if memory else None
+    }
+
+###############################################################################
+
+def environment_metadata() -> Dict[str, object]:
+    """
+    Returns the metadata of the environment: the machine, the operating
+    system, the Python interpreter, and the revision of the code.
+    """
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT_DIR, capture_output=True,
+            text=True, check=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        revision = None
+
+    cpu_model = platform.processor()
+    try:
+        with open("/proc/cpuinfo") as hd:
+            for line in hd:
+                if line.startswith("model name"):
+                    cpu_model = line.split(":", 1)[1].strip()
+                    break
+    except OSError:
+        pass
+
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc)
+                     .isoformat(),
+        "machine": platform.machine(),
+        "cpu_model": cpu_model,
+        "cpu_count": os.cpu_count(),
+        "system": platform.system(),
+        "release": platform.release(),
+        "python_implementation": platform.python_implementation(),
+        "python_version": platform.python_version(),
+        "git_revision": revision
+    }
+
+###############################################################################
+
+def run_suite(cases: List[BenchmarkCase], generations: int, repeats: int,
+              seed: int = 270001, memory: bool = True,
+              verbose: bool = False) -> dict:
+    """
+    Runs all ``cases`` and returns the results, with the environment
+    metadata, as a dictionary that can be serialized to JSON.
+    """
+    results = []
+    for case in cases:
+        if verbose:
+            print(f"Running {case.name}...", file=sys.stderr, flush=True)
+        results.append(run_case(case, generations, repeats, seed, memory))
+
+    return {
+        "environment": environment_metadata(),
+        "config": {
+            "generations": generations,
+            "repeats": repeats,
+            "seed": seed
+        },
+        "results": results
+    }
+
+###############################################################################
+
+def parse_arguments(argv: List[str] = None) -> argparse.Namespace:
+    """
+    Parses the command-line arguments, filling the matrix from the preset.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite",
+        description="Benchmarks of the BRKGA-MP-IPR operators and "
+                    "generations.")
+    parser.add_argument("--preset", choices=sorted(PRESETS),
+                        default="quick",
+                        help="predefined matrix (default: quick)")
+    parser.add_argument("--decoders", nargs="+",
+                        help="sum, rank, or tsp:<instance>")
+    parser.add_argument("--population-sizes", nargs="+", type=int)
+    parser.add_argument("--chromosome-sizes", nargs="+", type=int)
+    parser.add_argument("--bias-types", nargs="+")
+    parser.add_argument("--islands", nargs="+", type=int)
+    parser.add_argument("--generations", type=int)
+    parser.add_argument("--repeats", type=int)
+    parser.add_argument("--seed", type=int, default=270001)
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the peak memory measurement")
+    parser.add_argument("--output", help="JSON file (default: stdout)")
+
+    arguments = parser.parse_args(argv)
+    for key, value in PRESETS[arguments.preset].items():
+        if getattr(arguments, key) is None:
+            setattr(arguments, key, value)
+    return arguments
+
+###############################################################################
+
+def write_results(results: dict, output: str = None) -> None:
+    """
+    Writes ``results`` as JSON into ``output``, or into the standard output.
+    """
+    if output is None:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        with open(output, "w") as hd:
+            json.dump(results, hd, indent=2)
+
+###############################################################################
+
+def main(argv: List[str] = None) -> None:
+    arguments = parse_arguments(argv)
+    cases = build_matrix(arguments.decoders, arguments.population_sizes,
+                         arguments.chromosome_sizes, arguments.bias_types,
+                         arguments.islands)
+    results = run_suite(cases, arguments.generations, arguments.repeats,
+                        arguments.seed, not arguments.no_memory,
+                        verbose=True)
+    write_results(results, arguments.output)
+
+###############################################################################
+
+if __name__ == "__main__":
+    main()
@@ -33,5 +33,12 @@ __all__ = [
     "exceptions",
     "types",
     "types_io",
+    "distances",
+    "storage",
+    "checkpoint",
+    "evaluation_log",
+    "metrics",
+    "memory",
+    "tracing",
     "algorithm"
 ]
@@ -21,13 +21,45 @@
 # POSSIBILITY OF SUCH DAMAGE.
 ###############################################################################
 
+from __future__ import annotations
+from array import array
+import bisect
+from concurrent.futures import ProcessPoolExecutor
 import copy
+import heapq
 import math
+import operator
+import os
 from random import Random
-from typing import List, Callable
-
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+import uuid
+
+from brkga_mp_ipr.checkpoint import append_checkpoint, read_checkpoint, \
+    read_checkpoint_log, write_checkpoint
+from brkga_mp_ipr.distances import EliteDistanceCache, LSHIndex
 from brkga_mp_ipr.enums import *
+from brkga_mp_ipr.evaluation_log import EvaluationLog
+from brkga_mp_ipr.memory import MemoryProfile, deep_sizeof
+from brkga_mp_ipr.metrics import EvaluationStats, MetricsExporter
+from brkga_mp_ipr.storage import KeyCodec, MappedRows
+from brkga_mp_ipr.tracing import TraceRecorder
 from brkga_mp_ipr.types import *
+from brkga_mp_ipr.types_io import load_npy_matrix
+
+###############################################################################
+
+PROFILE_PHASES = ("elite", "selection", "crossover", "mutants", "decoding",
+                  "sorting")
+"""Phases of the evolution timed by the profiling (see
+   ``BrkgaMpIpr.get_profile()``)."""
+
+# Tracks of the trace (see ``BrkgaMpIpr.set_tracer()``). Population ``i`` is
+# traced in track ``_TRACK_ISLAND + i``.
+_TRACK_ALGORITHM = 0
+_TRACK_DECODER = 1
+_TRACK_ISLAND = 2
 
 ###############################################################################
 
@@ -71,6 +103,33 @@ class BrkgaMpIpr:
     the user to customize the chromosome, adding new functionalities as
     needed. Please, see ``BaseChromosome`` for more details.
 
+    Optionally, the decoder may also implement the method
+
+    .. code-block:: python
+
+        def decode_batch(self, chromosomes: List[BaseChromosome],
+                         rewrite: bool) -> List[float]:
+
+    which must return the fitness of each given chromosome, in the same
+    order. When such method is available, the algorithm hands all
+    chromosomes of a given step (the offspring of a generation, the
+    candidates of a path relink step, etc.) in a single call, such that the
+    decoder can evaluate them in parallel, using threads, processes, or any
+    other resource.
+
+    By default, each chromosome is kept as a ``BaseChromosome`` of Python
+    floats. For large populations, the keys can be stored in a compact
+    format instead (see ``KeyStorage``), such as single-precision floats or
+    16-bit fixed-point integers. In such case, the keys are converted to
+    ``chrmosome_type`` objects only to be decoded, and the values rewritten
+    by the decoder are converted back.
+
+    For populations larger than the memory, give a scratch
+    ``storage_directory``. The populations are then stored in memory-mapped
+    files in such directory (see ``MappedRows``), and the chromosomes are
+    decoded in chunks of rows. Note that, in such case, the algorithm object
+    cannot be pickled or copied.
+
     Attributes:
         params (BrkgaParams): The BRKGA and IPR hyper-parameters.
 
@@ -86,12 +145,24 @@ class BrkgaMpIpr:
         evolutionary_mechanism_on (bool): If false, no evolution is performed
             but only chromosome decoding. Very useful to emulate a
             multi-start algorithm.
+
+        key_storage (KeyStorage): How the keys are stored in the
+            populations.
+
+        storage_directory (str): Scratch directory for memory-mapped
+            populations, or ``None`` to keep them in memory.
+
+        convergence_tolerance (float): Maximum difference between the best
+            and the worst elite fitness for a population to be considered
+            converged (see ``CallbackEvent.ISLAND_CONVERGED``).
     """
 
     def __init__(self, decoder: object, sense: Sense, seed: int,
                  chromosome_size: int, params: BrkgaParams,
                  evolutionary_mechanism_on: bool = True,
-                 chrmosome_type: type = BaseChromosome):
+                 chrmosome_type: type = BaseChromosome,
+                 key_storage: KeyStorage = KeyStorage.FLOAT64,
+                 storage_directory: str = None):
 
         ###################
         # Initial BRKGA Hyper-parameters assignmet.
@@ -101,6 +172,9 @@ class BrkgaMpIpr:
         self.opt_sense = sense
         self.chromosome_size = chromosome_size
         self.evolutionary_mechanism_on = evolutionary_mechanism_on
+        self.key_storage = KeyStorage(key_storage)
+        self.storage_directory = storage_directory
+        self.convergence_tolerance = 0.0
 
         if evolutionary_mechanism_on:
             self.elite_size = int(params.elite_percentage *
@@ -153,14 +227,6 @@ class BrkgaMpIpr:
         elif params.num_independent_populations < 1:
             raise ValueError(f"Number of parallel populations must be larger "
                              f"than zero, current {params.num_independent_populations}")
-        # TODO (ceandrade): enable the following when IPR methods be implemented.
-        # elif params.alpha_block_size <= 0.0:
-        #     raise ValueError(f"Alpha block size must be larger than zero: "
-        #                      f"{params.alpha_block_size}")
-        # elif params.pr_percentage <= 0.0 or params.pr_percentage > 1.0:
-        #     raise ValueError(f"Percentage / path size must be in (0, 1]: "
-        #                      f"{params.pr_percentage}")
-
         elif not hasattr(decoder, "decode"):
             raise TypeError(f"The given decoder ({type(decoder)}) "
                             f"has no 'decode()' method")
@@ -185,6 +251,22 @@ class BrkgaMpIpr:
         self._ChromosomeType = chrmosome_type
         """(type BaseChromosome) This is the class/type for the chromosomes."""
 
+        self._key_codec = None
+        """(KeyCodec) Converts the keys from/to the storage format. ``None``
+           if the chromosomes are stored as they are (``FLOAT64``)."""
+
+        self._mapped_rows = None
+        """(MappedRows) Allocates the rows in memory-mapped files, if a
+           storage directory is given."""
+
+        if self.key_storage != KeyStorage.FLOAT64 or \
+           storage_directory is not None:
+            self._key_codec = KeyCodec(self.key_storage)
+
+        if storage_directory is not None:
+            self._mapped_rows = MappedRows(self._key_codec, chromosome_size,
+                                           storage_directory)
+
         self._current_populations = []
         """(List[Population]) Current populations."""
 
@@ -207,6 +289,12 @@ class BrkgaMpIpr:
         self._initial_population = False
         """Indicates if a initial population is set."""
 
+        self._initial_fitness = [
+            [] for _ in range(params.num_independent_populations)
+        ]
+        """(List[List[float]]) The known fitness values of the first
+           warm-starters of each population."""
+
         self._initialized = False
         """Indicates if the algorithm was proper initialized."""
 
@@ -216,6 +304,74 @@ class BrkgaMpIpr:
         self._pr_start_time = None
         """Holds the start time for a call of the path relink procedure."""
 
+        self._pr_distance_cache = None
+        """(EliteDistanceCache) Distances between elite chromosomes computed
+           during the pair selection of the path relink."""
+
+        self._pr_lsh_index = None
+        """(LSHIndex) Index used to find far elite chromosomes during the
+           pair selection of the path relink, if set."""
+
+        self._generations = [0] * params.num_independent_populations
+        """(List[int]) Number of generations evolved by each population."""
+
+        self._evaluation_log = None
+        """(EvaluationLog) Log of the evaluated chromosomes, if set."""
+
+        self._callbacks = {event: [] for event in CallbackEvent}
+        """(Dict[CallbackEvent, List[Callable]]) The registered callbacks."""
+
+        self._num_callbacks = 0
+        """(int) Total of registered callbacks. The events are tracked only
+           if there are callbacks."""
+
+        self._converged = [False] * params.num_independent_populations
+        """(List[bool]) Indicates the converged populations."""
+
+        self._stop_requested = False
+        """(bool) Indicates that a callback asked ``evolve()`` to stop."""
+
+        self._evaluation_stats = EvaluationStats()
+        """(EvaluationStats) Accounting of the evaluations."""
+
+        self._metrics_exporter = None
+        """(MetricsExporter) Exports the metrics periodically, if set."""
+
+        self._metrics_start_sample = None
+        """(tuple) The time, the total of generations and evaluations, and
+           the decoding time of each worker at the initialization, used to
+           compute the rates of ``get_metrics()``."""
+
+        self._metrics_sample = None
+        """(tuple) The same counters at the previous snapshot written by the
+           metrics exporter, used to compute the rates of the next one."""
+
+        self._tracer = None
+        """(TraceRecorder) Records the timeline of the optimization, if
+           set."""
+
+        self._profile = None
+        """(List[Dict[str, List]]) For each population, the accumulated wall
+           time and count of each phase of the evolution, if the profiling
+           is on (see ``set_profiling()``)."""
+
+        self._memory_profile = None
+        """(MemoryProfile) Samples of the memory after each generation, if
+           the memory sampling is on (see ``set_memory_sampling()``)."""
+
+        self._memory_tracing = False
+        """(bool) Indicates that ``tracemalloc`` was started by the memory
+           sampling, and must be stopped by it."""
+
+        self._checkpoint_log = None
+        """(dict) State of the incremental checkpoints (see ``save_state()``):
+           the checkpoint ``filename``, the ``snapshot_id``, the ``sequence``
+           of the last record, the ``fitness`` of each population as saved
+           in the last record, and the ``origins`` of the rows: for each
+           population, the row whose keys (as saved in the last record) each
+           row holds now, or ``None`` if it was rewritten since. The origins
+           are kept by ``_move_rows()`` and ``_invalidate_row()``."""
+
         # Sets the bias function.
         if params.bias_type == BiasFunctionType.LOGINVERSE:
             self.set_bias_custom_function(lambda r: 1.0 / math.log1p(r))
@@ -241,11 +397,49 @@ class BrkgaMpIpr:
             self.set_bias_custom_function(lambda _: 1.0 / params.total_parents)
             self.params.bias_type = BiasFunctionType.CONSTANT
 
+    ###########################################################################
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores a pickled object. Objects pickled by previous versions get
+        the default values of the attributes introduced since.
+        """
+        num_populations = state["params"].num_independent_populations
+        defaults = {
+            "key_storage": KeyStorage.FLOAT64,
+            "storage_directory": None,
+            "_key_codec": None,
+            "_mapped_rows": None,
+            "_pr_distance_cache": None,
+            "_pr_lsh_index": None,
+            "_initial_fitness": [[] for _ in range(num_populations)],
+            "_generations": [0] * num_populations,
+            "_evaluation_log": None,
+            "_evaluation_stats": EvaluationStats(),
+            "_metrics_exporter": None,
+            "_metrics_start_sample": None,
+            "_metrics_sample": None,
+            "_tracer": None,
+            "_profile": None,
+            "_memory_profile": None,
+            "_memory_tracing": False,
+            "_checkpoint_log": None,
+            "convergence_tolerance": 0.0,
+            "_callbacks": {event: [] for event in CallbackEvent},
+            "_num_callbacks": 0,
+            "_converged": [False] * num_populations,
+            "_stop_requested": False
+        }
+        defaults.update(state)
+        self.__dict__.update(defaults)
+
     ###########################################################################
     # Initialization methods
     ###########################################################################
 
-    def set_initial_population(self, chromosomes: List[BaseChromosome]) -> None:
+    def set_initial_population(self, chromosomes: List[BaseChromosome],
+                               fitness_values: List[float] = None,
+                               distribute: bool = False) -> None:
         """
         Sets initial individuals into the poulation to work as warm-starters.
         Such individuals can be obtained from solutions of external
@@ -253,38 +447,109 @@ class BrkgaMpIpr:
         relaxations from a mixed integer programming model that models the
         problem.
 
-        All given solutions are assigned to one population only. Therefore, the
-        maximum number of solutions is the size of the populations.
+        Besides a list of chromosomes, this method also takes a
+        two-dimensional buffer of floats, such as a NumPy array (one
+        chromosome per row), or the path of a ``.npy`` file holding such
+        array (see ``load_npy_matrix()``). In these cases, the shape is
+        validated once, and the file is memory-mapped.
+
+        By default, all given solutions are assigned to one population only.
+        Therefore, the maximum number of solutions is the size of the
+        populations. If ``distribute`` is true, the solutions are distributed
+        in a round-robin fashion over all populations.
+
+        If the fitness values of the solutions are known, they can be given
+        in ``fitness_values``, and such solutions are not decoded in
+        ``initialize()``.
 
         Args:
-            chromosomes (list of BaseChromosome): a set of individuals or
-                solutions encoded as BaseChromosomes.
+            chromosomes (list of BaseChromosome, buffer, or str): a set of
+                individuals or solutions encoded as BaseChromosomes, a
+                matrix of keys, or the path of a ``.npy`` file.
+
+            fitness_values (list of float): the fitness values of the
+                given chromosomes, if known.
+
+            distribute (bool): if true, distribute the chromosomes over all
+                populations.
 
         Raises:
             ``ValueError``: if the number of given chromosomes is larger than
-                the population size; if the sizes of the given chromosomes do
-                not match with the required chromosome size.
+                the population size (times the number of populations, if
+                distributed); if the sizes of the given chromosomes do
+                not match with the required chromosome size; if the number
+                of fitness values does not match the number of chromosomes.
+
+            ``LoadError``: if the ``.npy`` file is not valid.
         """
 
-        if len(chromosomes) > self.params.population_size:
+        if isinstance(chromosomes, (str, os.PathLike)):
+            chromosomes = load_npy_matrix(chromosomes)
+
+        matrix = None
+        if not isinstance(chromosomes, list):
+            matrix = memoryview(chromosomes)
+            if matrix.ndim != 2 or matrix.format not in ("d", "f") or \
+               not matrix.c_contiguous:
+                raise ValueError(
+                    f"Error on setting initial population: the chromosome "
+                    f"matrix must be a two-dimensional array of floats in "
+                    f"C order (actual dimensions: {matrix.ndim}, format: "
+                    f"{matrix.format})")
+            if matrix.shape[1] != self.chromosome_size:
+                raise ValueError(
+                    f"Error on setting initial population: chromosomes "
+                    f"do not have the required dimension (actual size: "
+                    f"{matrix.shape[1]}, required size: "
+                    f"{self.chromosome_size})")
+            num_chromosomes = matrix.shape[0]
+            matrix = matrix.cast("B").cast(matrix.format)
+        else:
+            num_chromosomes = len(chromosomes)
+
+        num_populations = self.params.num_independent_populations
+        max_chromosomes = self.params.population_size
+        if distribute:
+            max_chromosomes *= num_populations
+        if num_chromosomes > max_chromosomes:
             raise ValueError(
-                f"Number of given chromosomes ({len(chromosomes)}) is large "
-                f"than the population size ({self.params.population_size})"
+                f"Number of given chromosomes ({num_chromosomes}) is large "
+                f"than the population size ({max_chromosomes})"
             )
 
+        if fitness_values is not None:
+            fitness_values = [float(value) for value in fitness_values]
+            if len(fitness_values) != num_chromosomes:
+                raise ValueError(
+                    f"Number of given fitness values ({len(fitness_values)}) "
+                    f"differs from the number of chromosomes "
+                    f"({num_chromosomes})")
+
         self._current_populations = [
-            Population() for _ in range(self.params.num_independent_populations)
+            Population() for _ in range(num_populations)
         ]
+        self._initial_fitness = [[] for _ in range(num_populations)]
 
-        for i, chromosome in enumerate(chromosomes):
-            if len(chromosome) != self.chromosome_size:
-                raise ValueError(
-                    f"Error on setting initial population: chromosome {i} "
-                    f"does not have the required dimension (actual size: "
-                    f"{len(chromosome)}, required size: {self.chromosome_size})"
-                )
-            self._current_populations[0].chromosomes\
-                .append(BaseChromosome(chromosome))
+        size = self.chromosome_size
+        for i in range(num_chromosomes):
+            if matrix is not None:
+                chromosome = BaseChromosome(
+                    matrix[i * size:(i + 1) * size].tolist())
+            else:
+                chromosome = chromosomes[i]
+                if len(chromosome) != size:
+                    raise ValueError(
+                        f"Error on setting initial population: chromosome "
+                        f"{i} does not have the required dimension (actual "
+                        f"size: {len(chromosome)}, required size: {size})"
+                    )
+                chromosome = BaseChromosome(chromosome)
+
+            pop_idx = i % num_populations if distribute else 0
+            self._current_populations[pop_idx].chromosomes\
+                .append(self._to_row(chromosome))
+            if fitness_values is not None:
+                self._initial_fitness[pop_idx].append(fitness_values[i])
 
         self._initial_population = True
 
@@ -332,6 +597,206 @@ class BrkgaMpIpr:
 
     ###########################################################################
 
+    def set_path_relink_lsh_index(self, lsh_index: LSHIndex) -> None:
+        """
+        Sets a locality-sensitive hashing index to be used in the pair
+        selection of the path relink with ``RANDOMELITE``. Instead of
+        sampling random guide chromosomes, the guides are tested from the
+        probably farthest to the probably closest to the base chromosome,
+        as suggested by the index. This is useful for large chromosomes,
+        when sampled pairs are frequently too close.
+
+        .. code-block:: python
+
+            brkga = BRKGA_MP_IPR(...)
+            brkga.set_path_relink_lsh_index(
+                LSHIndex(chromosome_size, num_tables=8, bits_per_table=16))
+
+        Args:
+            lsh_index: the index, or ``None`` to sample the pairs at random.
+
+        Raises:
+            ``ValueError``: if the index was built for another chromosome
+                size.
+        """
+
+        if lsh_index is not None and \
+           lsh_index.chromosome_size != self.chromosome_size:
+            raise ValueError(f"LSH index chromosome size differs from the "
+                             f"algorithm's: {lsh_index.chromosome_size} != "
+                             f"{self.chromosome_size}")
+        self._pr_lsh_index = lsh_index
+
+    ###########################################################################
+
+    def set_evaluation_log(self, evaluation_log: EvaluationLog) -> None:
+        """
+        Sets a log to stream the chromosomes evaluated during the
+        initialization and the evolution (see ``EvaluationLog``). The
+        chromosomes decoded by other methods, such as the path relink, are
+        not logged.
+
+        Args:
+            evaluation_log: the log, or ``None`` to stop logging.
+
+        Raises:
+            ``ValueError``: if the log was built for another chromosome size.
+        """
+
+        if evaluation_log is not None and \
+           evaluation_log.chromosome_size != self.chromosome_size:
+            raise ValueError(f"Evaluation log chromosome size differs from "
+                             f"the algorithm's: "
+                             f"{evaluation_log.chromosome_size} != "
+                             f"{self.chromosome_size}")
+        self._evaluation_log = evaluation_log
+
+    ###########################################################################
+
+    def set_metrics_exporter(self, metrics_exporter: MetricsExporter) \
+            -> None:
+        """
+        Sets an exporter to write the metrics of the optimization (see
+        ``get_metrics()``) to local files, periodically, at the end of the
+        generations (see ``MetricsExporter``).
+
+        Args:
+            metrics_exporter: the exporter, or ``None`` to stop exporting.
+        """
+
+        self._metrics_exporter = metrics_exporter
+
+    ###########################################################################
+
+    def set_tracer(self, tracer: TraceRecorder) -> None:
+        """
+        Sets a recorder for the timeline of the optimization (see
+        ``TraceRecorder``). The following spans are recorded:
+
+        - in the track of each island: each generation
+          (``evolve_population()``) and its phases: ``"elite"``,
+          ``"mating"`` (the selection and crossover of all offspring),
+          ``"mutants"``, ``"decoding"``, and ``"sorting"``;
+        - in the track ``"decoder"``: each call to ``decode()`` or
+          ``decode_batch()``, with the phase and the worker (see
+          ``get_evaluation_stats()``);
+        - in the track ``"algorithm"``: each migration
+          (``exchange_elite()``), each path relink, and each pair relinked
+          by the path relink, which are recorded by the worker processes
+          when they relink the pairs.
+
+        Args:
+            tracer: the recorder, or ``None`` to stop tracing.
+        """
+
+        self._tracer = tracer
+        if tracer is not None:
+            tracer.track_names[_TRACK_ALGORITHM] = "algorithm"
+            tracer.track_names[_TRACK_DECODER] = "decoder"
+            for i in range(self.params.num_independent_populations):
+                tracer.track_names[_TRACK_ISLAND + i] = f"island {i}"
+
+    ###########################################################################
+
+    def set_profiling(self, enabled: bool) -> None:
+        """
+        Switches on/off the profiling of ``evolve_population()``. When on,
+        the wall time of each phase of the evolution is accumulated per
+        population (see ``get_profile()``). When off, the only cost is a
+        check per phase. Switching the profiling on resets the profile.
+
+        Args:
+            enabled (bool): if true, profile the evolution.
+        """
+
+        self._profile = None
+        if enabled:
+            self.reset_profile()
+
+    ###########################################################################
+
+    def set_memory_sampling(self, enabled: bool) -> None:
+        """
+        Switches on/off the sampling of the memory allocated by Python,
+        using ``tracemalloc``. When on, the memory in use and its peak are
+        sampled after each generation of ``evolve()`` (see
+        ``get_memory_profile()``). Note that ``tracemalloc`` slows down the
+        allocations, and therefore, the whole optimization. It is started
+        here if it is not tracing yet, and stopped when the sampling is
+        switched off. Since ``tracemalloc`` traces only the allocations made
+        after it starts, switch the sampling on before ``initialize()`` to
+        account the populations. Switching the sampling on resets the
+        samples. The peak of ``tracemalloc`` is reset after each generation
+        only if it was started here (see ``MemoryProfile``).
+
+        Args:
+            enabled (bool): if true, sample the memory.
+        """
+
+        if self._memory_tracing:
+            tracemalloc.stop()
+            self._memory_tracing = False
+        self._memory_profile = None
+
+        if enabled:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._memory_tracing = True
+            self._memory_profile = MemoryProfile(self._memory_tracing)
+
+    ###########################################################################
+
+    def register_callback(self, event: CallbackEvent,
+                          callback: Callable[[EventSummary], bool]) -> None:
+        """
+        Registers ``callback`` to be called on ``event`` (see
+        ``CallbackEvent``), with an ``EventSummary``. This allows monitoring
+        the optimization without breaking ``evolve()`` into single
+        generations. For instance,
+
+        .. code-block:: python
+
+            def report(summary: EventSummary) -> bool:
+                print(f"Population {summary.population_index} improved to "
+                      f"{summary.best_fitness}")
+                return summary.global_best_fitness <= target
+
+            brkga.register_callback(CallbackEvent.IMPROVEMENT, report)
+            brkga.evolve(1000)
+
+        If a callback returns ``True``, ``evolve()`` stops at the end of the
+        current generation. The callbacks are called in the registration
+        order. When no callback is registered, the events are not tracked.
+
+        Args:
+            event (CallbackEvent): the event.
+
+            callback (Callable[[EventSummary], bool]): the callback.
+        """
+
+        self._callbacks[CallbackEvent(event)].append(callback)
+        self._num_callbacks += 1
+
+    ###########################################################################
+
+    def unregister_callback(self, event: CallbackEvent,
+                            callback: Callable[[EventSummary], bool]) \
+            -> None:
+        """
+        Unregisters ``callback`` from ``event``.
+
+        Raises:
+            ``ValueError``: if ``callback`` is not registered for ``event``.
+        """
+
+        try:
+            self._callbacks[CallbackEvent(event)].remove(callback)
+        except ValueError:
+            raise ValueError(f"Callback not registered for {event}")
+        self._num_callbacks -= 1
+
+    ###########################################################################
+
     def initialize(self) -> None:
         """
         Initializes the populations and others data structures of the BRKGA.
@@ -367,10 +832,7 @@ class BrkgaMpIpr:
         pop_start = 0
         if self._current_populations and not self._reset_phase:
             population = self._current_populations[0]
-            for _ in range(len(population.chromosomes),
-                               self.params.population_size):
-                new_chr = self.generate_chromosome(self.chromosome_size)
-                population.chromosomes.append(new_chr)
+            self._complete_population(population)
 
             population.fitness = [
                 (0.0, 0) for _ in range(self.params.population_size)
@@ -382,10 +844,6 @@ class BrkgaMpIpr:
                 Population()
                 for _ in range(self.params.num_independent_populations)
             ]
-            self._previous_populations = [
-                Population()
-                for _ in range(self.params.num_independent_populations)
-            ]
         # end if
 
         # Build the remaining populations and associated data structures.
@@ -393,11 +851,7 @@ class BrkgaMpIpr:
             # If no reset, allocate memory.
             if not self._reset_phase:
                 population = self._current_populations[i]
-                for _ in range(self.params.population_size):
-                    population.chromosomes.append(
-                        self.generate_chromosome(self.chromosome_size)
-                    )
-                # end for
+                self._complete_population(population)
                 population.fitness = [
                     (0.0, 0) for _ in range(self.params.population_size)
                 ]
@@ -408,23 +862,48 @@ class BrkgaMpIpr:
         # end for
 
         # Perform initial decoding. It may take a while.
-        # NOTE (ceandrade): This loop can be / should be parallelized since
-        # each decoding is independent. Please, take a look at the C++ and
-        # Julia versions, where we use OpenMP and Julia threads for that task.
-        # In Python, due to restrictions to the Python interpreter, this may
-        # not be possible, from a pure Python implementation perspective.
-        for population in self._current_populations:
-            for i, chromosome in enumerate(population.chromosomes):
-                value = self._decoder.decode(chromosome=chromosome,
-                                             rewrite=True)
+        # NOTE (ceandrade): each decoding is independent. Therefore, we hand
+        # the whole population to the decoder, which may do it in parallel
+        # if it implements decode_batch(). The warm-starters with known
+        # fitness are not decoded.
+        phase = "reset" if self._reset_phase else "initialize"
+        for pop_idx, population in enumerate(self._current_populations):
+            known_values = []
+            if not self._reset_phase:
+                known_values = self._initial_fitness[pop_idx]
+            decode_times = None if self._evaluation_log is None else []
+            new_values = self._evaluate_rows(
+                population.chromosomes[len(known_values):], phase,
+                decode_times)
+            if known_values:
+                self._evaluation_stats.record(phase, [], len(known_values))
+            for i, value in enumerate(known_values + new_values):
                 population.fitness[i] = (value, i)
-            population.fitness.sort(reverse=(self.opt_sense == Sense.MAXIMIZE))
+            self._sort_fitness(population.fitness)
+
+            if self._evaluation_log is not None:
+                self._log_evaluations(pop_idx, population, len(known_values),
+                                      new_values, decode_times)
         # end for
 
-        # Copy the data to previous populations.
-        # **NOTE:** (ceandrade) During reset phase, copying item by item maybe
-        # faster than deepcoping (which allocates new memory).
-        self._previous_populations = copy.deepcopy(self._current_populations)
+        self._initial_fitness = [
+            [] for _ in range(self.params.num_independent_populations)
+        ]
+        self._converged = [False] * self.params.num_independent_populations
+
+        # The previous populations are just buffers for the next generation,
+        # and they are allocated in the first evolution. During the reset
+        # phase, we keep the buffers already allocated.
+        if not self._reset_phase:
+            self._previous_populations = [
+                Population()
+                for _ in range(self.params.num_independent_populations)
+            ]
+        if not self._reset_phase:
+            self._metrics_start_sample = self._take_metrics_sample()
+            self._metrics_sample = self._metrics_start_sample
+        self._pr_distance_cache = None
+        self._checkpoint_log = None
         self._initialized = True
         self._reset_phase = False
 
@@ -434,9 +913,80 @@ class BrkgaMpIpr:
 
     def exchange_elite(self, num_immigrants: int) -> None:
         """
-        :todo: to be implemented.
+        Exchanges elite-solutions between the populations. Given a population,
+        the ``num_immigrants`` best solutions are copied to the other
+        populations, replacing their worst solutions. If there is only one
+        population, nothing is done.
+
+        Args:
+            num_immigrants (positive int): number of elite chromosomes to
+                be selected from each population.
+
+        Raises:
+            ``RuntimeError``: If the algorith has been initialized before.
+
+            ``ValueError``: If the number of immigrants less than one or
+                it is larger than or equal to
+                ``ceil(population_size / (num_independent_populations - 1))``.
         """
-        raise NotImplementedError
+
+        if not self._initialized:
+            raise RuntimeError("The algorithm hasn't been initialized. "
+                               "Call 'initialize()' before "
+                               "'exchange_elite()'")
+
+        if self.params.num_independent_populations == 1:
+            return
+
+        immigrants_threshold = math.ceil(
+            self.params.population_size /
+            (self.params.num_independent_populations - 1))
+
+        if num_immigrants < 1 or num_immigrants >= immigrants_threshold:
+            raise ValueError(
+                f"Number of immigrants ({num_immigrants}) less than one, "
+                f"or larger than or equal to population size / "
+                f"num_independent_populations ({immigrants_threshold})")
+
+        if self._num_callbacks or self._tracer is not None:
+            start_time = time.perf_counter()
+
+        for i, pop_i in enumerate(self._current_populations):
+            # Population i will receive some elite members from each
+            # population j, replacing its worst individuals. Note that the
+            # populations are sorted only at the end. Therefore, the best
+            # individuals of each population are the original ones.
+            dest = self.params.population_size - 1
+            for j, pop_j in enumerate(self._current_populations):
+                if j == i:
+                    continue
+
+                for m in range(num_immigrants):
+                    value, src_idx = pop_j.fitness[m]
+                    dest_idx = pop_i.fitness[dest][1]
+                    pop_i.chromosomes[dest_idx][:] = \
+                        pop_j.chromosomes[src_idx]
+                    self._invalidate_row(i, dest_idx)
+                    pop_i.fitness[dest] = (value, dest_idx)
+                    dest -= 1
+            # end for j
+        # end for i
+
+        # Re-sort each population since they were modified.
+        maximize = self.opt_sense == Sense.MAXIMIZE
+        for population in self._current_populations:
+            population.fitness.sort(reverse=maximize)
+
+        if self._tracer is not None:
+            self._tracer.span("exchange_elite", start_time, _TRACK_ALGORITHM,
+                              "migration", {"num_immigrants": num_immigrants})
+
+        if self._num_callbacks:
+            global_best = self.get_best_fitness()
+            self._notify(EventSummary(
+                CallbackEvent.MIGRATION, None, None, global_best,
+                global_best, time.perf_counter() - start_time,
+                num_immigrants))
 
     ###########################################################################
 
@@ -471,9 +1021,191 @@ class BrkgaMpIpr:
                           population_index: int, position: int,
                           fitness: float = math.inf) -> None:
         """
-        :todo: to be implemented.
+        Injects a chromosome and its fitness into a population in the given
+        place ``position``.
+
+        If fitness is not provided (``fitness = math.inf``), the decoding is
+        performed over chromosome. Once the chromosome is injected, its
+        fitness is placed in the right rank by binary insertion, so the
+        population does not need to be fully re-sorted.
+
+        Args:
+            chromosome (BaseChromosome): the chromosome to be injected.
+
+            population_index (positive int): the population index.
+
+            position (positive int): the rank of the chromosome to be
+                replaced, ordered by fitness. The best chromosome is located
+                in position 0.
+
+            fitness (float): the fitness of the chromosome. If ``math.inf``,
+                the chromosome is decoded.
+
+        Raises:
+            ``RuntimeError``: If the algorith has been initialized before.
+
+            ``ValueError``: either if ``population_index < 0`` or
+                ``population_index >= num_independent_populations``.
+
+            ``ValueError``: either if when ``position < 0`` or
+                ``position >= population_size``.
+
+            ``ValueError``: if the chromosome size is incorrect.
         """
-        raise NotImplementedError
+
+        if not self._initialized:
+            raise RuntimeError("The algorithm hasn't been initialized. "
+                               "Call 'initialize()' before "
+                               "'inject_chromosome()'")
+
+        self._check_population_index(population_index)
+
+        if position < 0 or position >= self.params.population_size:
+            raise ValueError(
+                f"Chromosome position must be in "
+                f"[0, {self.params.population_size - 1}]: "
+                f"{position}")
+
+        if len(chromosome) != self.chromosome_size:
+            raise ValueError(
+                f"Wrong chromosome size: {len(chromosome)} != "
+                f"{self.chromosome_size}")
+
+        local_chr = self._ChromosomeType(chromosome)
+        if fitness == math.inf:
+            fitness = self._evaluate([local_chr], True, "inject")[0]
+        else:
+            self._evaluation_stats.record("inject", [], 1)
+
+        # The population changes only once the chromosome is decoded, so
+        # that it is left untouched if the decoder fails.
+        pop = self._current_populations[population_index]
+        _, idx = pop.fitness.pop(position)
+        self._store_chromosome(pop, idx, local_chr)
+        self._invalidate_row(population_index, idx)
+        self._insert_fitness(pop.fitness, (fitness, idx))
+
+    ###########################################################################
+
+    def inject_chromosomes(self, chromosomes: List[BaseChromosome],
+                           population_index: int,
+                           positions: List[int] = None,
+                           fitness: List[float] = None) -> None:
+        """
+        Injects a batch of chromosomes into a population in one call. This is
+        the bulk version of ``inject_chromosome()``, meant for streaming
+        solutions from external heuristics into the populations.
+
+        The chromosomes replace the individuals ranked at ``positions``. If
+        no positions are given, the worst ``len(chromosomes)`` individuals are
+        replaced. Chromosomes whose fitness is not given (either
+        ``fitness is None`` or ``fitness[i] == math.inf``) are decoded. Once
+        all chromosomes are in place, the new fitness values are sorted among
+        themselves and merged with the untouched individuals, which are
+        already sorted. Therefore, the cost is linear on the population size
+        plus the cost of sorting the injected chromosomes only.
+
+        Args:
+            chromosomes (list of BaseChromosome): the chromosomes to be
+                injected.
+
+            population_index (positive int): the population index.
+
+            positions (list of positive int): the ranks of the chromosomes to
+                be replaced. They must be distinct.
+
+            fitness (list of float): the fitness of each chromosome. Use
+                ``math.inf`` for the ones that must be decoded.
+
+        Raises:
+            ``RuntimeError``: If the algorith has been initialized before.
+
+            ``ValueError``: either if ``population_index < 0`` or
+                ``population_index >= num_independent_populations``.
+
+            ``ValueError``: if the number of chromosomes is larger than the
+                population size, or it does not match the number of positions
+                or fitness values.
+
+            ``ValueError``: if some position is out of range or repeated.
+
+            ``ValueError``: if some chromosome size is incorrect.
+        """
+
+        if not self._initialized:
+            raise RuntimeError("The algorithm hasn't been initialized. "
+                               "Call 'initialize()' before "
+                               "'inject_chromosomes()'")
+
+        self._check_population_index(population_index)
+
+        num_chromosomes = len(chromosomes)
+        if num_chromosomes > self.params.population_size:
+            raise ValueError(
+                f"Number of given chromosomes ({num_chromosomes}) is large "
+                f"than the population size ({self.params.population_size})")
+
+        if positions is None:
+            positions = range(self.params.population_size - num_chromosomes,
+                              self.params.population_size)
+        elif len(positions) != num_chromosomes:
+            raise ValueError(
+                f"Number of positions ({len(positions)}) does not match the "
+                f"number of chromosomes ({num_chromosomes})")
+
+        if fitness is None:
+            fitness = [math.inf] * num_chromosomes
+        elif len(fitness) != num_chromosomes:
+            raise ValueError(
+                f"Number of fitness values ({len(fitness)}) does not match "
+                f"the number of chromosomes ({num_chromosomes})")
+
+        replaced = set()
+        for position in positions:
+            if position < 0 or position >= self.params.population_size:
+                raise ValueError(
+                    f"Chromosome position must be in "
+                    f"[0, {self.params.population_size - 1}]: "
+                    f"{position}")
+            if position in replaced:
+                raise ValueError(f"Repeated chromosome position: {position}")
+            replaced.add(position)
+
+        for i, chromosome in enumerate(chromosomes):
+            if len(chromosome) != self.chromosome_size:
+                raise ValueError(
+                    f"Wrong chromosome size for chromosome {i}: "
+                    f"{len(chromosome)} != {self.chromosome_size}")
+
+        pop = self._current_populations[population_index]
+        local_chrs = [
+            self._ChromosomeType(chromosome) for chromosome in chromosomes
+        ]
+
+        to_decode = [i for i, value in enumerate(fitness) if value == math.inf]
+        fitness = list(fitness)
+        values = self._evaluate([local_chrs[i] for i in to_decode],
+                                rewrite=True, phase="inject")
+        self._evaluation_stats.record("inject", [],
+                                      num_chromosomes - len(to_decode))
+        for i, value in zip(to_decode, values):
+            fitness[i] = value
+
+        new_fitness = []
+        for local_chr, position, value in zip(local_chrs, positions, fitness):
+            idx = pop.fitness[position][1]
+            self._store_chromosome(pop, idx, local_chr)
+            self._invalidate_row(population_index, idx)
+            new_fitness.append((value, idx))
+
+        maximize = self.opt_sense == Sense.MAXIMIZE
+        new_fitness.sort(reverse=maximize)
+        kept_fitness = [
+            item for rank, item in enumerate(pop.fitness)
+            if rank not in replaced
+        ]
+        pop.fitness = list(heapq.merge(kept_fitness, new_fitness,
+                                       reverse=maximize))
 
     ###########################################################################
     # Support methods
@@ -514,15 +1246,26 @@ class BrkgaMpIpr:
             raise RuntimeError("The algorithm hasn't been initialized. Call "
                                "'initialize()' before 'get_best_chromosome()'")
 
-        best_value, idx = self._current_populations[0].fitness[0]
-        best_individual = self._current_populations[0].chromosomes[idx]
-        for i in range(1, self.params.num_independent_populations):
-            value, idx = self._current_populations[i].fitness[0]
-            if (value < best_value) == (self.opt_sense == Sense.MINIMIZE):
-                best_value = value
-                best_individual = self._current_populations[i].chromosomes[idx]
+        return self._to_chromosome(self._best_chromosome())
+
+    ###########################################################################
+
+    def get_best_chromosome_view(self) -> ReadOnlyView:
+        """
+        Returns a read-only view of the best individual found so far among
+        all populations, without copying it. The view is valid until the
+        populations change, e.g., by the next call to ``evolve()``.
+
+        Raises:
+            ``RuntimeError``: If the algorith has been initialized before.
+        """
+
+        if not self._initialized:
+            raise RuntimeError("The algorithm hasn't been initialized. Call "
+                               "'initialize()' before "
+                               "'get_best_chromosome_view()'")
 
-        return copy.deepcopy(best_individual)
+        return self._row_view(self._best_chromosome())
 
     ###########################################################################
 
@@ -550,25 +1293,329 @@ class BrkgaMpIpr:
                 ``position >= population_size``.
         """
 
+        return self._to_chromosome(self._ranked_chromosome(
+            population_index, position, "get_chromosome"))
+
+    ###########################################################################
+
+    def get_chromosome_view(self, population_index: int, position: int) \
+            -> ReadOnlyView:
+        """
+        Returns a read-only view of the chromosome ranked at ``position`` in
+        the population ``population_index``, without copying it. The view is
+        valid until the populations change, e.g., by the next call to
+        ``evolve()``.
+
+        Args:
+            population_index (positive int): the population from where
+                fetch the chromosome.
+
+            position (positive int): position the chromosome position,
+                ordered by fitness. The best chromosome is located in
+                position 0.
+
+        Raises:
+            ``RuntimeError``: If the algorith has been initialized before.
+
+            ``ValueError``: either if ``population_index < 0`` or
+                ``population_index >= num_independent_populations``.
+
+            ``ValueError``: either if when ``position < 0`` or
+                ``position >= population_size``.
+        """
+
+        return self._row_view(self._ranked_chromosome(
+            population_index, position, "get_chromosome_view"))
+
+    ###########################################################################
+
+    def get_elite_matrix(self, population_index: int = 0) -> ReadOnlyView:
+        """
+        Returns a read-only view of the elite chromosomes of population
+        ``population_index``, ordered by fitness, i.e., ``matrix[i][j]`` is
+        the ``j``-th key of the ``i``-th best chromosome. No chromosome is
+        copied, and the view is valid until the populations change, e.g.,
+        by the next call to ``evolve()``.
+
+        Args:
+            population_index (positive int): the index for the population.
+
+        Raises:
+            ``RuntimeError``: If the algorith has been initialized before.
+
+            ``ValueError``: either if ``population_index < 0`` or
+                ``population_index >= num_independent_populations``.
+        """
+
         if not self._initialized:
-            raise RuntimeError("The algorithm hasn't been initialized. Call "
-                               "'initialize()' before 'get_chromosome()'")
+            raise RuntimeError("The algorithm hasn't been initialized. "
+                               "Call 'initialize()' before "
+                               "'get_elite_matrix()'")
 
-        if population_index < 0 or \
-           population_index >= self.params.num_independent_populations:
-            raise ValueError(
-                f"Population must be in "
-                f"[0, {self.params.num_independent_populations - 1}]: "
-                f"{population_index}")
+        self._check_population_index(population_index)
 
-        if position < 0 or position >= self.params.population_size:
-            raise ValueError(
-                f"Chromosome position must be in "
-                f"[0, {self.params.population_size - 1}]: "
-                f"{position}")
+        chromosomes = self._current_populations[population_index].chromosomes
+        return ReadOnlyView(
+            self._current_populations[population_index].fitness,
+            lambda item: self._row_view(chromosomes[item[1]]),
+            self.elite_size)
 
-        pop = self._current_populations[population_index]
-        return copy.deepcopy(pop.chromosomes[pop.fitness[position][1]])
+    ###########################################################################
+
+    def get_fitness_array(self, population_index: int = 0) -> ReadOnlyView:
+        """
+        Returns a read-only view of the fitness values of population
+        ``population_index``, ordered from the best to the worst. The values
+        are not copied, and the view is valid until the populations change,
+        e.g., by the next call to ``evolve()``.
+
+        Args:
+            population_index (positive int): the index for the population.
+
+        Raises:
+            ``RuntimeError``: If the algorith has been initialized before.
+
+            ``ValueError``: either if ``population_index < 0`` or
+                ``population_index >= num_independent_populations``.
+        """
+
+        if not self._initialized:
+            raise RuntimeError("The algorithm hasn't been initialized. "
+                               "Call 'initialize()' before "
+                               "'get_fitness_array()'")
+
+        self._check_population_index(population_index)
+
+        return ReadOnlyView(
+            self._current_populations[population_index].fitness,
+            operator.itemgetter(0))
+
+    ###########################################################################
+
+    def get_profile(self) -> List[Dict[str, Tuple[float, int]]]:
+        """
+        Returns the profile of ``evolve_population()``: for each population,
+        a dictionary that maps each phase to its accumulated wall time (in
+        seconds) and the number of times it was timed. The phases are:
+
+        - ``"elite"``: keeping the elite chromosomes in the next generation
+          (once per generation);
+        - ``"selection"``: selecting the parents of an offspring (once per
+          offspring);
+        - ``"crossover"``: mating the parents of an offspring (once per
+          offspring);
+        - ``"mutants"``: generating the mutants (once per generation);
+        - ``"decoding"``: decoding the offspring and mutants (once per
+          generation);
+        - ``"sorting"``: sorting the next generation (once per generation).
+
+        Raises:
+            ``RuntimeError``: If the profiling is off.
+        """
+
+        if self._profile is None:
+            raise RuntimeError("The profiling is off. Call "
+                               "'set_profiling(True)' before 'get_profile()'")
+
+        return [
+            {phase: (entry[0], entry[1]) for phase, entry in profile.items()}
+            for profile in self._profile
+        ]
+
+    ###########################################################################
+
+    def reset_profile(self) -> None:
+        """
+        Zeros the profile of ``evolve_population()``, switching the
+        profiling on if it is off.
+        """
+
+        self._profile = [
+            {phase: [0.0, 0] for phase in PROFILE_PHASES}
+            for _ in range(self.params.num_independent_populations)
+        ]
+
+    ###########################################################################
+
+    def get_evaluation_stats(self) -> EvaluationStats:
+        """
+        Returns a copy of the accounting of the evaluations (see
+        ``EvaluationStats``): the number of evaluations per phase
+        (``initialize``, ``reset``, ``evolve``, ``inject``, and
+        ``path_relink``), the evaluations avoided because the fitness was
+        known, and the latency histograms of the decoder, including the ones
+        of the path relink worker processes. The accounting is always on.
+        """
+
+        return copy.deepcopy(self._evaluation_stats)
+
+    ###########################################################################
+
+    def reset_evaluation_stats(self) -> None:
+        """
+        Zeros the accounting of the evaluations.
+        """
+
+        self._evaluation_stats = EvaluationStats()
+
+    ###########################################################################
+
+    def get_metrics(self) -> dict:
+        """
+        Returns a snapshot of the metrics of the optimization, as a
+        dictionary that can be serialized to JSON:
+
+        - ``"timestamp"``: the Unix time of the snapshot;
+        - ``"generations"``: generations evolved by each population;
+        - ``"generations_per_second"``: mean of the generations evolved per
+          second by each population;
+        - ``"evaluations"``: evaluations per phase (see
+          ``get_evaluation_stats()``);
+        - ``"evaluations_per_second"``: evaluations per second;
+        - ``"cache_hit_rate"``: fraction of fitness values that did not
+          require an evaluation;
+        - ``"best_fitness"``: best fitness of each population;
+        - ``"diversity"``: mean standard deviation of the keys of each
+          population, computed over up to 100 chromosomes evenly spread over
+          the ranks;
+        - ``"worker_utilization"``: fraction of the time each worker spent
+          decoding;
+        - ``"decode_latency"``: count, mean, minimum, maximum, and
+          percentiles of the decoding latency (see
+          ``LatencyHistogram.summary()``).
+
+        The rates are measured since the initialization. The snapshots
+        written by the metrics exporter (see ``set_metrics_exporter()``)
+        measure them since the previous export instead. Calling this method
+        does not change either window.
+
+        Raises:
+            ``RuntimeError``: If the algorithm has not been initialized.
+        """
+
+        if not self._initialized:
+            raise RuntimeError("The algorithm hasn't been initialized. "
+                               "Call 'initialize()' before 'get_metrics()'")
+
+        return self._collect_metrics(self._metrics_start_sample)[0]
+
+    ###########################################################################
+
+    def _collect_metrics(self, previous: tuple) -> Tuple[dict, tuple]:
+        """
+        Returns the metrics (see ``get_metrics()``) with the rates measured
+        since the counters ``previous`` (see ``_take_metrics_sample()``),
+        and the current counters.
+        """
+        stats = self._evaluation_stats
+        sample = self._take_metrics_sample()
+        if previous is None:
+            previous = (sample[0], sample[1], sample[2], {})
+
+        elapsed = sample[0] - previous[0]
+        num_populations = self.params.num_independent_populations
+
+        def rate(current: float, last: float) -> float:
+            return max(current - last, 0.0) / elapsed if elapsed > 0 else 0.0
+
+        metrics = {
+            "timestamp": time.time(),
+            "generations": list(self._generations),
+            "generations_per_second":
+                rate(sample[1], previous[1]) / num_populations,
+            "evaluations": dict(stats.evaluations),
+            "evaluations_per_second": rate(sample[2], previous[2]),
+            "cache_hit_rate": stats.cache_hit_rate,
+            "best_fitness": [
+                population.fitness[0][0]
+                for population in self._current_populations
+            ],
+            "diversity": [
+                self._population_diversity(population)
+                for population in self._current_populations
+            ],
+            "worker_utilization": {
+                worker: min(rate(busy, previous[3].get(worker, 0.0)), 1.0)
+                for worker, busy in sample[3].items()
+            },
+            "decode_latency": stats.latency.summary()
+        }
+        return metrics, sample
+
+    ###########################################################################
+
+    def get_memory_report(self) -> Dict[str, int]:
+        """
+        Returns the number of bytes held by each internal structure:
+
+        - ``"current_populations"``: the chromosomes and fitness of the
+          current populations;
+        - ``"previous_populations"``: the buffer of the previous
+          generation;
+        - ``"initial_population"``: the known fitness of the warm-starters;
+        - ``"distance_cache"``: the distances between elite chromosomes
+          cached by the path relink;
+        - ``"lsh_index"``: the index of the path relink, if set;
+        - ``"evaluation_stats"``: the accounting of the evaluations;
+        - ``"evaluation_log"``: the records buffered by the evaluation log,
+          if set;
+        - ``"tracer"``: the spans kept by the tracer, if set;
+        - ``"decoder"``: the decoder and everything reachable from it;
+        - ``"total"``: the sum of the above;
+        - ``"mapped_files"``: the size of the memory-mapped files of the
+          populations (see ``storage_directory``), which are not in the
+          heap, and therefore, not in the total.
+
+        The bytes are counted by ``deep_sizeof()``. An object reachable from
+        several structures, such as an instance shared by the decoder and
+        the distance function, is counted only in the first one (in the
+        order above). Since the populations take
+        ``population_size * chromosome_size`` keys, a report of a short run
+        with small populations can be scaled to size the parameters of a
+        larger run.
+        """
+
+        seen = set()
+        structures = {
+            "current_populations": self._current_populations,
+            "previous_populations": self._previous_populations,
+            "initial_population": self._initial_fitness,
+            "distance_cache": self._pr_distance_cache,
+            "lsh_index": self._pr_lsh_index,
+            "evaluation_stats": self._evaluation_stats,
+            "evaluation_log": None if self._evaluation_log is None
+                              else self._evaluation_log._buffer,
+            "tracer": None if self._tracer is None
+                      else self._tracer._events,
+            "decoder": self._decoder
+        }
+        report = {
+            name: 0 if structure is None else deep_sizeof(structure, seen)
+            for name, structure in structures.items()
+        }
+        report["total"] = sum(report.values())
+        report["mapped_files"] = 0 if self._mapped_rows is None \
+            else self._mapped_rows.mapped_bytes
+        return report
+
+    ###########################################################################
+
+    def get_memory_profile(self) -> MemoryProfile:
+        """
+        Returns a copy of the samples of the memory taken after each
+        generation (see ``MemoryProfile``), from which the peak and the
+        steady-state memory can be read.
+
+        Raises:
+            ``RuntimeError``: If the memory sampling is off.
+        """
+
+        if self._memory_profile is None:
+            raise RuntimeError("The memory sampling is off. Call "
+                               "'set_memory_sampling(True)' before "
+                               "'get_memory_profile()'")
+
+        return copy.deepcopy(self._memory_profile)
 
     ###########################################################################
 
@@ -604,13 +1651,245 @@ class BrkgaMpIpr:
 
         return self._current_populations[population_index]
 
+    ###########################################################################
+    # Checkpoint methods
+    ###########################################################################
+
+    def save_state(self, filename: str, incremental: bool = False,
+                   snapshot_interval: int = 100) -> None:
+        """
+        Saves the state of the algorithm into ``filename``, such that the
+        optimization can be resumed by ``load_state()``. The state comprises
+        the populations (chromosomes and fitness), the state of the random
+        number generator, and the parameters. The decoder, the bias function,
+        and the path relink indices are not saved.
+
+        The file is written in a compact columnar binary format (see
+        ``brkga_mp_ipr.checkpoint``), where the keys are kept in the storage
+        format (see ``KeyStorage``). The file is replaced only after the new
+        state is completely written.
+
+        In the incremental mode, the whole state is written (a *snapshot*)
+        only in the first call and every ``snapshot_interval`` calls after
+        it (the calls ``1``, ``snapshot_interval + 1``, and so on). In the
+        other calls, only the changes since the previous call are appended to
+        the log file ``filename + ".log"``: the chromosomes that are new, the
+        chromosomes that only moved to another position (such as the elite
+        ones), the fitness entries that changed, and the state of the random
+        number generator. Note that the incremental mode is worth only if it
+        is used for the same file along the optimization, usually, once per
+        generation. Each snapshot clears the log, and so does
+        ``initialize()`` (or ``reset()``), forcing a snapshot in the next
+        call.
+
+        Args:
+            filename (str): the checkpoint file.
+
+            incremental (bool): if true, use the incremental mode.
+
+            snapshot_interval (positive int): number of calls in the
+                incremental mode between two snapshots.
+
+        Raises:
+            ``RuntimeError``: If the algorithm hasn't been initialized.
+
+            ``ValueError``: If ``snapshot_interval < 1``.
+        """
+
+        if not self._initialized:
+            raise RuntimeError("The algorithm hasn't been initialized. "
+                               "Call 'initialize()' before 'save_state()'")
+
+        if snapshot_interval < 1:
+            raise ValueError(f"Snapshot interval must be larger than zero, "
+                             f"current {snapshot_interval}")
+
+        log_filename = filename + ".log"
+        log = self._checkpoint_log
+        if incremental and log is not None and \
+           log["filename"] == filename and \
+           log["sequence"] < snapshot_interval - 1:
+            self._append_state(log)
+            return
+
+        header, columns = self._state_columns()
+        header["snapshot_id"] = uuid.uuid4().hex
+        write_checkpoint(filename, header, columns)
+
+        self._checkpoint_log = None
+        if incremental:
+            # A fresh log for the new snapshot.
+            open(log_filename, "wb").close()
+            self._checkpoint_log = {
+                "filename": filename,
+                "snapshot_id": header["snapshot_id"],
+                "sequence": 0,
+                "origins": [
+                    list(range(len(population.chromosomes)))
+                    for population in self._current_populations
+                ],
+                "fitness": [list(population.fitness)
+                            for population in self._current_populations]
+            }
+
+    ###########################################################################
+
+    @classmethod
+    def load_state(cls, filename: str, decoder: object,
+                   chrmosome_type: type = BaseChromosome,
+                   storage_directory: str = None) -> BrkgaMpIpr:
+        """
+        Builds an algorithm object from the state saved by ``save_state()``.
+        The object is ready to continue the optimization, i.e., there is no
+        need to call ``initialize()``, and no chromosome is decoded. If there
+        is a log of incremental changes (``filename + ".log"``) for the saved
+        snapshot, the changes are replayed up to the last complete one.
+
+        Since the bias function is not saved, the user must call
+        ``set_bias_custom_function()`` after loading, if the bias type is
+        ``BiasFunctionType.CUSTOM``. The same holds for the path relink
+        indices (``set_path_relink_lsh_index()``).
+
+        Args:
+            filename (str): the checkpoint file.
+
+            decoder (object): the decoder object (see ``BrkgaMpIpr``).
+
+            chrmosome_type (type): the chromosome type.
+
+            storage_directory (str): scratch directory for memory-mapped
+                populations, or ``None`` to keep them in memory.
+
+        Returns:
+            A new ``BrkgaMpIpr`` object.
+
+        Raises:
+            ``FileNotFoundError``: If ``filename`` does not exist.
+
+            ``LoadError``: If ``filename`` is not a valid checkpoint file.
+        """
+
+        header, columns = read_checkpoint(filename)
+
+        params = BrkgaParams()
+        for name, value in header["params"].items():
+            setattr(params, name, type(getattr(params, name))(value))
+
+        brkga = cls(decoder, Sense(header["sense"]), 0,
+                    header["chromosome_size"], params,
+                    header["evolutionary_mechanism_on"], chrmosome_type,
+                    KeyStorage(header["key_storage"]), storage_directory)
+
+        size = brkga.chromosome_size
+        num_populations = params.num_independent_populations
+        keys = [columns[f"keys_{i}"] for i in range(num_populations)]
+        fitness = [
+            list(zip(columns[f"fitness_{i}"].tolist(),
+                     columns[f"indices_{i}"].tolist()))
+            for i in range(num_populations)
+        ]
+        rng_state = columns["rng_state"]
+
+        # Replay the changes of the records of this snapshot, in order. The
+        # keys are updated in flat arrays, one per population.
+        log_filename = filename + ".log"
+        records = []
+        if "snapshot_id" in header and os.path.exists(log_filename):
+            records = read_checkpoint_log(log_filename)
+
+        def to_array(column) -> array:
+            data = memoryview(column)
+            result = array(data.format)
+            result.frombytes(data.cast("B"))
+            return result
+
+        sequence = 0
+        for record_header, record_columns in records:
+            if record_header["snapshot_id"] != header["snapshot_id"] or \
+               record_header["sequence"] != sequence + 1:
+                break
+            sequence += 1
+
+            for i in range(num_populations):
+                previous = to_array(keys[i]) if sequence == 1 else keys[i]
+                keys[i] = previous[:]
+
+                moves = record_columns[f"moves_{i}"]
+                for j in range(0, len(moves), 2):
+                    dst, src = moves[j] * size, moves[j + 1] * size
+                    keys[i][dst:dst + size] = previous[src:src + size]
+
+                new_keys = to_array(record_columns[f"new_keys_{i}"])
+                for j, row in enumerate(record_columns[f"new_rows_{i}"]):
+                    keys[i][row * size:(row + 1) * size] = \
+                        new_keys[j * size:(j + 1) * size]
+
+                for pos, value, idx in zip(
+                        record_columns[f"fitness_positions_{i}"],
+                        record_columns[f"fitness_values_{i}"],
+                        record_columns[f"fitness_indices_{i}"]):
+                    fitness[i][pos] = (value, idx)
+
+            header.update({
+                "rng_version": record_header["rng_version"],
+                "rng_gauss_next": record_header["rng_gauss_next"],
+                "initial_population": record_header["initial_population"],
+                "generations": record_header["generations"]
+            })
+            rng_state = record_columns["rng_state"]
+        # end for records
+
+        brkga._rng.setstate((header["rng_version"],
+                             tuple(rng_state.tolist()),
+                             header["rng_gauss_next"]))
+
+        codec = brkga._key_codec
+        for i in range(num_populations):
+            population_keys = memoryview(keys[i])
+            if codec is not None and \
+               population_keys.format != codec.typecode:
+                population_keys = memoryview(
+                    array(codec.typecode, population_keys))
+
+            population = Population()
+            if codec is None:
+                population.chromosomes = [
+                    chrmosome_type(population_keys[j:j + size].tolist())
+                    for j in range(0, len(population_keys), size)
+                ]
+            elif brkga._mapped_rows is not None:
+                population.chromosomes = \
+                    brkga._mapped_rows.new_rows(len(population_keys) // size)
+                for j, row in enumerate(population.chromosomes):
+                    row[:] = population_keys[j * size:(j + 1) * size]
+            else:
+                population.chromosomes = []
+                for j in range(0, len(population_keys), size):
+                    row = array(codec.typecode)
+                    row.frombytes(population_keys[j:j + size].cast("B"))
+                    population.chromosomes.append(row)
+
+            population.fitness = fitness[i]
+            brkga._current_populations.append(population)
+
+        # As in initialize(), the previous populations are allocated in the
+        # first evolution.
+        brkga._previous_populations = [
+            Population() for _ in range(num_populations)
+        ]
+        brkga._initial_population = header["initial_population"]
+        brkga._generations = list(header["generations"])
+        brkga._initialized = True
+        return brkga
+
     ###########################################################################
     # Optimization (evolutionary / Path-relink) methods
     ###########################################################################
 
     def evolve(self, num_generations: int = 1) -> None:
         """
-        Evolves all populations for ``generations``.
+        Evolves all populations for ``generations``. The evolution stops
+        earlier if a callback asks so (see ``register_callback()``).
 
         Args:
             num_generations (positive int): the number of generations to be
@@ -631,9 +1910,14 @@ class BrkgaMpIpr:
             raise ValueError(f"Number of generations must be large than one. "
                              f"Given {num_generations}")
 
+        self._stop_requested = False
         for _ in range(num_generations):
             for pop_idx in range(self.params.num_independent_populations):
                 self.evolve_population(pop_idx)
+            if self._memory_profile is not None:
+                self._memory_profile.sample(max(self._generations))
+            if self._stop_requested:
+                break
 
     ###########################################################################
 
@@ -674,14 +1958,43 @@ class BrkgaMpIpr:
         curr_pop = self._current_populations[population_index]
         next_pop = self._previous_populations[population_index]
 
+        # The best fitness before the evolution tells us about improvements.
+        if self._num_callbacks:
+            generation_start = time.perf_counter()
+            previous_best = self.get_best_fitness()
+
+        # NOTE: when the profiling is off, the only overhead is the check of
+        # 'profile' after each phase.
+        profile = None
+        if self._profile is not None:
+            profile = self._profile[population_index]
+            phase_start = time.perf_counter()
+
+        tracer = self._tracer
+        if tracer is not None:
+            track = _TRACK_ISLAND + population_index
+            trace_start = span_start = time.perf_counter()
+
+        # Allocate the buffer for the next generation, if not yet. All its
+        # chromosomes are overwritten below, so they are not copied from the
+        # current population.
+        if len(next_pop.chromosomes) != self.params.population_size:
+            next_pop.chromosomes = self._new_rows(self.params.population_size)
+            next_pop.fitness = list(curr_pop.fitness)
+
         # Which index we start to replace individuals.
         replace_idx = self.params.population_size - self.num_mutants
 
-        # First, we copy the elite chromosomes to the next generation.
+        # The elite chromosomes are kept in the next generation. Since they
+        # are also parents, we move them only after the mating (see below).
         for i in range(self.elite_size):
-            next_pop.chromosomes[i][:] = curr_pop.chromosomes[curr_pop.fitness[i][1]][:]
             next_pop.fitness[i] = (curr_pop.fitness[i][0], i)
 
+        if profile is not None:
+            phase_start = _add_phase_time(profile, "elite", phase_start)
+        if tracer is not None:
+            span_start = tracer.span("elite", span_start, track, "evolve")
+
         # Then, we mate/crossover 'pop_size - elite_size - num_mutants' pairs.
         for chr_idx in range(self.elite_size, replace_idx):
             # First, we shuffled the elite set and non-elite set indices,
@@ -708,6 +2021,10 @@ class BrkgaMpIpr:
             self._parents_ordered.sort(reverse=(self.opt_sense ==
                                                 Sense.MAXIMIZE))
 
+            if profile is not None:
+                phase_start = _add_phase_time(profile, "selection",
+                                              phase_start)
+
             # Performs the mate.
             for allele in range(self.chromosome_size):
                 # Roullete method.
@@ -725,25 +2042,72 @@ class BrkgaMpIpr:
                 next_pop.chromosomes[chr_idx][allele] = curr_pop\
                     .chromosomes[self._parents_ordered[parent][1]][allele]
             # end for mate.
+
+            if profile is not None:
+                phase_start = _add_phase_time(profile, "crossover",
+                                              phase_start)
         # end for crossover.
 
+        if tracer is not None:
+            span_start = tracer.span("mating", span_start, track, "evolve")
+
         # To finish, we fill up the remaining spots with mutants.
         for chr_idx in range(self.params.population_size - self.num_mutants,
                              self.params.population_size):
             self.fill_chromosome(next_pop.chromosomes[chr_idx])
 
+        if profile is not None:
+            phase_start = _add_phase_time(profile, "mutants", phase_start)
+        if tracer is not None:
+            span_start = tracer.span("mutants", span_start, track, "evolve")
+
+        # Now, we move the elite chromosomes to the next generation, instead
+        # of copying them. Their old slots in the next generation are reused
+        # by the current one, which becomes the buffer for the generation
+        # after the next.
+        for i in range(self.elite_size):
+            j = curr_pop.fitness[i][1]
+            next_pop.chromosomes[i], curr_pop.chromosomes[j] = \
+                curr_pop.chromosomes[j], next_pop.chromosomes[i]
+
+        self._move_rows(
+            population_index,
+            {curr_pop.fitness[i][1]: i for i in range(self.elite_size)})
+
+        if profile is not None:
+            phase_start = _add_phase_time(profile, "elite", phase_start, 0)
+        if tracer is not None:
+            span_start = tracer.span("elite", span_start, track, "evolve")
+
         # Perform the decoding on the offpring and mutants.
-        # NOTE (ceandrade): This loop can be / should be parallelized since
-        # each decoding is independent. Please, take a look at the C++ and
-        # Julia versions, where we use OpenMP and Julia threads for that task.
-        # In Python, due to restrictions to the Python interpreter, this may
-        # not be possible, from a pure Python implementation perspective.
-        for i in range(self.elite_size, self.params.population_size):
-            value = self._decoder.decode(chromosome=next_pop.chromosomes[i],
-                                         rewrite=True)
+        # NOTE (ceandrade): each decoding is independent. Therefore, we hand
+        # all of them to the decoder, which may do it in parallel if it
+        # implements decode_batch().
+        decode_times = None if self._evaluation_log is None else []
+        values = self._evaluate_rows(next_pop.chromosomes[self.elite_size:],
+                                     "evolve", decode_times)
+        for i, value in enumerate(values, start=self.elite_size):
             next_pop.fitness[i] = (value, i)
 
-        next_pop.fitness.sort(reverse=(self.opt_sense == Sense.MAXIMIZE))
+        if profile is not None:
+            phase_start = _add_phase_time(profile, "decoding", phase_start)
+        if tracer is not None:
+            span_start = tracer.span("decoding", span_start, track, "evolve")
+
+        # Note that the elite block is already sorted, and the sort merges it
+        # with the new individuals. We need the full order, since the
+        # non-elite ranks are used in the next mating.
+        self._sort_fitness(next_pop.fitness)
+
+        if profile is not None:
+            _add_phase_time(profile, "sorting", phase_start)
+        if tracer is not None:
+            tracer.span("sorting", span_start, track, "evolve")
+
+        self._generations[population_index] += 1
+        if self._evaluation_log is not None:
+            self._log_evaluations(population_index, next_pop,
+                                  self.elite_size, values, decode_times)
 
         # Swap populations.
         self._previous_populations[population_index], \
@@ -751,17 +2115,244 @@ class BrkgaMpIpr:
             self._current_populations[population_index], \
             self._previous_populations[population_index]
 
+        if tracer is not None:
+            tracer.span("generation", trace_start, track, "evolve",
+                        {"generation": self._generations[population_index]})
+
+        if self._num_callbacks:
+            self._notify_generation(population_index, generation_start,
+                                    previous_best)
+
+        exporter = self._metrics_exporter
+        if exporter is not None and exporter.due():
+            metrics, self._metrics_sample = \
+                self._collect_metrics(self._metrics_sample)
+            exporter.export(metrics)
+
     ###########################################################################
 
     def path_relink(self, pr_type: PathRelinkingType,
                     pr_selection: PathRelinkingSelection, dist: callable,
                     number_pairs: int, minimum_distance: float,
                     block_size: int = 1, max_time: int = 0,
-                    percentage: int = 1.0) -> PathRelinkingResult:
+                    percentage: int = 1.0,
+                    num_workers: int = 1) -> PathRelinkingResult:
         """
-        :todo: to be implemented.
+        Performs path relinking between elite solutions that are, at least, a
+        given minimum distance between themselves. In this method, the
+        local/loaded parameters are ignored in favor to the supplied ones.
+
+        In the presence of multiple populations, the path relinking is
+        performed between elite chromosomes from different populations, in a
+        circular fashion. For example, suppose we have 3 populations. The
+        framework performs 3 path relinkings: the first between individuals
+        from populations 0 and 1, the second between populations 1 and 2, and
+        the third between populations 2 and 0. In the case of just one
+        population, both base and guiding individuals are sampled from the
+        elite set of that population.
+
+        Note that the algorithm tries to find a pair of base and guiding
+        solutions with a minimum distance given by the distance function. If
+        this is not possible, a new pair of solutions are sampled and tested
+        against the distance, up to ``number_pairs`` times. In case it is not
+        possible to find such pairs for the given populations, the algorithm
+        skips to the next pair of populations. Yet, if such pairs are not
+        found in any case, the algorithm declares failure. This indicates that
+        the populations are very homogeneous.
+
+        The path relinking can be performed between all keys of the
+        chromosomes, or in blocks of ``block_size`` consecutive keys. At each
+        step, one candidate per remaining block is built, and all candidates
+        are evaluated in a single batch (see ``decode_batch()`` in the class
+        documentation). The best candidate of each step defines the next
+        solution in the path.
+
+        The pairs of the different populations are independent. Therefore,
+        they can be relinked concurrently in a pool of ``num_workers``
+        processes. In such case, the decoder and the chromosome type must be
+        picklable. The distance function is only used in the main process.
+        When ``max_time > 0``, each relinking receives its own slice of the
+        time: the remaining time is split among the rounds of pairs that run
+        one after another. For instance, in the serial case, each pair
+        receives ``max_time / number of pairs`` seconds.
+
+        Once all pairs are relinked, the best solution found in each path
+        relinking replaces the worst solution of its base population, if it
+        is better than such worst solution and it is not too close
+        (``minimum_distance``) to any elite solution of that population. The
+        solutions are merged in the order of the base populations, so the
+        result does not depend on the number of workers.
+
+        Args:
+            pr_type (PathRelinkingType): type of path relinking to be
+                performed. Either ``DIRECT`` or ``PERMUTATION``-based.
+
+            pr_selection (PathRelinkingSelection): selection of which
+                individuals use to path relinking. Either ``BESTSOLUTION`` or
+                ``RANDOMELITE``.
+
+            dist (callable): a function that computes the distance between
+                two chromosomes, i.e., ``dist(chr1, chr2) -> float``. See
+                the functors in ``brkga_mp_ipr.distances``.
+
+            number_pairs (positive int): number of chromosome pairs to be
+                tested. If 0, all pairs are tested.
+
+            minimum_distance (positive float): minimum distance between two
+                chromosomes computed by ``dist``.
+
+            block_size (positive int): number of alleles to be exchanged at
+                once in each iteration. If one, the traditional path relinking
+                is performed.
+
+            max_time (positive int): aborts path relinking when reach
+                ``max_time``, in seconds. If ``max_time <= 0``, no limit is
+                imposed.
+
+            percentage (float): define the size, in percentage, of the path
+                to build. Range [0, 1].
+
+            num_workers (positive int): number of processes used to relink
+                the pairs concurrently. If one, all pairs are relinked in
+                this process.
+
+        Returns:
+            A ``PathRelinkingResult`` depending on the relink status.
+
+        Raises:
+            ``RuntimeError``: If the algorith has been initialized before.
+
+            ``ValueError``: when ``percentage < 1e-6 or percentage > 1.0``.
+
+            ``ValueError``: when ``block_size < 1``.
         """
-        raise NotImplementedError
+
+        if not self._initialized:
+            raise RuntimeError("The algorithm hasn't been initialized. "
+                               "Call 'initialize()' before 'path_relink()'")
+
+        if percentage < 1e-6 or percentage > 1.0:
+            raise ValueError(f"Percentage/size of path relinking invalid, "
+                             f"current: {percentage}")
+
+        if block_size < 1:
+            raise ValueError(f"Block size must be larger than zero, "
+                             f"current: {block_size}")
+
+        if number_pairs < 1:
+            number_pairs = self.elite_size * self.elite_size
+
+        self._pr_start_time = time.time()
+        trace_start = time.perf_counter()
+        maximize = self.opt_sense == Sense.MAXIMIZE
+        num_populations = self.params.num_independent_populations
+
+        # First, we select the pairs of chromosomes for each pair of
+        # populations. With two populations, we perform just one path
+        # relinking.
+        jobs = []
+        for pop_base in range(1 if num_populations == 2 else num_populations):
+            pop_guide = (pop_base + 1) % num_populations
+            pair = self._select_path_relink_pair(
+                pop_base, pop_guide, pr_selection, dist, number_pairs,
+                minimum_distance)
+
+            # If the elite sets are too homogeneous, we cannot do a good path
+            # relinking. Let's try other populations.
+            if pair is not None:
+                jobs.append((pop_base,) + pair)
+        # end for
+
+        if not jobs:
+            return PathRelinkingResult.TOO_HOMOGENEOUS
+
+        # Then, we relink each pair. Each pair has its own slice of the
+        # remaining time. Pairs running concurrently share the same slice.
+        time_slice = 0
+        if max_time > 0:
+            num_workers = max(1, min(num_workers, len(jobs)))
+            num_rounds = (len(jobs) + num_workers - 1) // num_workers
+            time_slice = max(max_time - (time.time() - self._pr_start_time),
+                             1e-6) / num_rounds
+
+        initial_best = (-math.inf if maximize else math.inf, None)
+        if num_workers <= 1 or len(jobs) == 1:
+            results = []
+            for _, initial_solution, guiding_solution in jobs:
+                results.append(_path_relink_pair(
+                    self, pr_type, initial_solution, guiding_solution,
+                    initial_best, block_size, time_slice, percentage))
+        else:
+            with ProcessPoolExecutor(
+                    max_workers=num_workers,
+                    initializer=_init_path_relink_worker,
+                    initargs=(self._path_relink_worker_copy(),)) as executor:
+                futures = [
+                    executor.submit(_path_relink_worker, pr_type,
+                                    initial_solution, guiding_solution,
+                                    initial_best, block_size, time_slice,
+                                    percentage)
+                    for _, initial_solution, guiding_solution in jobs
+                ]
+                results = []
+                for future in futures:
+                    result, stats, events = future.result()
+                    self._evaluation_stats.merge(stats)
+                    if self._tracer is not None:
+                        self._tracer.add_events(events)
+                    results.append(result)
+        # end if
+
+        # Finally, we merge the solutions into the populations, always in the
+        # same order.
+        final_status = PathRelinkingResult.NO_IMPROVEMENT
+        for (pop_base, _, _), best_found in zip(jobs, results):
+            # Nothing was evaluated, probably due to the time limit.
+            if best_found[1] is None:
+                continue
+
+            # The new solution must improve the worst one of the base
+            # population, and it must not be a clone of some elite
+            # individual.
+            base_population = self._current_populations[pop_base]
+            best_value, best_chromosome = best_found
+            worst_value = base_population.fitness[-1][0]
+            if not ((best_value > worst_value) if maximize
+                    else (best_value < worst_value)):
+                continue
+
+            elite = [
+                self._row_keys(base_population.chromosomes[idx])
+                for _, idx in base_population.fitness[:self.elite_size]
+            ]
+            if hasattr(dist, "one_to_many"):
+                distances = dist.one_to_many(best_chromosome, elite)
+            else:
+                distances = (dist(best_chromosome, chromosome)
+                             for chromosome in elite)
+            if any(value < minimum_distance - 1e-6 for value in distances):
+                continue
+
+            best_overall = self.get_best_fitness()
+            worst_elite = base_population.fitness[self.elite_size - 1][0]
+
+            self.inject_chromosome(best_chromosome, pop_base,
+                                   self.params.population_size - 1,
+                                   best_value)
+
+            if (best_value > best_overall) if maximize \
+               else (best_value < best_overall):
+                final_status |= PathRelinkingResult.BEST_IMPROVEMENT
+            elif (best_value > worst_elite) if maximize \
+                 else (best_value < worst_elite):
+                final_status |= PathRelinkingResult.ELITE_IMPROVEMENT
+        # end for
+
+        if self._tracer is not None:
+            self._tracer.span("path_relink", trace_start, _TRACK_ALGORITHM,
+                              "path_relink", {"num_pairs": len(jobs),
+                                              "num_workers": num_workers})
+        return final_status
 
     ###########################################################################
     # Helper methods
@@ -776,9 +2367,15 @@ class BrkgaMpIpr:
         used instead. Please, see the documentation of both the
         ``BaseChromosome`` and the constructor for more details.
 
+        When the keys are stored in a compact format (see ``KeyStorage``),
+        the chromosome is created in such format.
+
         Args:
             chromosome_size (positive int): The size of the chromosome.
         """
+        if self._key_codec is not None:
+            return self._key_codec.random_row(self._rng, chromosome_size)
+
         return self._ChromosomeType([
             self._rng.random() for _ in range(chromosome_size)
         ])
@@ -793,29 +2390,1018 @@ class BrkgaMpIpr:
         Args:
             chromosome (BaseChromosome): The chromosome to be filled.
         """
+        if self._key_codec is not None:
+            self._key_codec.fill_row(self._rng, chromosome)
+            return
+
         for i in range(len(chromosome)):
             chromosome[i] = self._rng.random()
 
+    ###########################################################################
+    # Internal/private helper methods
+    ###########################################################################
+
+    def _evaluate(self, chromosomes: List[BaseChromosome], rewrite: bool,
+                  phase: str, decode_times: List[float] = None) \
+            -> List[float]:
+        """
+        Decodes a batch of chromosomes returning their fitness values, in the
+        same order. The evaluations and their latencies are accounted to
+        ``phase`` (see ``get_evaluation_stats()``).
+
+        If the decoder implements ``decode_batch()``, the whole batch is
+        handed to it in a single call. Otherwise, the chromosomes are decoded
+        one by one using ``decode()``.
+
+        Args:
+            chromosomes (List[BaseChromosome]): the chromosomes to be decoded.
+
+            rewrite (bool): indicates if the decoder may rewrite the
+                chromosomes.
+
+            phase (str): the phase of the algorithm (see
+                ``EVALUATION_PHASES``).
+
+            decode_times (List[float]): if given, the decoding time of each
+                chromosome is appended to it. For batches, each chromosome
+                gets an equal share of the batch time.
+        """
+        if not chromosomes:
+            return []
+
+        tracer = self._tracer
+        if tracer is not None:
+            trace_args = {"phase": phase,
+                          "worker": self._evaluation_stats.worker}
+
+        decode_batch = getattr(self._decoder, "decode_batch", None)
+        if decode_batch is not None:
+            start_time = time.perf_counter()
+            values = list(decode_batch(chromosomes=chromosomes,
+                                       rewrite=rewrite))
+            end_time = time.perf_counter()
+            elapsed = (end_time - start_time) / len(chromosomes)
+            self._evaluation_stats.record_batch(phase, len(chromosomes),
+                                                elapsed)
+            if tracer is not None:
+                trace_args["size"] = len(chromosomes)
+                tracer.span("decode_batch", start_time, _TRACK_DECODER,
+                            "decode", trace_args, end_time)
+            if decode_times is not None:
+                decode_times.extend([elapsed] * len(chromosomes))
+            return values
+
+        decode = self._decoder.decode
+        perf_counter = time.perf_counter
+        values = []
+        latencies = []
+        for chromosome in chromosomes:
+            start_time = perf_counter()
+            values.append(decode(chromosome=chromosome, rewrite=rewrite))
+            latencies.append(perf_counter() - start_time)
+            if tracer is not None:
+                tracer.span("decode", start_time, _TRACK_DECODER, "decode",
+                            trace_args, start_time + latencies[-1])
+
+        self._evaluation_stats.record(phase, latencies)
+        if decode_times is not None:
+            decode_times.extend(latencies)
+        return values
+
+    ###########################################################################
+
+    def _best_chromosome(self) -> BaseChromosome:
+        """
+        Returns a reference to the best individual among all populations.
+        """
+
+        best_value, idx = self._current_populations[0].fitness[0]
+        best_individual = self._current_populations[0].chromosomes[idx]
+        for i in range(1, self.params.num_independent_populations):
+            value, idx = self._current_populations[i].fitness[0]
+            if (value < best_value) == (self.opt_sense == Sense.MINIMIZE):
+                best_value = value
+                best_individual = self._current_populations[i].chromosomes[idx]
+        return best_individual
+
+    ###########################################################################
+
+    def _ranked_chromosome(self, population_index: int, position: int,
+                           caller: str) -> BaseChromosome:
+        """
+        Returns a reference to the chromosome ranked at ``position`` in the
+        population ``population_index``, checking the arguments on behalf of
+        the method ``caller``.
+        """
+
+        if not self._initialized:
+            raise RuntimeError(f"The algorithm hasn't been initialized. Call "
+                               f"'initialize()' before '{caller}()'")
+
+        self._check_population_index(population_index)
+
+        if position < 0 or position >= self.params.population_size:
+            raise ValueError(
+                f"Chromosome position must be in "
+                f"[0, {self.params.population_size - 1}]: "
+                f"{position}")
+
+        pop = self._current_populations[population_index]
+        return pop.chromosomes[pop.fitness[position][1]]
+
+    ###########################################################################
+
+    def _evaluate_rows(self, rows: list, phase: str,
+                       decode_times: List[float] = None) -> List[float]:
+        """
+        Decodes a batch of stored chromosomes (rows), with rewriting, and
+        returns their fitness values. If the keys are stored in a compact
+        format, the rows are converted to chromosomes to be decoded, and the
+        rewritten keys are converted back. See ``_evaluate()`` for
+        ``phase`` and ``decode_times``.
+        """
+        if self._key_codec is None:
+            return self._evaluate(rows, rewrite=True, phase=phase,
+                                  decode_times=decode_times)
+
+        # Memory-mapped rows are decoded in chunks, so that the chromosomes
+        # of a single chunk are in memory at once.
+        chunk_size = len(rows)
+        if self._mapped_rows is not None:
+            chunk_size = self._mapped_rows.rows_per_chunk
+
+        values = []
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            chromosomes = [
+                self._ChromosomeType(self._key_codec.to_keys(row))
+                for row in chunk
+            ]
+            values.extend(self._evaluate(chromosomes, rewrite=True,
+                                         phase=phase,
+                                         decode_times=decode_times))
+            for row, chromosome in zip(chunk, chromosomes):
+                row[:] = self._key_codec.from_keys(chromosome)
+        return values
+
+    ###########################################################################
+
+    def _notify(self, summary: EventSummary) -> None:
+        """
+        Calls the callbacks of ``summary.event``.
+        """
+        for callback in self._callbacks[summary.event]:
+            if callback(summary) is True:
+                self._stop_requested = True
+
+    ###########################################################################
+
+    def _notify_generation(self, population_index: int,
+                           generation_start: float,
+                           previous_best: float) -> None:
+        """
+        Triggers the events of the generation just evolved by population
+        ``population_index``, which started at ``generation_start``, when
+        the best fitness of all populations was ``previous_best``.
+        """
+        elapsed_time = time.perf_counter() - generation_start
+        fitness = self._current_populations[population_index].fitness
+        best = fitness[0][0]
+        global_best = self.get_best_fitness()
+
+        def summary(event: CallbackEvent) -> EventSummary:
+            return EventSummary(event, population_index,
+                                self._generations[population_index], best,
+                                global_best, elapsed_time)
+
+        self._notify(summary(CallbackEvent.GENERATION_END))
+
+        if (best > previous_best) if self.opt_sense == Sense.MAXIMIZE \
+                else (best < previous_best):
+            self._notify(summary(CallbackEvent.IMPROVEMENT))
+
+        converged = abs(best - fitness[self.elite_size - 1][0]) <= \
+            self.convergence_tolerance
+        if converged and not self._converged[population_index]:
+            self._notify(summary(CallbackEvent.ISLAND_CONVERGED))
+        self._converged[population_index] = converged
+
+    ###########################################################################
+
+    def _log_evaluations(self, population_index: int,
+                         population: Population, start: int,
+                         values: List[float],
+                         decode_times: List[float]) -> None:
+        """
+        Logs the rows of ``population`` from position ``start`` on, which
+        were just evaluated, into the evaluation log. The population must be
+        sorted already, so that we know which rows entered the elite set.
+        """
+        elite = {idx for _, idx in population.fitness[:self.elite_size]}
+        self._evaluation_log.log(
+            population_index, self._generations[population_index],
+            [self._row_keys(row) for row in population.chromosomes[start:]],
+            values, decode_times,
+            [idx in elite for idx in range(start, start + len(values))])
+
+    ###########################################################################
+
+    def _new_rows(self, count: int) -> list:
+        """
+        Returns ``count`` new rows in the storage format, with zeroed keys.
+        """
+        if self._mapped_rows is not None:
+            return self._mapped_rows.new_rows(count)
+        if self._key_codec is not None:
+            return [self._key_codec.new_row(self.chromosome_size)
+                    for _ in range(count)]
+        return [self._ChromosomeType([0.0] * self.chromosome_size)
+                for _ in range(count)]
+
+    ###########################################################################
+
+    def _complete_population(self, population: Population) -> None:
+        """
+        Completes ``population`` with random chromosomes up to the population
+        size. For memory-mapped storage, the existing chromosomes are moved to
+        the same mapped file.
+        """
+        if self._mapped_rows is None:
+            for _ in range(len(population.chromosomes),
+                           self.params.population_size):
+                population.chromosomes.append(
+                    self.generate_chromosome(self.chromosome_size))
+            return
+
+        rows = self._mapped_rows.new_rows(self.params.population_size)
+        for row, chromosome in zip(rows, population.chromosomes):
+            row[:] = chromosome
+        for row in rows[len(population.chromosomes):]:
+            self.fill_chromosome(row)
+        population.chromosomes = rows
+
+    ###########################################################################
+
+    def _invalidate_row(self, population_index: int, idx: int) -> None:
+        """
+        Tells that the ``idx``-th row of population ``population_index`` was
+        rewritten: its cached distances are discarded, and it is saved
+        again by the next incremental checkpoint.
+        """
+        if self._pr_distance_cache is not None:
+            self._pr_distance_cache.invalidate((population_index, idx))
+        if self._checkpoint_log is not None:
+            self._checkpoint_log["origins"][population_index][idx] = None
+
+    ###########################################################################
+
+    def _move_rows(self, population_index: int, moves: Dict[int, int]) \
+            -> None:
+        """
+        Tells that, after a generation of population ``population_index``,
+        the chromosome of row ``i`` is in row ``moves[i]``, and all other
+        rows were rewritten (see ``_invalidate_row()``).
+        """
+        if self._pr_distance_cache is not None:
+            self._pr_distance_cache.move_rows(population_index, moves)
+        log = self._checkpoint_log
+        if log is not None:
+            old_origins = log["origins"][population_index]
+            origins = [None] * len(old_origins)
+            for src, dst in moves.items():
+                origins[dst] = old_origins[src]
+            log["origins"][population_index] = origins
+
+    ###########################################################################
+
+    def _store_chromosome(self, population: Population, idx: int,
+                          chromosome: BaseChromosome) -> None:
+        """
+        Stores ``chromosome`` as the ``idx``-th row of ``population``. In
+        compact formats, the keys are written into the existing row.
+        """
+        if self._key_codec is None:
+            population.chromosomes[idx] = chromosome
+        else:
+            population.chromosomes[idx][:] = \
+                self._key_codec.from_keys(chromosome)
+
+    ###########################################################################
+
+    def _to_row(self, chromosome: BaseChromosome) -> BaseChromosome:
+        """
+        Converts ``chromosome`` to the storage format. Without a compact
+        format, the chromosome itself is returned.
+        """
+        if self._key_codec is None:
+            return chromosome
+        return self._key_codec.from_keys(chromosome)
+
+    ###########################################################################
+
+    def _to_chromosome(self, row: BaseChromosome) -> BaseChromosome:
+        """
+        Returns a new chromosome with the keys of the stored ``row``.
+        """
+        if self._key_codec is None:
+            return copy_chromosome(row)
+        return self._ChromosomeType(self._key_codec.to_keys(row))
+
+    ###########################################################################
+
+    def _take_metrics_sample(self) -> tuple:
+        """
+        Returns the counters used to compute the rates of the metrics (see
+        ``_metrics_start_sample``).
+        """
+        stats = self._evaluation_stats
+        return (time.monotonic(), sum(self._generations),
+                stats.total_evaluations,
+                {worker: histogram.total
+                 for worker, histogram in stats.worker_latency.items()})
+
+    ###########################################################################
+
+    def _population_diversity(self, population: Population,
+                              max_chromosomes: int = 100) -> float:
+        """
+        Returns the mean standard deviation of the keys of ``population``,
+        using up to ``max_chromosomes`` chromosomes evenly spread over the
+        ranks. Populations of uniformly random keys have diversity close to
+        0.29, and converged populations have diversity close to zero.
+        """
+        step = max(1, math.ceil(len(population.fitness) / max_chromosomes))
+        rows = [
+            self._row_keys(population.chromosomes[idx])
+            for _, idx in population.fitness[::step]
+        ]
+        num_rows = len(rows)
+        if num_rows < 2:
+            return 0.0
+
+        total = 0.0
+        for keys in zip(*rows):
+            mean = sum(keys) / num_rows
+            variance = sum(key * key for key in keys) / num_rows - mean * mean
+            total += math.sqrt(max(variance, 0.0))
+        return total / self.chromosome_size
+
+    ###########################################################################
+
+    def _row_keys(self, row: BaseChromosome) -> BaseChromosome:
+        """
+        Returns the keys of the stored ``row`` as a sequence of floats,
+        copying them only if they are stored as fixed-point integers.
+        """
+        if self._key_codec is None or not self._key_codec.fixed_point:
+            return row
+        return self._key_codec.to_keys(row)
+
+    ###########################################################################
+
+    def _row_view(self, row: BaseChromosome) -> ReadOnlyView:
+        """
+        Returns a read-only view of the keys of the stored ``row``.
+        """
+        if self._key_codec is None or not self._key_codec.fixed_point:
+            return ReadOnlyView(row)
+        return ReadOnlyView(row, self._key_codec.to_key)
+
+    ###########################################################################
+
+    def _state_columns(self) -> tuple:
+        """
+        Returns the header and the columns of a snapshot of the state (see
+        ``save_state()``).
+        """
+        typecode = "d"
+        if self._key_codec is not None:
+            typecode = self._key_codec.typecode
+
+        columns = {}
+        for i, population in enumerate(self._current_populations):
+            keys = array(typecode)
+            for row in population.chromosomes:
+                keys.frombytes(self._row_bytes(row))
+            columns[f"keys_{i}"] = keys
+            columns[f"fitness_{i}"] = \
+                array("d", [value for value, _ in population.fitness])
+            columns[f"indices_{i}"] = \
+                array("q", [idx for _, idx in population.fitness])
+
+        version, internal_state, gauss_next = self._rng.getstate()
+        columns["rng_state"] = array("Q", internal_state)
+
+        header = {
+            "sense": str(self.opt_sense),
+            "chromosome_size": self.chromosome_size,
+            "evolutionary_mechanism_on": self.evolutionary_mechanism_on,
+            "key_storage": str(self.key_storage),
+            "params": {
+                name: str(value) if isinstance(value, ParsingEnum) else value
+                for name, value in vars(self.params).items()
+            },
+            "rng_version": version,
+            "rng_gauss_next": gauss_next,
+            "initial_population": self._initial_population,
+            "generations": self._generations
+        }
+        return header, columns
+
+    ###########################################################################
+
+    def _append_state(self, log: dict) -> None:
+        """
+        Appends the changes since the last call of ``save_state()`` to the
+        log of incremental changes, and updates ``log`` (see
+        ``self._checkpoint_log``).
+        """
+        typecode = "d"
+        if self._key_codec is not None:
+            typecode = self._key_codec.typecode
+
+        columns = {}
+        for i, population in enumerate(self._current_populations):
+            moves = array("q")
+            new_rows = array("q")
+            new_keys = array(typecode)
+            for j, origin in enumerate(log["origins"][i]):
+                if origin == j:
+                    continue
+                if origin is None:
+                    new_rows.append(j)
+                    new_keys.frombytes(
+                        self._row_bytes(population.chromosomes[j]))
+                else:
+                    moves.extend((j, origin))
+
+            old_fitness = log["fitness"][i]
+            positions = [
+                j for j, item in enumerate(population.fitness)
+                if item != old_fitness[j]
+            ]
+
+            columns[f"moves_{i}"] = moves
+            columns[f"new_rows_{i}"] = new_rows
+            columns[f"new_keys_{i}"] = new_keys
+            columns[f"fitness_positions_{i}"] = array("q", positions)
+            columns[f"fitness_values_{i}"] = array(
+                "d", [population.fitness[j][0] for j in positions])
+            columns[f"fitness_indices_{i}"] = array(
+                "q", [population.fitness[j][1] for j in positions])
+
+            log["origins"][i] = list(range(len(population.chromosomes)))
+            log["fitness"][i] = list(population.fitness)
+
+        version, internal_state, gauss_next = self._rng.getstate()
+        columns["rng_state"] = array("Q", internal_state)
+
+        log["sequence"] += 1
+        header = {
+            "snapshot_id": log["snapshot_id"],
+            "sequence": log["sequence"],
+            "rng_version": version,
+            "rng_gauss_next": gauss_next,
+            "initial_population": self._initial_population,
+            "generations": self._generations
+        }
+        append_checkpoint(log["filename"] + ".log", header, columns)
+
+    ###########################################################################
+
+    def _row_bytes(self, row: BaseChromosome) -> memoryview:
+        """
+        Returns the raw bytes of the stored ``row``, as kept in checkpoints.
+        """
+        if self._key_codec is None:
+            return memoryview(array("d", row)).cast("B")
+        return memoryview(row).cast("B")
+
+    ###########################################################################
+
+    def _check_population_index(self, population_index: int) -> None:
+        """
+        Checks whether ``population_index`` is a valid population index.
+
+        Raises:
+            ``ValueError``: either if ``population_index < 0`` or
+                ``population_index >= num_independent_populations``.
+        """
+        if population_index < 0 or \
+           population_index >= self.params.num_independent_populations:
+            raise ValueError(
+                f"Population must be in "
+                f"[0, {self.params.num_independent_populations - 1}]: "
+                f"{population_index}")
+
+    ###########################################################################
+
+    def _sort_fitness(self, fitness: list) -> None:
+        """
+        Sorts ``fitness`` according to the optimization sense. The resulting
+        order is the same as sorting the pairs themselves, i.e., ties are
+        broken by the chromosome indices.
+
+        Instead of comparing tuples, which is slow, we compare only the
+        values. Since the sort is stable, we just need the list in the
+        order of the indices that breaks the ties.
+
+        Args:
+            fitness (List[Tuple[float, int]]): the pairs such that
+                ``fitness[i] = (value, i)``, i.e., in the index order.
+        """
+        if self.opt_sense == Sense.MAXIMIZE:
+            fitness.reverse()
+            fitness.sort(key=operator.itemgetter(0), reverse=True)
+        else:
+            fitness.sort(key=operator.itemgetter(0))
+
+    ###########################################################################
+
+    def _insert_fitness(self, fitness: list, item: tuple) -> None:
+        """
+        Inserts the pair ``item = (fitness value, chromosome index)`` into
+        the sorted ``fitness`` list using binary search. The resulting order
+        is the same as the one produced by sorting the whole list.
+
+        Args:
+            fitness (List[Tuple[float, int]]): a list sorted according to the
+                optimization sense.
+
+            item (Tuple[float, int]): the pair to be inserted.
+        """
+        if self.opt_sense == Sense.MINIMIZE:
+            bisect.insort(fitness, item)
+            return
+
+        low, high = 0, len(fitness)
+        while low < high:
+            middle = (low + high) // 2
+            if item > fitness[middle]:
+                high = middle
+            else:
+                low = middle + 1
+        fitness.insert(low, item)
+
     ###########################################################################
     # Core internal/private path-relink methods
     ###########################################################################
 
+    def _select_path_relink_pair(
+            self, pop_base: int, pop_guide: int,
+            pr_selection: PathRelinkingSelection, dist: callable,
+            number_pairs: int, minimum_distance: float) -> tuple:
+        """
+        Selects a pair of elite chromosomes, from populations ``pop_base`` and
+        ``pop_guide``, that are at least ``minimum_distance`` apart.
+
+        Returns:
+            A tuple with copies of the initial and guiding chromosomes, or
+            ``None`` if no such pair is found in ``number_pairs`` trials.
+        """
+
+        base_population = self._current_populations[pop_base]
+        guide_population = self._current_populations[pop_guide]
+
+        # The distances between elites are kept among calls, since the elite
+        # sets change slowly. The rows written since the previous call are
+        # invalidated where they are written (see '_invalidate_row()').
+        if self._pr_distance_cache is None or \
+           self._pr_distance_cache.dist is not dist:
+            self._pr_distance_cache = EliteDistanceCache(dist)
+        cache = self._pr_distance_cache
+
+        def elite(population: Population, pos: int) -> BaseChromosome:
+            return self._row_keys(
+                population.chromosomes[population.fitness[pos][1]])
+
+        def is_far(pos1: int, pos2: int) -> bool:
+            distance = cache.distance(
+                (pop_base, base_population.fitness[pos1][1]),
+                elite(base_population, pos1),
+                (pop_guide, guide_population.fitness[pos2][1]),
+                elite(guide_population, pos2))
+            return distance >= minimum_distance - 1e-6
+
+        if pr_selection == PathRelinkingSelection.BESTSOLUTION:
+            pos1 = 0
+            pos2 = 1 if pop_base == pop_guide else 0
+            if not is_far(pos1, pos2):
+                return None
+
+        elif self._pr_lsh_index is not None:
+            # The index suggests the guides probably far from the base
+            # chromosome, which are tested first. Each candidate guide is a
+            # trial, including the base chromosome itself, which is skipped
+            # (as in the random selection below). Otherwise, we would never
+            # stop when the base chromosome is the only candidate.
+            guides = [elite(guide_population, pos)
+                      for pos in range(self.elite_size)]
+            trials = 0
+            pos1 = pos2 = None
+            while trials < number_pairs and pos2 is None:
+                pos1 = self._rng.randrange(self.elite_size)
+                order = self._pr_lsh_index.farthest_first(
+                    elite(base_population, pos1), guides)
+                for pos in order:
+                    trials += 1
+                    if not (pop_base == pop_guide and pos == pos1) and \
+                       is_far(pos1, pos):
+                        pos2 = pos
+                        break
+                    if trials == number_pairs:
+                        break
+                # end for
+            # end while
+            if pos2 is None:
+                return None
+
+        else:
+            for _ in range(number_pairs):
+                pos1 = self._rng.randrange(self.elite_size)
+                pos2 = self._rng.randrange(self.elite_size)
+                if pop_base == pop_guide and pos1 == pos2:
+                    continue
+                if is_far(pos1, pos2):
+                    break
+            else:
+                return None
+        # end if
+
+        return (self._ChromosomeType(elite(base_population, pos1)),
+                self._ChromosomeType(elite(guide_population, pos2)))
+
+    ###########################################################################
+
+    def _path_relink_worker_copy(self) -> BrkgaMpIpr:
+        """
+        Returns a shallow copy of this object without the populations and the
+        bias function, which is enough to perform path relinking in a worker
+        process and cheap to be sent to it.
+        """
+        worker_copy = copy.copy(self)
+        worker_copy._current_populations = []
+        worker_copy._previous_populations = []
+        worker_copy._bias_function = None
+        worker_copy._initial_fitness = [
+            [] for _ in range(self.params.num_independent_populations)
+        ]
+        worker_copy._pr_distance_cache = None
+        worker_copy._pr_lsh_index = None
+        worker_copy._mapped_rows = None
+        worker_copy._evaluation_log = None
+        worker_copy._evaluation_stats = None
+        worker_copy._metrics_exporter = None
+        worker_copy._memory_profile = None
+        worker_copy._memory_tracing = False
+        worker_copy._profile = None
+        worker_copy._checkpoint_log = None
+        if self._tracer is not None:
+            worker_copy._tracer = TraceRecorder(self._tracer.max_events)
+        worker_copy._callbacks = {event: [] for event in CallbackEvent}
+        worker_copy._num_callbacks = 0
+        return worker_copy
+
+    ###########################################################################
+    ###########################################################################
+
     def _direct_path_relink(
             self, chr1: BaseChromosome, chr2: BaseChromosome, dist: callable,
             best_found: tuple, block_size: int, max_time: int,
-            percentage: float) -> None:
+            percentage: float) -> tuple:
         """
-        :todo: to be implemented.
+        Performs the direct path relinking, changing each block of keys of
+        the base chromosome for the correspondent one in the guide
+        chromosome.
+
+        At each step, one candidate per remaining block is built by copying
+        that block from the guide chromosome, and all candidates are
+        evaluated in a single batch. The best candidate becomes the next
+        solution in the path. Then, base and guide chromosomes are swapped,
+        so that the path is built from both ends. Blocks where both
+        chromosomes already have the same keys are not evaluated.
+
+        The time limit and the path size are checked between batches.
+
+        Args:
+            chr1 (BaseChromosome): first chromosome. It is modified.
+
+            chr2 (BaseChromosome): second chromosome. It is modified.
+
+            dist (callable): distance function. Not used in this method.
+
+            best_found (Tuple[float, BaseChromosome]): the best solution found
+                so far.
+
+            block_size (positive int): number of alleles to be exchanged at
+                once in each iteration.
+
+            max_time (positive int): aborts path relinking when reach
+                ``max_time``, in seconds, counted from the start of the
+                current ``path_relink()`` call. If ``max_time <= 0``, no limit
+                is imposed.
+
+            percentage (float): define the size, in percentage, of the path
+                to build.
+
+        Returns:
+            A tuple ``(fitness, chromosome)`` with the best solution found,
+            which may be ``best_found`` itself if no improvement was found.
         """
-        raise NotImplementedError
+
+        maximize = self.opt_sense == Sense.MAXIMIZE
+        if self._pr_start_time is None:
+            self._pr_start_time = time.time()
+
+        num_blocks = (len(chr1) + block_size - 1) // block_size
+        path_size = int(percentage * num_blocks)
+
+        base = chr1
+        guide = chr2
+        remaining_blocks = list(range(num_blocks))
+        iterations = 0
+
+        while remaining_blocks:
+            # Blocks that do not change the base are discarded.
+            remaining_blocks = [
+                block for block in remaining_blocks
+                if base[block * block_size:(block + 1) * block_size] !=
+                guide[block * block_size:(block + 1) * block_size]
+            ]
+            if not remaining_blocks:
+                break
+
+            # Build one candidate for each remaining block.
+            candidates = []
+            for block in remaining_blocks:
+                begin = block * block_size
+                end = begin + block_size
+                candidate = self._ChromosomeType(base)
+                candidate[begin:end] = guide[begin:end]
+                candidates.append(candidate)
+
+            values = self._evaluate(candidates, rewrite=False,
+                                    phase="path_relink")
+
+            # Locate the best candidate.
+            best_index = 0
+            best_value = values[0]
+            for i, value in enumerate(values[1:], start=1):
+                if (value > best_value) if maximize else (value < best_value):
+                    best_index = i
+                    best_value = value
+
+            # Hold it, if it is the best found until now.
+            if (best_value > best_found[0]) if maximize \
+               else (best_value < best_found[0]):
+                best_found = (best_value, candidates[best_index])
+
+            # Commit the best move in the base, and walk from the other end.
+            block = remaining_blocks.pop(best_index)
+            begin = block * block_size
+            end = begin + block_size
+            base[begin:end] = guide[begin:end]
+            base, guide = guide, base
+
+            iterations += 1
+            if iterations >= path_size or \
+               (max_time > 0 and
+                time.time() - self._pr_start_time > max_time):
+                break
+        # end while
+
+        return best_found
 
     ###########################################################################
 
     def _permutation_based_path_relink(
             self, chr1: BaseChromosome, chr2: BaseChromosome, dist: callable,
             best_found: tuple, block_size: int, max_time: int,
-            percentage: float) -> None:
+            percentage: float) -> tuple:
         """
-        :todo: to be implemented.
+        Performs the permutation-based path relinking. In this method, the
+        permutation induced by the keys in the guide solution is used to
+        change the order of the keys in the permutation induced by the base
+        solution.
+
+        At each step, for each rank ``r`` whose key is in different positions
+        in the base and guide chromosomes, a candidate is built by swapping
+        the key of rank ``r`` in the base to the position it occupies in the
+        guide. The best candidate becomes the next solution in the path.
+        Then, base and guide chromosomes are swapped, so that the path is
+        built from both ends. If the decoder implements ``decode_batch()``,
+        the candidates are copies of the base evaluated in a single batch.
+        Otherwise, each swap is applied to the base itself, evaluated, and
+        undone, so no chromosome is copied but the best ones.
+
+        The permutations are computed only once. Then, the rank of each key
+        and the position of each rank are updated incrementally when a swap
+        is committed. Therefore, finding each move costs O(1) instead of
+        re-sorting the chromosomes at each step.
+
+        The time limit and the path size are checked between batches.
+
+        Args:
+            chr1 (BaseChromosome): first chromosome. It is modified.
+
+            chr2 (BaseChromosome): second chromosome. It is modified.
+
+            dist (callable): distance function. Not used in this method.
+
+            best_found (Tuple[float, BaseChromosome]): the best solution found
+                so far.
+
+            block_size (positive int): not used in this method.
+
+            max_time (positive int): aborts path relinking when reach
+                ``max_time``, in seconds, counted from the start of the
+                current ``path_relink()`` call. If ``max_time <= 0``, no limit
+                is imposed.
+
+            percentage (float): define the size, in percentage, of the path
+                to build.
+
+        Returns:
+            A tuple ``(fitness, chromosome)`` with the best solution found,
+            which may be ``best_found`` itself if no improvement was found.
         """
-        raise NotImplementedError
+
+        maximize = self.opt_sense == Sense.MAXIMIZE
+        if self._pr_start_time is None:
+            self._pr_start_time = time.time()
+
+        size = len(chr1)
+        path_size = int(percentage * size)
+
+        # For each chromosome, rank_position[r] holds the position of the
+        # r-th smallest key, and position_rank[p] the rank of the key at
+        # position p.
+        def rank_index(chromosome: BaseChromosome) -> tuple:
+            rank_position = sorted(range(size), key=chromosome.__getitem__)
+            position_rank = [0] * size
+            for rank, position in enumerate(rank_position):
+                position_rank[position] = rank
+            return (rank_position, position_rank)
+
+        # Without decode_batch(), the candidates are decoded one by one, so
+        # they do not need to be copied.
+        batch = hasattr(self._decoder, "decode_batch")
+
+        base = chr1
+        guide = chr2
+        base_ranks = rank_index(base)
+        guide_ranks = rank_index(guide)
+        remaining_ranks = list(range(size))
+        iterations = 0
+
+        while remaining_ranks:
+            base_rank_position, base_position_rank = base_ranks
+            guide_rank_position = guide_ranks[0]
+
+            # Ranks already in the same position are discarded.
+            remaining_ranks = [
+                rank for rank in remaining_ranks
+                if base_rank_position[rank] != guide_rank_position[rank]
+            ]
+            if not remaining_ranks:
+                break
+
+            swaps = [(base_rank_position[rank], guide_rank_position[rank])
+                     for rank in remaining_ranks]
+
+            if batch:
+                # The decoder takes all candidates at once, so each one
+                # must be a chromosome of its own.
+                candidates = []
+                for pos_base, pos_guide in swaps:
+                    candidate = self._ChromosomeType(base)
+                    candidate[pos_base], candidate[pos_guide] = \
+                        candidate[pos_guide], candidate[pos_base]
+                    candidates.append(candidate)
+                values = self._evaluate(candidates, rewrite=False,
+                                        phase="path_relink")
+            else:
+                # Each swap is applied to the base, evaluated, and undone.
+                values = []
+                for pos_base, pos_guide in swaps:
+                    base[pos_base], base[pos_guide] = \
+                        base[pos_guide], base[pos_base]
+                    values.extend(self._evaluate([base], rewrite=False,
+                                                 phase="path_relink"))
+                    base[pos_base], base[pos_guide] = \
+                        base[pos_guide], base[pos_base]
+
+            # Locate the best candidate.
+            best_index = 0
+            best_value = values[0]
+            for i, value in enumerate(values[1:], start=1):
+                if (value > best_value) if maximize else (value < best_value):
+                    best_index = i
+                    best_value = value
+
+            # Commit the best swap in the base, updating the rank index.
+            rank = remaining_ranks.pop(best_index)
+            pos_base, pos_guide = swaps[best_index]
+            other_rank = base_position_rank[pos_guide]
+
+            base[pos_base], base[pos_guide] = base[pos_guide], base[pos_base]
+
+            # Hold it, if it is the best found until now.
+            if (best_value > best_found[0]) if maximize \
+               else (best_value < best_found[0]):
+                best_found = (best_value, self._ChromosomeType(base))
+
+            base_rank_position[rank] = pos_guide
+            base_rank_position[other_rank] = pos_base
+            base_position_rank[pos_guide] = rank
+            base_position_rank[pos_base] = other_rank
+
+            # Walk from the other end.
+            base, guide = guide, base
+            base_ranks, guide_ranks = guide_ranks, base_ranks
+
+            iterations += 1
+            if iterations >= path_size or \
+               (max_time > 0 and
+                time.time() - self._pr_start_time > max_time):
+                break
+        # end while
+
+        return best_found
+
+###############################################################################
+# Path relink workers
+###############################################################################
+
+def _path_relink_pair(brkga: BrkgaMpIpr, pr_type: PathRelinkingType,
+                      chr1: BaseChromosome, chr2: BaseChromosome,
+                      best_found: tuple, block_size: int, max_time: float,
+                      percentage: float) -> tuple:
+    """
+    Relinks ``chr1`` and ``chr2`` using ``brkga``, within ``max_time``
+    seconds counted from now.
+    """
+    brkga._pr_start_time = time.time()
+    start_time = time.perf_counter()
+    if pr_type == PathRelinkingType.DIRECT:
+        result = brkga._direct_path_relink(chr1, chr2, None, best_found,
+                                           block_size, max_time, percentage)
+    else:
+        result = brkga._permutation_based_path_relink(
+            chr1, chr2, None, best_found, block_size, max_time, percentage)
+
+    if brkga._tracer is not None:
+        brkga._tracer.span("path_relink_pair", start_time, _TRACK_ALGORITHM,
+                           "path_relink", {"type": pr_type.name})
+    return result
+
+###############################################################################
+
+_worker_brkga = None
+"""(BrkgaMpIpr) The algorithm copy used by each path relink worker process."""
+
+def _init_path_relink_worker(brkga: BrkgaMpIpr) -> None:
+    """
+    Initializes a path relink worker process.
+    """
+    global _worker_brkga
+    _worker_brkga = brkga
+    _worker_brkga._evaluation_stats = \
+        EvaluationStats(f"process-{os.getpid()}")
+    # The clock of the recorder is calibrated in this process.
+    if brkga._tracer is not None:
+        _worker_brkga._tracer = TraceRecorder(brkga._tracer.max_events)
+
+def _path_relink_worker(*args) -> tuple:
+    """
+    Relinks a pair of chromosomes in a worker process.
+    See ``_path_relink_pair()``.
+
+    Returns:
+        A tuple with the result of ``_path_relink_pair()``, the accounting
+        of the evaluations of this pair, and the spans recorded for this
+        pair (empty if there is no tracer).
+    """
+    result = _path_relink_pair(_worker_brkga, *args)
+    stats = _worker_brkga._evaluation_stats
+    _worker_brkga._evaluation_stats = EvaluationStats(stats.worker)
+    events = []
+    if _worker_brkga._tracer is not None:
+        events = _worker_brkga._tracer.take_events()
+    return result, stats, events
+
+###############################################################################
+# Profiling
+###############################################################################
+
+def _add_phase_time(profile: Dict[str, List], phase: str,
+                    phase_start: float, count: int = 1) -> float:
+    """
+    Adds the time since ``phase_start`` to ``phase`` in ``profile``, and
+    returns the current time, which is the start of the next phase.
+    """
+    now = time.perf_counter()
+    entry = profile[phase]
+    entry[0] += now - phase_start
+    entry[1] += count
+    return now
@@ -0,0 +1,251 @@
+###############################################################################
+# checkpoint.py: Compact binary files for algorithm checkpoints.
+#
+# (c) Copyright 2022, Carlos Eduardo de Andrade. All Rights Reserved.
+#
+# This code is released under LICENSE.md.
+#
+# Created on:  Oct 19, 2026 by ceandrade
+# Last update: Oct 19, 2026 by ceandrade
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+###############################################################################
+
+"""
+Checkpoint files keep records made of a JSON header and a set of named
+binary columns. Each column is a contiguous sequence of items of a single
+``array`` typecode. The layout of a record is
+
+.. code-block:: text
+
+    magic (8 bytes) | header offset (8 bytes) | header size (8 bytes) |
+    padding | column 1 | padding | column 2 | ... | JSON header | padding
+
+where the integers are little-endian, the offsets are relative to the start
+of the record, and each column starts at a multiple of 8 bytes. The header
+holds the user data and the table of columns (name, typecode, offset, and
+number of items). Since the columns are plain binary data, they are read
+through a memory map, without parsing.
+
+A snapshot file (``write_checkpoint()``) has a single record. A log file
+(``append_checkpoint()``) is a sequence of records appended one after the
+other. The preamble of a record is completed only after the remaining of the
+record is written. Therefore, a record torn by an interruption is detected,
+and it is discarded with all records after it (``read_checkpoint_log()``).
+"""
+
+from array import array
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import BinaryIO, Dict, List, Tuple
+
+from brkga_mp_ipr.exceptions import LoadError
+
+###############################################################################
+
+MAGIC = b"BRKGACK\x01"
+"""Identifies the checkpoint records (and the format version)."""
+
+_PREAMBLE = struct.Struct("<8sQQ")
+
+###############################################################################
+
+def write_checkpoint(filename: str, header: dict,
+                     columns: Dict[str, array]) -> None:
+    """
+    Writes ``header`` and ``columns`` into ``filename``. The file is written
+    into a temporary file first, and then renamed. Therefore, an interrupted
+    write never spoils an existing checkpoint.
+
+    Args:
+        filename (str): the checkpoint file.
+
+        header (dict): data that can be serialized to JSON.
+
+        columns (Dict[str, array]): named columns. Each column can be an
+            ``array`` or any object supporting the buffer protocol with a
+            typecode format, such as a ``memoryview``.
+    """
+    tmp_filename = filename + ".tmp"
+    with open(tmp_filename, "wb") as hd:
+        _write_record(hd, header, columns)
+        hd.flush()
+        os.fsync(hd.fileno())
+
+    os.replace(tmp_filename, filename)
+
+###############################################################################
+
+def append_checkpoint(filename: str, header: dict,
+                      columns: Dict[str, array]) -> None:
+    """
+    Appends a record with ``header`` and ``columns`` to the log file
+    ``filename``, creating it if it does not exist. See
+    ``write_checkpoint()`` for the arguments.
+    """
+    fd = os.open(filename, os.O_RDWR | os.O_CREAT, 0o666)
+    with os.fdopen(fd, "r+b") as hd:
+        hd.seek(0, os.SEEK_END)
+        _write_record(hd, header, columns)
+        hd.flush()
+        os.fsync(hd.fileno())
+
+###############################################################################
+
+def read_checkpoint(filename: str) -> Tuple[dict, Dict[str, memoryview]]:
+    """
+    Reads a checkpoint file written by ``write_checkpoint()``.
+
+    Returns:
+        A tuple with the header and the columns. The columns are read-only
+        ``memoryview`` objects of a memory map of the file (or ``array``
+        objects if the file was written in a machine with other byte order).
+
+    Raises:
+        FileNotFoundError: If ``filename`` does not exist.
+
+        LoadError: If ``filename`` is not a valid checkpoint file.
+    """
+    buffer = _map_file(filename)
+    header, columns, _ = _read_record(buffer, 0, filename)
+    return header, columns
+
+###############################################################################
+
+def read_checkpoint_log(filename: str) \
+        -> List[Tuple[dict, Dict[str, memoryview]]]:
+    """
+    Reads the records of a log file written by ``append_checkpoint()``. A
+    torn record (and anything after it) is discarded.
+
+    Returns:
+        A list of tuples with the header and the columns of each record (see
+        ``read_checkpoint()``).
+
+    Raises:
+        FileNotFoundError: If ``filename`` does not exist.
+    """
+    buffer = _map_file(filename)
+    records = []
+    position = 0
+    while position < len(buffer):
+        try:
+            header, columns, position = \
+                _read_record(buffer, position, filename)
+        except LoadError:
+            break
+        records.append((header, columns))
+    return records
+
+###############################################################################
+
+def _write_record(hd: BinaryIO, header: dict,
+                  columns: Dict[str, array]) -> None:
+    """
+    Writes a record at the current position of ``hd``, which must be a
+    multiple of 8.
+    """
+    start = hd.tell()
+    hd.write(_PREAMBLE.pack(MAGIC, 0, 0))
+
+    table = []
+    for name, column in columns.items():
+        view = memoryview(column)
+        hd.write(bytes(-hd.tell() % 8))
+        table.append({
+            "name": name,
+            "typecode": view.format,
+            "offset": hd.tell() - start,
+            "length": len(view)
+        })
+        hd.write(view)
+
+    full_header = {
+        "byteorder": sys.byteorder,
+        "columns": table,
+        "data": header
+    }
+    header_bytes = json.dumps(full_header).encode("utf-8")
+    header_offset = hd.tell() - start
+    hd.write(header_bytes)
+    hd.write(bytes(-hd.tell() % 8))
+    end = hd.tell()
+
+    # The preamble is completed only when the record is in place.
+    hd.flush()
+    hd.seek(start)
+    hd.write(_PREAMBLE.pack(MAGIC, header_offset, len(header_bytes)))
+    hd.seek(end)
+
+###############################################################################
+
+def _map_file(filename: str) -> memoryview:
+    """
+    Returns a read-only memory map of ``filename``.
+    """
+    with open(filename, "rb") as hd:
+        if os.fstat(hd.fileno()).st_size == 0:
+            return memoryview(b"")
+        return memoryview(mmap.mmap(hd.fileno(), 0, access=mmap.ACCESS_READ))
+
+###############################################################################
+
+def _read_record(buffer: memoryview, position: int, filename: str) \
+        -> Tuple[dict, Dict[str, memoryview], int]:
+    """
+    Reads the record at ``position`` of ``buffer``.
+
+    Returns:
+        A tuple with the header, the columns, and the position of the next
+        record.
+
+    Raises:
+        LoadError: If there is no valid record at ``position``.
+    """
+    preamble = bytes(buffer[position:position + _PREAMBLE.size])
+    if len(preamble) < _PREAMBLE.size:
+        raise LoadError(f"{filename} is not a checkpoint file")
+
+    magic, header_offset, header_size = _PREAMBLE.unpack(preamble)
+    if magic != MAGIC or header_offset < _PREAMBLE.size:
+        raise LoadError(f"{filename} is not a checkpoint file")
+
+    header_start = position + header_offset
+    header_end = header_start + header_size
+    if header_end > len(buffer):
+        raise LoadError(f"{filename}: truncated header")
+
+    try:
+        full_header = json.loads(
+            bytes(buffer[header_start:header_end]).decode("utf-8"))
+    except ValueError:
+        raise LoadError(f"{filename}: corrupted header")
+
+    columns = {}
+    for column in full_header["columns"]:
+        typecode = column["typecode"]
+        start = position + column["offset"]
+        end = start + column["length"] * array(typecode).itemsize
+        if end > header_start:
+            raise LoadError(f"{filename}: truncated column {column['name']}")
+
+        data = buffer[start:end].cast(typecode)
+        if full_header["byteorder"] != sys.byteorder:
+            data = array(typecode, data)
+            data.byteswap()
+        columns[column["name"]] = data
+
+    return full_header["data"], columns, header_end + (-header_end % 8)
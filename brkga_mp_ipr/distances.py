@@ -0,0 +1,519 @@
+###############################################################################
+# distances.py: Distance functions between chromosomes.
+#
+# (c) Copyright 2022, Carlos Eduardo de Andrade. All Rights Reserved.
+#
+# This code is released under LICENSE.md.
+#
+# Created on:  Oct 19, 2026 by ceandrade
+# Last update: Oct 19, 2026 by ceandrade
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+###############################################################################
+
+from operator import ne
+from random import Random
+from typing import Dict, List, Tuple
+
+from brkga_mp_ipr.types import BaseChromosome
+
+###############################################################################
+
+class DistanceFunctionBase:
+    """
+    Base class for functors that compute the distance between two
+    chromosomes. A distance functor can be given directly to
+    ``BrkgaMpIpr.path_relink()``, since it is callable:
+
+    .. code-block:: python
+
+        dist = HammingDistance()
+        brkga.path_relink(..., dist, ...)
+
+    Besides the distance between two chromosomes, the functors also provide
+    the distances from one chromosome to many others, and the distances among
+    all pairs of a set of chromosomes. Derived classes may override these
+    methods to reuse computations that depend only on one of the chromosomes.
+    """
+
+    def distance(self, chr1: BaseChromosome, chr2: BaseChromosome) -> float:
+        """
+        Computes the distance between ``chr1`` and ``chr2``.
+        """
+        raise NotImplementedError
+
+    ###########################################################################
+
+    def __call__(self, chr1: BaseChromosome, chr2: BaseChromosome) -> float:
+        """
+        Computes the distance between ``chr1`` and ``chr2``.
+        """
+        return self.distance(chr1, chr2)
+
+    ###########################################################################
+
+    def one_to_many(self, chromosome: BaseChromosome,
+                    chromosomes: List[BaseChromosome]) -> List[float]:
+        """
+        Computes the distances from ``chromosome`` to each one of
+        ``chromosomes``.
+        """
+        return [self.distance(chromosome, other) for other in chromosomes]
+
+    ###########################################################################
+
+    def all_pairs(self, chromosomes: List[BaseChromosome]) \
+            -> List[List[float]]:
+        """
+        Computes the (symmetric) matrix of distances among all
+        ``chromosomes``. Each distance is computed only once.
+        """
+        size = len(chromosomes)
+        matrix = [[0.0] * size for _ in range(size)]
+        for i in range(size - 1):
+            distances = self.one_to_many(chromosomes[i], chromosomes[i + 1:])
+            for j, value in enumerate(distances, start=i + 1):
+                matrix[i][j] = value
+                matrix[j][i] = value
+        return matrix
+
+###############################################################################
+
+class HammingDistance(DistanceFunctionBase):
+    """
+    Computes the Hamming distance between two chromosomes, i.e., the number
+    of keys that differ by more than ``epsilon``.
+
+    Attributes:
+        epsilon (float): two keys are considered equal if they differ by
+            ``epsilon`` or less.
+
+        normalized (bool): if true, the distance is divided by the
+            chromosome size, lying in [0, 1].
+    """
+
+    def __init__(self, epsilon: float = 1e-6, normalized: bool = False):
+        """
+        Initializes a HammingDistance object.
+        """
+        self.epsilon = epsilon
+        self.normalized = normalized
+
+    ###########################################################################
+
+    def distance(self, chr1: BaseChromosome, chr2: BaseChromosome) -> float:
+        """
+        Computes the Hamming distance between ``chr1`` and ``chr2``.
+        """
+        if self.epsilon <= 0.0:
+            different = sum(map(ne, chr1, chr2))
+        else:
+            epsilon = self.epsilon
+            different = sum(
+                1 for x, y in zip(chr1, chr2) if abs(x - y) > epsilon
+            )
+
+        if self.normalized:
+            return different / len(chr1)
+        return float(different)
+
+###############################################################################
+
+class KendallTauDistance(DistanceFunctionBase):
+    """
+    Computes the Kendall tau distance between the permutations induced by two
+    chromosomes, i.e., the number of pairs of positions ordered differently
+    by the keys of the two chromosomes.
+
+    The discordant pairs are counted as the inversions of one permutation
+    relative to the other using merge sort, in :math:`O(n \\log n)`.
+
+    Attributes:
+        normalized (bool): if true, the distance is divided by the number
+            of pairs of positions, lying in [0, 1].
+    """
+
+    def __init__(self, normalized: bool = False):
+        """
+        Initializes a KendallTauDistance object.
+        """
+        self.normalized = normalized
+
+    ###########################################################################
+
+    def distance(self, chr1: BaseChromosome, chr2: BaseChromosome) -> float:
+        """
+        Computes the Kendall tau distance between ``chr1`` and ``chr2``.
+        """
+        return self._distance(_permutation(chr1), _ranks(chr2))
+
+    ###########################################################################
+
+    def one_to_many(self, chromosome: BaseChromosome,
+                    chromosomes: List[BaseChromosome]) -> List[float]:
+        """
+        Computes the distances from ``chromosome`` to each one of
+        ``chromosomes``. The permutation induced by ``chromosome`` is computed
+        only once.
+        """
+        permutation = _permutation(chromosome)
+        return [
+            self._distance(permutation, _ranks(other))
+            for other in chromosomes
+        ]
+
+    ###########################################################################
+
+    def all_pairs(self, chromosomes: List[BaseChromosome]) \
+            -> List[List[float]]:
+        """
+        Computes the (symmetric) matrix of distances among all
+        ``chromosomes``. The permutation induced by each chromosome is
+        computed only once.
+        """
+        permutations = [_permutation(chromosome) for chromosome in chromosomes]
+        ranks = [_ranks_from_permutation(perm) for perm in permutations]
+
+        size = len(chromosomes)
+        matrix = [[0.0] * size for _ in range(size)]
+        for i in range(size - 1):
+            for j in range(i + 1, size):
+                value = self._distance(permutations[i], ranks[j])
+                matrix[i][j] = value
+                matrix[j][i] = value
+        return matrix
+
+    ###########################################################################
+
+    def _distance(self, permutation: List[int], ranks: List[int]) -> float:
+        """
+        Computes the distance given the permutation induced by the first
+        chromosome and the rank of each position in the second one.
+        """
+        size = len(permutation)
+        inversions = _count_inversions([ranks[i] for i in permutation])
+        if self.normalized:
+            return inversions / max(1, size * (size - 1) // 2)
+        return float(inversions)
+
+###############################################################################
+# Helper functions
+###############################################################################
+
+def _permutation(chromosome: BaseChromosome) -> List[int]:
+    """
+    Returns the positions of ``chromosome`` sorted by their keys.
+    """
+    return sorted(range(len(chromosome)), key=chromosome.__getitem__)
+
+###############################################################################
+
+def _ranks_from_permutation(permutation: List[int]) -> List[int]:
+    """
+    Returns the rank of each position given the induced permutation.
+    """
+    ranks = [0] * len(permutation)
+    for rank, position in enumerate(permutation):
+        ranks[position] = rank
+    return ranks
+
+###############################################################################
+
+def _ranks(chromosome: BaseChromosome) -> List[int]:
+    """
+    Returns the rank of the key of each position of ``chromosome``.
+    """
+    return _ranks_from_permutation(_permutation(chromosome))
+
+###############################################################################
+
+def _count_inversions(values: List[int]) -> int:
+    """
+    Counts the pairs ``i < j`` such that ``values[i] > values[j]`` using a
+    bottom-up merge sort.
+    """
+    size = len(values)
+    source = list(values)
+    target = [0] * size
+    inversions = 0
+    width = 1
+    while width < size:
+        for begin in range(0, size, 2 * width):
+            middle = min(begin + width, size)
+            end = min(begin + 2 * width, size)
+            i, j, k = begin, middle, begin
+            while i < middle and j < end:
+                if source[i] <= source[j]:
+                    target[k] = source[i]
+                    i += 1
+                else:
+                    target[k] = source[j]
+                    # All remaining values in the left run are larger.
+                    inversions += middle - i
+                    j += 1
+                k += 1
+            target[k:k + middle - i] = source[i:middle]
+            k += middle - i
+            target[k:k + end - j] = source[j:end]
+        source, target = target, source
+        width *= 2
+    return inversions
+
+###############################################################################
+# Caches and indices for path relink pair selection
+###############################################################################
+
+class EliteDistanceCache:
+    """
+    Keeps the distances between elite chromosomes across path relink calls,
+    since elite sets change slowly from generation to generation.
+
+    Each chromosome is identified by its slot, the tuple ``(population
+    index, row index)``, and the distances are stored by pairs of slots.
+    Therefore, a lookup costs a dictionary access, no matter the chromosome
+    size. In turn, the cache must be told about the changes of the rows:
+    ``invalidate()`` discards the distances of a rewritten row, and
+    ``move_rows()`` follows the chromosomes that survive a generation in
+    other rows (such as the elite ones), discarding the distances of all
+    other rows of the population.
+
+    Attributes:
+        dist (callable): the distance function being cached.
+
+        hits (int): number of distances found in the cache.
+
+        misses (int): number of distances actually computed.
+    """
+
+    def __init__(self, dist: callable):
+        """
+        Initializes an EliteDistanceCache object.
+        """
+        self.dist = dist
+        self.hits = 0
+        self.misses = 0
+
+        self._distances = {}
+        """(Dict[Tuple[tuple, tuple], float]) Distances by slot pair."""
+
+        self._pairs_by_slot = {}
+        """(Dict[tuple, Set[Tuple[tuple, tuple]]]) Cached pairs of each
+           slot, used for invalidation."""
+
+    ###########################################################################
+
+    def distance(self, slot1: tuple, chr1: BaseChromosome,
+                 slot2: tuple, chr2: BaseChromosome) -> float:
+        """
+        Returns the distance between ``chr1`` (the chromosome of ``slot1``)
+        and ``chr2`` (the chromosome of ``slot2``), computing it only if
+        needed.
+        """
+        key = (slot1, slot2)
+        value = self._distances.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = self.dist(chr1, chr2)
+        self._distances[key] = value
+        for slot in key:
+            self._pairs_by_slot.setdefault(slot, set()).add(key)
+        return value
+
+    ###########################################################################
+
+    def invalidate(self, slot: tuple) -> None:
+        """
+        Discards all distances involving ``slot``, whose row was rewritten.
+        """
+        for key in self._pairs_by_slot.pop(slot, ()):
+            self._distances.pop(key, None)
+            for other in key:
+                if other != slot and other in self._pairs_by_slot:
+                    self._pairs_by_slot[other].discard(key)
+
+    ###########################################################################
+
+    def move_rows(self, population: int, moves: Dict[int, int]) -> None:
+        """
+        Updates the slots of ``population`` after a generation: the
+        chromosome of row ``i`` moved to row ``moves[i]``, and all rows not
+        in ``moves`` were rewritten. The cost is linear on the number of
+        distances involving ``population``.
+        """
+        old_slots = [slot for slot in self._pairs_by_slot
+                     if slot[0] == population]
+        old_keys = set()
+        for slot in old_slots:
+            old_keys.update(self._pairs_by_slot.pop(slot))
+
+        def new_slot(slot: tuple) -> tuple:
+            if slot[0] != population:
+                return slot
+            row = moves.get(slot[1])
+            return None if row is None else (population, row)
+
+        for key in old_keys:
+            value = self._distances.pop(key)
+            for other in key:
+                if other[0] != population:
+                    pairs = self._pairs_by_slot[other]
+                    pairs.discard(key)
+                    if not pairs:
+                        del self._pairs_by_slot[other]
+
+            new_key = (new_slot(key[0]), new_slot(key[1]))
+            if None in new_key:
+                continue
+            self._distances[new_key] = value
+            for slot in new_key:
+                self._pairs_by_slot.setdefault(slot, set()).add(new_key)
+
+    ###########################################################################
+
+    def __len__(self) -> int:
+        """
+        Returns the number of cached distances.
+        """
+        return len(self._distances)
+
+###############################################################################
+
+class LSHIndex:
+    """
+    Locality-sensitive hashing index used to find chromosomes that are far
+    from a given one without computing the exact distances to all of them.
+
+    Each one of the ``num_tables`` tables hashes a chromosome into a
+    signature of ``bits_per_table`` bits, each bit sampled from a few keys
+    only. Two kinds of bits are available:
+
+    - order-based (default): each bit tells whether the key at position
+      ``i`` is smaller than the key at position ``j``, for random ``i`` and
+      ``j``. The fraction of different bits estimates the normalized Kendall
+      tau distance. Suitable for permutation-based decoders;
+
+    - threshold-based: each bit tells whether the key at a random position is
+      at least ``threshold``. The fraction of different bits estimates the
+      normalized Hamming distance between the binarized chromosomes.
+
+    Computing a signature costs
+    :math:`O(num\\_tables \\times bits\\_per\\_table)` regardless of the
+    chromosome size. The exact distance is computed only for the candidates,
+    in the order suggested by the index.
+
+    Attributes:
+        chromosome_size (int): size of the chromosomes.
+
+        num_tables (int): number of hash tables.
+
+        bits_per_table (int): number of bits of each signature.
+
+        order_based (bool): the kind of bits, as described above.
+
+        threshold (float): threshold for the threshold-based bits.
+    """
+
+    def __init__(self, chromosome_size: int, num_tables: int = 8,
+                 bits_per_table: int = 16, order_based: bool = True,
+                 threshold: float = 0.5, seed: int = 0):
+        """
+        Initializes a LSHIndex object.
+
+        Raises:
+            ``ValueError``: if ``chromosome_size < 2``, ``num_tables < 1``, or
+                ``bits_per_table < 1``.
+        """
+        if chromosome_size < 2:
+            raise ValueError(f"Chromosome size must be larger than one, "
+                             f"current {chromosome_size}")
+        if num_tables < 1:
+            raise ValueError(f"Number of tables must be larger than zero, "
+                             f"current {num_tables}")
+        if bits_per_table < 1:
+            raise ValueError(f"Number of bits per table must be larger than "
+                             f"zero, current {bits_per_table}")
+
+        self.chromosome_size = chromosome_size
+        self.num_tables = num_tables
+        self.bits_per_table = bits_per_table
+        self.order_based = order_based
+        self.threshold = threshold
+
+        rng = Random(seed)
+        if order_based:
+            self._tables = [
+                [tuple(rng.sample(range(chromosome_size), 2))
+                 for _ in range(bits_per_table)]
+                for _ in range(num_tables)
+            ]
+        else:
+            self._tables = [
+                [rng.randrange(chromosome_size)
+                 for _ in range(bits_per_table)]
+                for _ in range(num_tables)
+            ]
+
+    ###########################################################################
+
+    def signature(self, chromosome: BaseChromosome) -> Tuple[int, ...]:
+        """
+        Returns the signature of ``chromosome``, one integer per table.
+        """
+        signature = []
+        if self.order_based:
+            for table in self._tables:
+                value = 0
+                for i, j in table:
+                    value = (value << 1) | (chromosome[i] < chromosome[j])
+                signature.append(value)
+        else:
+            threshold = self.threshold
+            for table in self._tables:
+                value = 0
+                for i in table:
+                    value = (value << 1) | (chromosome[i] >= threshold)
+                signature.append(value)
+        return tuple(signature)
+
+    ###########################################################################
+
+    def estimated_distance(self, signature1: Tuple[int, ...],
+                           signature2: Tuple[int, ...]) -> float:
+        """
+        Returns the fraction of different bits between two signatures, which
+        estimates the normalized distance between the chromosomes.
+        """
+        different = sum(bin(x ^ y).count("1")
+                        for x, y in zip(signature1, signature2))
+        return different / (self.num_tables * self.bits_per_table)
+
+    ###########################################################################
+
+    def farthest_first(self, chromosome: BaseChromosome,
+                       candidates: List[BaseChromosome]) -> List[int]:
+        """
+        Returns the indices of ``candidates`` sorted from the probably
+        farthest to the probably closest to ``chromosome``. Candidates that
+        share a bucket with ``chromosome`` in fewer tables come first; ties
+        are broken by the estimated distance.
+        """
+        reference = self.signature(chromosome)
+        keys = []
+        for signature in map(self.signature, candidates):
+            collisions = sum(x == y for x, y in zip(reference, signature))
+            keys.append((collisions,
+                         -self.estimated_distance(reference, signature)))
+        return sorted(range(len(candidates)), key=keys.__getitem__)
@@ -165,3 +165,54 @@ class ShakingType(ParsingEnum):
     """
     CHANGE = 0
     SWAP = 1
+
+###############################################################################
+
+@unique
+class KeyStorage(ParsingEnum):
+    """
+    Specifies how the random keys are stored in the populations:
+
+    - ``FLOAT64``: each chromosome is a ``BaseChromosome`` (a list of Python
+      floats). This is the default.
+
+    - ``FLOAT32``: each chromosome is an array of single-precision floats.
+
+    - ``UINT16``: each key is a 16-bit fixed-point integer :math:`k`
+      representing the key :math:`(k + 0.5) / 2^{16}`.
+
+    - ``UINT32``: same as above, but using 32-bit integers.
+
+    Except for ``FLOAT64``, the keys are converted to floats only when the
+    chromosomes are decoded or returned to the user.
+    """
+    FLOAT64 = 0
+    FLOAT32 = 1
+    UINT16 = 2
+    UINT32 = 3
+
+###############################################################################
+
+@unique
+class CallbackEvent(ParsingEnum):
+    """
+    Specifies the events that trigger the callbacks registered by
+    ``BrkgaMpIpr.register_callback()``:
+
+    - ``GENERATION_END``: a population has evolved one generation.
+
+    - ``IMPROVEMENT``: a population has evolved one generation and found a
+      solution better than the best one of all populations.
+
+    - ``ISLAND_CONVERGED``: a population has evolved one generation and
+      converged, i.e., the fitness of its whole elite set is within the
+      convergence tolerance of the best fitness. It is triggered only when
+      the population converges, not while it stays converged.
+
+    - ``MIGRATION``: the elite chromosomes were exchanged among the
+      populations.
+    """
+    GENERATION_END = 0
+    IMPROVEMENT = 1
+    ISLAND_CONVERGED = 2
+    MIGRATION = 3
@@ -0,0 +1,327 @@
+###############################################################################
+# evaluation_log.py: Streaming log of the evaluated chromosomes.
+#
+# (c) Copyright 2022, Carlos Eduardo de Andrade. All Rights Reserved.
+#
+# This code is released under LICENSE.md.
+#
+# Created on:  Oct 19, 2026 by ceandrade
+# Last update: Oct 19, 2026 by ceandrade
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+###############################################################################
+
+from array import array
+import queue
+from random import Random
+import threading
+from typing import Callable, Dict, List, Sequence
+import zlib
+
+from brkga_mp_ipr.checkpoint import _write_record, read_checkpoint_log
+
+###############################################################################
+
+# Columns of each chunk, and their typecodes.
+_COLUMNS = {
+    "island": "q",
+    "generation": "q",
+    "fitness": "d",
+    "decode_time": "d",
+    "elite": "B",
+    "chromosomes": "d"
+}
+
+###############################################################################
+
+class EvaluationLog:
+    """
+    Streams the evaluated chromosomes into a file, for offline analysis.
+    Each record has the island (population index), the generation, the
+    keys of the chromosome, the fitness, the decoding time (in seconds),
+    and whether the chromosome entered the elite set.
+
+    The records are buffered in memory, and every ``buffer_size`` records
+    are handed, as a *chunk*, to a background thread that compresses each
+    column with ``zlib`` and appends the chunk to the file (as a record of
+    ``brkga_mp_ipr.checkpoint``). The generation loop never waits for the
+    disk: if ``max_pending_chunks`` chunks are already waiting to be written,
+    the new chunk is dropped, and its records are counted in
+    ``dropped_records``. Use ``read_evaluation_log()`` to read the file.
+
+    The records can be sampled with probability ``sampling_rate``, using a
+    random number generator independent from the algorithm's, and filtered
+    such that only the ones entering the elite set are kept
+    (``elite_only``), or by a custom ``record_filter``, called as
+    ``record_filter(island, generation, fitness, elite)``.
+
+    The log must be closed (``close()``) to write the buffered records.
+    It can also be used as a context manager.
+
+    .. code-block:: python
+
+        with EvaluationLog("evaluations.log", chromosome_size,
+                           elite_only=True) as log:
+            brkga.set_evaluation_log(log)
+            brkga.initialize()
+            brkga.evolve(100)
+
+    Attributes:
+        filename (str): the log file.
+
+        chromosome_size (int): number of keys per chromosome.
+
+        buffer_size (int): number of records per chunk.
+
+        sampling_rate (float): probability of logging each record.
+
+        elite_only (bool): if true, log only the chromosomes that enter the
+            elite set.
+
+        record_filter (Callable[[int, int, float, bool], bool]): custom
+            filter of records.
+
+        logged_records (int): number of records buffered so far.
+
+        dropped_records (int): number of records dropped because the writer
+            fell behind.
+    """
+
+    def __init__(self, filename: str, chromosome_size: int,
+                 buffer_size: int = 4096, sampling_rate: float = 1.0,
+                 elite_only: bool = False,
+                 record_filter: Callable[[int, int, float, bool],
+                                         bool] = None,
+                 max_pending_chunks: int = 8, compression_level: int = 1,
+                 seed: int = 0):
+        """
+        Initializes an EvaluationLog object, truncating ``filename``.
+
+        Raises:
+            ``ValueError``: if ``buffer_size < 1``, ``max_pending_chunks <
+                1``, or ``sampling_rate`` is not in (0, 1].
+        """
+        if buffer_size < 1:
+            raise ValueError(f"Buffer size must be larger than zero, "
+                             f"current {buffer_size}")
+        if max_pending_chunks < 1:
+            raise ValueError(f"Maximum number of pending chunks must be "
+                             f"larger than zero, current "
+                             f"{max_pending_chunks}")
+        if not 0.0 < sampling_rate <= 1.0:
+            raise ValueError(f"Sampling rate must be in (0, 1], current "
+                             f"{sampling_rate}")
+
+        self.filename = filename
+        self.chromosome_size = chromosome_size
+        self.buffer_size = buffer_size
+        self.sampling_rate = sampling_rate
+        self.elite_only = elite_only
+        self.record_filter = record_filter
+        self.compression_level = compression_level
+        self.logged_records = 0
+        self.dropped_records = 0
+
+        self._rng = Random(seed)
+        """Random number generator used for sampling."""
+
+        self._buffer = self._new_buffer()
+        """(Dict[str, array]) The records not yet handed to the writer."""
+
+        self._queue = queue.Queue(maxsize=max_pending_chunks)
+        """Chunks waiting to be written. ``None`` stops the writer."""
+
+        self._error = None
+        """(Exception) The error raised by the writer, if any."""
+
+        self._file = open(filename, "wb")
+        self._writer = threading.Thread(target=self._write_chunks,
+                                        name="EvaluationLog", daemon=True)
+        self._writer.start()
+
+    ###########################################################################
+
+    def log(self, island: int, generation: int,
+            chromosomes: Sequence[Sequence[float]], fitness: List[float],
+            decode_times: List[float], elite: List[bool]) -> None:
+        """
+        Logs a batch of evaluated chromosomes of a given island and
+        generation. The keys are copied, so the chromosomes can be changed
+        after this call.
+
+        Raises:
+            ``RuntimeError``: if the log is closed.
+        """
+        if self._file is None:
+            raise RuntimeError("The evaluation log is closed")
+
+        buffer = self._buffer
+        for chromosome, value, decode_time, is_elite in \
+                zip(chromosomes, fitness, decode_times, elite):
+            if self.elite_only and not is_elite:
+                continue
+            if self.sampling_rate < 1.0 and \
+               self._rng.random() >= self.sampling_rate:
+                continue
+            if self.record_filter is not None and \
+               not self.record_filter(island, generation, value, is_elite):
+                continue
+
+            buffer["island"].append(island)
+            buffer["generation"].append(generation)
+            buffer["fitness"].append(value)
+            buffer["decode_time"].append(decode_time)
+            buffer["elite"].append(is_elite)
+            # Arrays extend only arrays of the same typecode, such as the
+            # rows of single precision (see KeyStorage.FLOAT32).
+            if isinstance(chromosome, array) and chromosome.typecode != "d":
+                chromosome = chromosome.tolist()
+            buffer["chromosomes"].extend(chromosome)
+            self.logged_records += 1
+
+            if len(buffer["island"]) >= self.buffer_size:
+                self._hand_over()
+                buffer = self._buffer
+
+    ###########################################################################
+
+    def flush(self) -> None:
+        """
+        Hands the buffered records to the writer, and waits until all chunks
+        are written.
+
+        Raises:
+            ``OSError``: if the writer failed.
+        """
+        if self._file is None:
+            return
+        if len(self._buffer["island"]) > 0:
+            self._queue.put(self._buffer)
+            self._buffer = self._new_buffer()
+        self._queue.join()
+        self._file.flush()
+        if self._error is not None:
+            raise self._error
+
+    ###########################################################################
+
+    def close(self) -> None:
+        """
+        Writes the buffered records, stops the writer, and closes the file.
+        Calling ``close()`` more than once has no effect.
+
+        Raises:
+            ``OSError``: if the writer failed.
+        """
+        if self._file is None:
+            return
+        try:
+            self.flush()
+        finally:
+            self._queue.put(None)
+            self._writer.join()
+            self._file.close()
+            self._file = None
+
+    ###########################################################################
+
+    def __enter__(self) -> "EvaluationLog":
+        return self
+
+    ###########################################################################
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    ###########################################################################
+
+    def __getstate__(self):
+        raise TypeError("Evaluation logs cannot be pickled or copied")
+
+    ###########################################################################
+
+    def _new_buffer(self) -> Dict[str, array]:
+        """
+        Returns an empty buffer, one array per column.
+        """
+        return {name: array(typecode) for name, typecode in _COLUMNS.items()}
+
+    ###########################################################################
+
+    def _hand_over(self) -> None:
+        """
+        Hands the buffer to the writer, or drops it if the writer is behind.
+        """
+        try:
+            self._queue.put_nowait(self._buffer)
+        except queue.Full:
+            self.dropped_records += len(self._buffer["island"])
+        self._buffer = self._new_buffer()
+
+    ###########################################################################
+
+    def _write_chunks(self) -> None:
+        """
+        Writer thread: compresses and writes the chunks, until it gets
+        ``None``. Note that ``zlib`` releases the GIL while compressing.
+        """
+        while True:
+            chunk = self._queue.get()
+            try:
+                if chunk is None:
+                    return
+                if self._error is not None:
+                    continue
+
+                header = {
+                    "records": len(chunk["island"]),
+                    "chromosome_size": self.chromosome_size,
+                    "compression": "zlib",
+                    "typecodes": _COLUMNS
+                }
+                columns = {
+                    name: array("B", zlib.compress(column.tobytes(),
+                                                   self.compression_level))
+                    for name, column in chunk.items()
+                }
+                _write_record(self._file, header, columns)
+            except OSError as error:
+                self._error = error
+            finally:
+                self._queue.task_done()
+
+###############################################################################
+
+def read_evaluation_log(filename: str) -> List[Dict[str, array]]:
+    """
+    Reads the chunks of an evaluation log written by ``EvaluationLog``.
+
+    Returns:
+        A list with the columns of each chunk, as arrays: ``island``,
+        ``generation``, ``fitness``, ``decode_time``, ``elite``, and
+        ``chromosomes``, where the latter holds the keys of all chromosomes,
+        one after the other. The number of keys per chromosome is given by
+        ``chromosome_size`` (an integer, not an array).
+
+    Raises:
+        FileNotFoundError: If ``filename`` does not exist.
+    """
+    chunks = []
+    for header, columns in read_checkpoint_log(filename):
+        chunk = {"chromosome_size": header["chromosome_size"]}
+        for name, typecode in header["typecodes"].items():
+            data = array(typecode)
+            data.frombytes(zlib.decompress(columns[name]))
+            chunk[name] = data
+        chunks.append(chunk)
+    return chunks
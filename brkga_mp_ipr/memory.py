@@ -0,0 +1,181 @@
+###############################################################################
+# memory.py: Memory accounting of the algorithm structures.
+#
+# (c) Copyright 2022, Carlos Eduardo de Andrade. All Rights Reserved.
+#
+# This code is released under LICENSE.md.
+#
+# Created on:  Oct 19, 2026 by ceandrade
+# Last update: Oct 19, 2026 by ceandrade
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+###############################################################################
+
+from __future__ import annotations
+from array import array
+from collections import deque
+import statistics
+import sys
+import tracemalloc
+import types
+from typing import Dict, Set
+
+###############################################################################
+
+_NOT_FOLLOWED = (type, types.ModuleType, types.FunctionType,
+                 types.BuiltinFunctionType, types.MethodType)
+"""Objects shared with the rest of the program, that are not accounted."""
+
+###############################################################################
+
+def deep_sizeof(obj: object, seen: Set[int] = None) -> int:
+    """
+    Returns the number of bytes held by ``obj`` and the objects reachable
+    from it: the items of lists, tuples, sets, deques, and dictionaries, and
+    the attributes of other objects. Arrays count their buffers, but memory
+    views do not, since they usually view memory-mapped files (which are
+    not in the heap). Classes, modules, and functions are not accounted.
+
+    Objects whose id is in ``seen`` are skipped, and the accounted ones are
+    added to it. Therefore, sharing ``seen`` among several calls accounts
+    each object only once, in the first call that reaches it.
+    """
+    if seen is None:
+        seen = set()
+
+    total = 0
+    pending = [obj]
+    while pending:
+        item = pending.pop()
+        if id(item) in seen or isinstance(item, _NOT_FOLLOWED):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+
+        if isinstance(item, (str, bytes, bytearray, int, float, array,
+                             memoryview)):
+            continue
+        if isinstance(item, dict):
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset, deque)):
+            pending.extend(item)
+        else:
+            attributes = getattr(item, "__dict__", None)
+            if attributes is not None:
+                pending.append(attributes)
+            for slot in getattr(type(item), "__slots__", ()):
+                if hasattr(item, slot):
+                    pending.append(getattr(item, slot))
+    return total
+
+###############################################################################
+
+class MemoryProfile:
+    """
+    Samples of the memory allocated by Python, taken by ``tracemalloc``
+    after each generation (see ``BrkgaMpIpr.set_memory_sampling()``). Each
+    sample has the generation, the memory in use at the end of the
+    generation (*current*), and the largest memory in use during the
+    generation (*peak*), in bytes.
+
+    When the profile owns ``tracemalloc`` (Python 3.9 or later), the peak is
+    reset after each sample. Otherwise, the peak of ``tracemalloc`` is left
+    untouched, for whoever started it, and the profile compares it to the
+    peak seen at the previous sample: if it grew, the new peak was reached
+    during the generation; if not, the peak of the generation is unknown,
+    and the memory in use at its start or end, whichever is larger, is
+    recorded as a lower bound.
+
+    Attributes:
+        samples (List[Tuple[int, int, int]]): the generation, the current
+            memory, and the peak memory of each sample.
+    """
+
+    def __init__(self, reset_peak: bool = True):
+        """
+        Initializes an empty MemoryProfile object.
+
+        Args:
+            reset_peak (bool): if true, reset the peak of ``tracemalloc``
+                after each sample. Use false when ``tracemalloc`` was
+                started by someone else.
+        """
+        self.samples = []
+
+        self._reset_peak = reset_peak and hasattr(tracemalloc, "reset_peak")
+        """(bool) Indicates that the peak is reset after each sample."""
+
+        self._last_peak = tracemalloc.get_traced_memory()[1]
+        """(int) The peak of ``tracemalloc`` at the previous sample, or when
+           the profile was created."""
+
+    ###########################################################################
+
+    def sample(self, generation: int) -> None:
+        """
+        Samples the memory at the end of ``generation``, and starts the
+        peak of the next one. ``tracemalloc`` must be tracing.
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        if self._reset_peak:
+            self.samples.append((generation, current, peak))
+            tracemalloc.reset_peak()
+            return
+
+        if peak > self._last_peak:
+            generation_peak = peak
+        else:
+            start = self.samples[-1][1] if self.samples else 0
+            generation_peak = max(start, current)
+        self.samples.append((generation, current, generation_peak))
+        # Read after the sample is stored, so that its allocation does not
+        # count as a peak of the next generation.
+        self._last_peak = tracemalloc.get_traced_memory()[1]
+
+    ###########################################################################
+
+    @property
+    def peak(self) -> int:
+        """
+        The largest peak among the samples, or zero if there is none.
+        """
+        return max((peak for _, _, peak in self.samples), default=0)
+
+    ###########################################################################
+
+    @property
+    def steady_state(self) -> int:
+        """
+        The median of the current memory along the second half of the
+        samples, when the populations and caches have usually reached their
+        sizes, or zero if there is no sample.
+        """
+        if not self.samples:
+            return 0
+        half = self.samples[len(self.samples) // 2:]
+        return int(statistics.median(current for _, current, _ in half))
+
+    ###########################################################################
+
+    def summary(self) -> Dict[str, int]:
+        """
+        Returns the number of samples, the peak, the steady-state, and the
+        last current memory, in bytes.
+        """
+        return {
+            "samples": len(self.samples),
+            "peak": self.peak,
+            "steady_state": self.steady_state,
+            "current": self.samples[-1][1] if self.samples else 0
+        }
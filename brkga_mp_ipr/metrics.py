@@ -0,0 +1,617 @@
+###############################################################################
+# metrics.py: Accounting of the chromosome evaluations.
+#
+# (c) Copyright 2022, Carlos Eduardo de Andrade. All Rights Reserved.
+#
+# This code is released under LICENSE.md.
+#
+# Created on:  Oct 19, 2026 by ceandrade
+# Last update: Oct 19, 2026 by ceandrade
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+###############################################################################
+
+from __future__ import annotations
+from array import array
+import copy
+import json
+import math
+import os
+import queue
+import threading
+import time
+from typing import Dict
+
+###############################################################################
+
+EVALUATION_PHASES = ("initialize", "reset", "evolve", "inject",
+                     "path_relink")
+"""Phases of the algorithm that evaluate chromosomes (see
+   ``EvaluationStats``)."""
+
+###############################################################################
+
+class LatencyHistogram:
+    """
+    Streaming histogram of latencies, in the style of the HDR histograms.
+    The latencies are counted in nanoseconds, in log-linear buckets: the
+    values are split into ranges of powers of two, and each range is split
+    into ``2**(precision_bits - 1)`` buckets of equal width. Therefore, the
+    relative error of the percentiles is at most ``2**(1 - precision_bits)``
+    (below 1.6% with the default precision), and the memory is fixed, no
+    matter how many latencies are recorded. Latencies above
+    ``2**max_bits`` nanoseconds (about 19 hours by default) are counted in
+    the last bucket.
+
+    Histograms with the same parameters can be merged. They can also be
+    pickled, so they can be gathered from worker processes.
+
+    Attributes:
+        precision_bits (int): number of significant bits of each bucket.
+
+        max_bits (int): number of bits of the largest latency.
+
+        count (int): number of recorded latencies.
+
+        total (float): sum of the recorded latencies, in seconds.
+
+        min (float): the smallest recorded latency, in seconds.
+
+        max (float): the largest recorded latency, in seconds.
+    """
+
+    def __init__(self, precision_bits: int = 7, max_bits: int = 46):
+        """
+        Initializes an empty LatencyHistogram object.
+
+        Raises:
+            ``ValueError``: if ``precision_bits < 2`` or
+                ``max_bits < precision_bits``.
+        """
+        if precision_bits < 2:
+            raise ValueError(f"Precision must be at least two bits, "
+                             f"current {precision_bits}")
+        if max_bits < precision_bits:
+            raise ValueError(f"Maximum number of bits ({max_bits}) smaller "
+                             f"than the precision ({precision_bits})")
+
+        self.precision_bits = precision_bits
+        self.max_bits = max_bits
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+        self._max_value = (1 << max_bits) - 1
+        self._counts = array("Q", bytes(8 * (
+            (max_bits - precision_bits + 2) << (precision_bits - 1))))
+        """(array) The number of latencies of each bucket."""
+
+    ###########################################################################
+
+    def record(self, seconds: float, count: int = 1) -> None:
+        """
+        Records ``count`` latencies of ``seconds`` each.
+        """
+        value = min(max(int(seconds * 1e9), 0), self._max_value)
+        shift = value.bit_length() - self.precision_bits
+        if shift < 0:
+            shift = 0
+        self._counts[(shift << (self.precision_bits - 1)) +
+                     (value >> shift)] += count
+
+        self.count += count
+        self.total += seconds * count
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    ###########################################################################
+
+    @property
+    def mean(self) -> float:
+        """
+        The mean latency, in seconds, or zero if nothing was recorded.
+        """
+        return self.total / self.count if self.count else 0.0
+
+    ###########################################################################
+
+    def percentile(self, percentage: float) -> float:
+        """
+        Returns the latency, in seconds, below or at which ``percentage``
+        percent of the recorded latencies are. The latency is the upper
+        bound of its bucket, limited to the recorded range. If nothing was
+        recorded, returns zero.
+
+        Raises:
+            ``ValueError``: if ``percentage`` is not in [0, 100].
+        """
+        if not 0.0 <= percentage <= 100.0:
+            raise ValueError(f"Percentage must be in [0, 100], current "
+                             f"{percentage}")
+        if self.count == 0:
+            return 0.0
+
+        target = max(1, math.ceil(percentage / 100.0 * self.count))
+        accumulated = 0
+        for idx, bucket_count in enumerate(self._counts):
+            accumulated += bucket_count
+            if accumulated >= target:
+                break
+
+        half = 1 << (self.precision_bits - 1)
+        shift = max(0, (idx >> (self.precision_bits - 1)) - 1)
+        lower = (idx - shift * half) << shift
+        upper = (lower + (1 << shift) - 1) * 1e-9
+        return min(max(upper, self.min), self.max)
+
+    ###########################################################################
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """
+        Adds the latencies recorded by ``other`` to this histogram.
+
+        Raises:
+            ``ValueError``: if the histograms have different parameters.
+        """
+        if (other.precision_bits, other.max_bits) != \
+           (self.precision_bits, self.max_bits):
+            raise ValueError("Cannot merge histograms with different "
+                             "parameters")
+        counts = self._counts
+        for idx, bucket_count in enumerate(other._counts):
+            if bucket_count:
+                counts[idx] += bucket_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    ###########################################################################
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Returns the count, the mean, the minimum, the maximum, and the
+        percentiles 50, 90, 99, and 99.9 of the latencies (in seconds).
+        """
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(50.0),
+            "p90": self.percentile(90.0),
+            "p99": self.percentile(99.0),
+            "p999": self.percentile(99.9)
+        }
+
+###############################################################################
+
+class EvaluationStats:
+    """
+    Accounting of the chromosome evaluations performed by ``BrkgaMpIpr``:
+    the number of evaluations per phase of the algorithm (see
+    ``EVALUATION_PHASES``), the number of evaluations avoided because the
+    fitness was already known (*cache hits*, such as warm-starters and
+    chromosomes injected with their fitness), and the latency histogram of
+    the decoder, as a whole and per worker.
+
+    A worker is the process that called the decoder: ``"main"`` for the
+    process running the algorithm, and ``"process-<pid>"`` for the path
+    relink worker processes. Note that, when the decoder implements
+    ``decode_batch()``, the algorithm cannot tell which thread or process
+    decoded each chromosome. In such case, each chromosome of the batch
+    gets an equal share of the batch latency, assigned to the worker that
+    called ``decode_batch()``.
+
+    Attributes:
+        worker (str): the worker that records the latencies.
+
+        evaluations (Dict[str, int]): number of evaluations per phase.
+
+        cache_hits (Dict[str, int]): number of avoided evaluations per phase.
+
+        worker_latency (Dict[str, LatencyHistogram]): latencies of the
+            evaluations of each worker.
+    """
+
+    def __init__(self, worker: str = "main"):
+        """
+        Initializes an empty EvaluationStats object.
+        """
+        self.worker = worker
+        self.evaluations = {phase: 0 for phase in EVALUATION_PHASES}
+        self.cache_hits = {phase: 0 for phase in EVALUATION_PHASES}
+        self.worker_latency = {}
+
+    ###########################################################################
+
+    @property
+    def total_evaluations(self) -> int:
+        """
+        Total of evaluations in all phases.
+        """
+        return sum(self.evaluations.values())
+
+    ###########################################################################
+
+    @property
+    def latency(self) -> LatencyHistogram:
+        """
+        Latencies of all evaluations, i.e., of the decoder as a whole.
+        """
+        histogram = LatencyHistogram()
+        for worker_latency in self.worker_latency.values():
+            histogram.merge(worker_latency)
+        return histogram
+
+    ###########################################################################
+
+    @property
+    def total_cache_hits(self) -> int:
+        """
+        Total of avoided evaluations in all phases.
+        """
+        return sum(self.cache_hits.values())
+
+    ###########################################################################
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """
+        Fraction of the requested fitness values that did not require an
+        evaluation, or zero if nothing was requested.
+        """
+        hits = self.total_cache_hits
+        requests = hits + self.total_evaluations
+        return hits / requests if requests else 0.0
+
+    ###########################################################################
+
+    def record(self, phase: str, latencies: list,
+               cache_hits: int = 0) -> None:
+        """
+        Records the evaluations of a ``phase`` with the given ``latencies``
+        (in seconds), and the avoided ones.
+        """
+        self.evaluations[phase] += len(latencies)
+        self.cache_hits[phase] += cache_hits
+        if not latencies:
+            return
+        record = self._worker_histogram().record
+        for latency in latencies:
+            record(latency)
+
+    ###########################################################################
+
+    def record_batch(self, phase: str, count: int, latency: float) -> None:
+        """
+        Records ``count`` evaluations of a ``phase`` with the same
+        ``latency`` (in seconds) each, such as the ones of a batch.
+        """
+        self.evaluations[phase] += count
+        if count > 0:
+            self._worker_histogram().record(latency, count)
+
+    ###########################################################################
+
+    def _worker_histogram(self) -> LatencyHistogram:
+        """
+        Returns the histogram of the current worker.
+        """
+        histogram = self.worker_latency.get(self.worker)
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self.worker_latency[self.worker] = histogram
+        return histogram
+
+    ###########################################################################
+
+    def merge(self, other: EvaluationStats) -> None:
+        """
+        Adds the accounting of ``other``, such as the one of a worker, to
+        this object.
+        """
+        for phase, count in other.evaluations.items():
+            self.evaluations[phase] += count
+        for phase, count in other.cache_hits.items():
+            self.cache_hits[phase] += count
+        for worker, histogram in other.worker_latency.items():
+            if worker in self.worker_latency:
+                self.worker_latency[worker].merge(histogram)
+            else:
+                self.worker_latency[worker] = copy.deepcopy(histogram)
+
+###############################################################################
+
+class MetricsExporter:
+    """
+    Periodically writes the metrics of the algorithm (see
+    ``BrkgaMpIpr.get_metrics()``) to local files, to be scraped by the
+    monitoring systems. Two formats are available:
+
+    - ``textfile``: the Prometheus text format, as read by the textfile
+      collector of the node exporter. The file is rewritten at each export,
+      through a temporary file and a rename, so the collector never reads a
+      partial file;
+    - ``jsonl_file``: JSON lines, one line appended per export.
+
+    The algorithm hands a snapshot of the metrics every ``interval``
+    seconds, at the end of a generation, and a background thread formats and
+    writes it. The algorithm never waits for the disk: if the writer is
+    still busy with a previous snapshot, the new one is dropped, and counted
+    in ``dropped_snapshots``.
+
+    .. code-block:: python
+
+        with MetricsExporter(
+                textfile="/var/lib/node_exporter/brkga.prom",
+                interval=15.0, labels={"instance": "tsp_1000"}) as exporter:
+            brkga.set_metrics_exporter(exporter)
+            brkga.evolve(10000)
+
+    Attributes:
+        textfile (str): the Prometheus text file, if any.
+
+        jsonl_file (str): the JSON-lines file, if any.
+
+        interval (float): minimum number of seconds between exports.
+
+        prefix (str): prefix of the Prometheus metric names.
+
+        labels (Dict[str, str]): constant labels added to all Prometheus
+            metrics and JSON lines.
+
+        exported_snapshots (int): number of snapshots written so far.
+
+        dropped_snapshots (int): number of snapshots dropped because the
+            writer fell behind.
+    """
+
+    def __init__(self, textfile: str = None, jsonl_file: str = None,
+                 interval: float = 10.0, prefix: str = "brkga",
+                 labels: Dict[str, str] = None):
+        """
+        Initializes a MetricsExporter object. The JSON-lines file is
+        truncated.
+
+        Raises:
+            ``ValueError``: if no file is given, or ``interval < 0``.
+        """
+        if textfile is None and jsonl_file is None:
+            raise ValueError("No file given to export the metrics")
+        if interval < 0.0:
+            raise ValueError(f"Interval must be non-negative, current "
+                             f"{interval}")
+
+        self.textfile = textfile
+        self.jsonl_file = jsonl_file
+        self.interval = interval
+        self.prefix = prefix
+        self.labels = dict(labels or {})
+        self.exported_snapshots = 0
+        self.dropped_snapshots = 0
+
+        self._next_export = 0.0
+        """(float) Monotonic time of the next export."""
+
+        self._queue = queue.Queue(maxsize=1)
+        """Snapshots waiting to be written. ``None`` stops the writer."""
+
+        self._error = None
+        """(Exception) The error raised by the writer, if any."""
+
+        self._closed = False
+
+        if jsonl_file is not None:
+            open(jsonl_file, "w").close()
+
+        self._writer = threading.Thread(target=self._write_snapshots,
+                                        name="MetricsExporter", daemon=True)
+        self._writer.start()
+
+    ###########################################################################
+
+    def due(self) -> bool:
+        """
+        Tells whether ``interval`` seconds have passed since the last
+        export.
+        """
+        return not self._closed and time.monotonic() >= self._next_export
+
+    ###########################################################################
+
+    def export(self, snapshot: dict) -> None:
+        """
+        Hands ``snapshot`` to the writer, or drops it if the writer is busy.
+
+        Raises:
+            ``RuntimeError``: if the exporter is closed.
+        """
+        if self._closed:
+            raise RuntimeError("The metrics exporter is closed")
+        self._next_export = time.monotonic() + self.interval
+        try:
+            self._queue.put_nowait(snapshot)
+        except queue.Full:
+            self.dropped_snapshots += 1
+
+    ###########################################################################
+
+    def flush(self) -> None:
+        """
+        Waits until the pending snapshot is written.
+
+        Raises:
+            ``OSError``: if the writer failed.
+        """
+        self._queue.join()
+        if self._error is not None:
+            raise self._error
+
+    ###########################################################################
+
+    def close(self) -> None:
+        """
+        Writes the pending snapshot and stops the writer. Calling ``close()``
+        more than once has no effect.
+
+        Raises:
+            ``OSError``: if the writer failed.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.flush()
+        finally:
+            self._queue.put(None)
+            self._writer.join()
+
+    ###########################################################################
+
+    def __enter__(self) -> MetricsExporter:
+        return self
+
+    ###########################################################################
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    ###########################################################################
+
+    def __getstate__(self):
+        raise TypeError("Metrics exporters cannot be pickled or copied")
+
+    ###########################################################################
+
+    def _write_snapshots(self) -> None:
+        """
+        Writer thread: writes the snapshots, until it gets ``None``.
+        """
+        while True:
+            snapshot = self._queue.get()
+            try:
+                if snapshot is None:
+                    return
+                if self.textfile is not None:
+                    tmp_filename = self.textfile + ".tmp"
+                    with open(tmp_filename, "w") as hd:
+                        hd.write(format_prometheus(snapshot, self.prefix,
+                                                   self.labels))
+                    os.replace(tmp_filename, self.textfile)
+                if self.jsonl_file is not None:
+                    line = dict(self.labels)
+                    line.update(snapshot)
+                    with open(self.jsonl_file, "a") as hd:
+                        hd.write(json.dumps(line) + "\n")
+                self.exported_snapshots += 1
+            except OSError as error:
+                self._error = error
+            finally:
+                self._queue.task_done()
+
+###############################################################################
+
+# Prometheus metrics written from each snapshot: the snapshot key, the metric
+# name, type, and help, and the label of the items, if the value is a list
+# or a dictionary.
+_PROMETHEUS_METRICS = (
+    ("generations", "generations_total", "counter",
+     "Generations evolved by each island.", "island"),
+    ("generations_per_second", "generations_per_second", "gauge",
+     "Mean of the generations evolved per second by each island since the "
+     "last export.",
+     None),
+    ("evaluations", "evaluations_total", "counter",
+     "Chromosome evaluations per phase.", "phase"),
+    ("evaluations_per_second", "evaluations_per_second", "gauge",
+     "Chromosome evaluations per second since the last export.", None),
+    ("cache_hit_rate", "cache_hit_rate", "gauge",
+     "Fraction of fitness values that did not require an evaluation.",
+     None),
+    ("best_fitness", "best_fitness", "gauge",
+     "Best fitness of each island.", "island"),
+    ("diversity", "diversity", "gauge",
+     "Mean standard deviation of the keys of each island.", "island"),
+    ("worker_utilization", "worker_utilization", "gauge",
+     "Fraction of the time each worker spent decoding since the last "
+     "export.", "worker"),
+    ("decode_latency", "decode_latency_seconds", "gauge",
+     "Decoding latency statistics.", "statistic"),
+)
+
+###############################################################################
+
+def format_prometheus(snapshot: dict, prefix: str = "brkga",
+                      labels: Dict[str, str] = None) -> str:
+    """
+    Formats a snapshot of ``BrkgaMpIpr.get_metrics()`` in the Prometheus
+    text format. The items of lists and dictionaries are labeled by their
+    index or key. Missing metrics are skipped.
+    """
+    def label_set(extra: Dict[str, str]) -> str:
+        items = dict(labels or {})
+        items.update(extra)
+        if not items:
+            return ""
+        return "{" + ",".join(
+            f'{key}="{_escape_label(str(value))}"'
+            for key, value in items.items()) + "}"
+
+    lines = []
+    for key, name, metric_type, help_text, item_label in _PROMETHEUS_METRICS:
+        if key not in snapshot:
+            continue
+        value = snapshot[key]
+        name = f"{prefix}_{name}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        if isinstance(value, dict):
+            items = value.items()
+        elif isinstance(value, list):
+            items = enumerate(value)
+        else:
+            lines.append(f"{name}{label_set({})} {_format_value(value)}")
+            continue
+        for item, item_value in items:
+            lines.append(f"{name}{label_set({item_label: item})} "
+                         f"{_format_value(item_value)}")
+    return "\n".join(lines) + "\n"
+
+###############################################################################
+
+def _escape_label(value: str) -> str:
+    """
+    Escapes a Prometheus label value.
+    """
+    return value.replace("\\", "\\\\").replace("\"", "\\\"") \
+                .replace("\n", "\\n")
+
+###############################################################################
+
+def _format_value(value: float) -> str:
+    """
+    Formats a Prometheus sample value.
+    """
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return "NaN"
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
@@ -0,0 +1,258 @@
+###############################################################################
+# storage.py: Compact storage formats for the random keys.
+#
+# (c) Copyright 2022, Carlos Eduardo de Andrade. All Rights Reserved.
+#
+# This code is released under LICENSE.md.
+#
+# Created on:  Oct 19, 2026 by ceandrade
+# Last update: Oct 19, 2026 by ceandrade
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+###############################################################################
+
+from array import array
+import mmap
+from random import Random
+import tempfile
+from typing import List
+
+from brkga_mp_ipr.enums import KeyStorage
+
+###############################################################################
+
+# Largest single-precision float smaller than one.
+_FLOAT32_BELOW_ONE = array("f", [1.0 - 2.0**-24])[0]
+
+###############################################################################
+
+class KeyCodec:
+    """
+    Converts random keys from/to a storage format (see ``KeyStorage``). Each
+    stored chromosome (a *row*) is an ``array.array`` or a ``memoryview``
+    with the same item format (see ``MappedRows``).
+
+    A list of Python floats takes about 32 bytes per key (the pointer and the
+    float object). Rows take 8 bytes per key in ``FLOAT64`` format, 4 bytes
+    in ``FLOAT32`` and ``UINT32`` formats, and 2 bytes in ``UINT16``. The
+    crossover just copies the stored values, so the keys are converted only
+    to decode the chromosomes.
+
+    Attributes:
+        key_storage (KeyStorage): the storage format.
+
+        typecode (str): the ``array`` typecode of the rows.
+    """
+
+    def __init__(self, key_storage: KeyStorage):
+        """
+        Initializes a KeyCodec object.
+        """
+        self.key_storage = KeyStorage(key_storage)
+
+        self._bits = 0
+        if self.key_storage == KeyStorage.FLOAT64:
+            self.typecode = "d"
+        elif self.key_storage == KeyStorage.FLOAT32:
+            self.typecode = "f"
+        elif self.key_storage == KeyStorage.UINT16:
+            self.typecode = "H"
+            self._bits = 16
+        else:
+            self.typecode = "I" if array("I").itemsize >= 4 else "L"
+            self._bits = 32
+
+        self._scale = float(1 << self._bits)
+        self._max_value = (1 << self._bits) - 1
+
+    ###########################################################################
+
+    @property
+    def bytes_per_key(self) -> int:
+        """
+        Number of bytes used by each key.
+        """
+        return array(self.typecode).itemsize
+
+    ###########################################################################
+
+    @property
+    def fixed_point(self) -> bool:
+        """
+        Tells whether the keys are stored as fixed-point integers.
+        """
+        return self._bits > 0
+
+    ###########################################################################
+
+    def new_row(self, size: int) -> array:
+        """
+        Returns a new row with ``size`` zeros.
+        """
+        return array(self.typecode, bytes(size * self.bytes_per_key))
+
+    ###########################################################################
+
+    def random_row(self, rng: Random, size: int) -> array:
+        """
+        Returns a new row with ``size`` random keys.
+        """
+        row = self.new_row(size)
+        self.fill_row(rng, row)
+        return row
+
+    ###########################################################################
+
+    def fill_row(self, rng: Random, row: array) -> None:
+        """
+        Fills ``row`` with random keys. Fixed-point keys are generated
+        directly as integers.
+        """
+        if self._bits:
+            bits = self._bits
+            for i in range(len(row)):
+                row[i] = rng.getrandbits(bits)
+        elif self.typecode == "d":
+            for i in range(len(row)):
+                row[i] = rng.random()
+        else:
+            for i in range(len(row)):
+                row[i] = rng.random()
+                # Rounding to single precision may reach one.
+                if row[i] >= 1.0:
+                    row[i] = _FLOAT32_BELOW_ONE
+
+    ###########################################################################
+
+    def to_key(self, value: float) -> float:
+        """
+        Converts a single stored value to a key.
+        """
+        if self._bits:
+            return (value + 0.5) / self._scale
+        return value
+
+    ###########################################################################
+
+    def to_keys(self, row: array) -> List[float]:
+        """
+        Converts a row to a list of keys.
+        """
+        if self._bits:
+            scale = self._scale
+            return [(value + 0.5) / scale for value in row]
+        return row.tolist()
+
+    ###########################################################################
+
+    def from_keys(self, keys: List[float]) -> array:
+        """
+        Converts a list of keys to a new row. Fixed-point keys are clamped to
+        the representable range. Note that ``from_keys(to_keys(row))`` is
+        equal to ``row``.
+        """
+        if self._bits:
+            scale = self._scale
+            max_value = self._max_value
+            return array(self.typecode, [
+                min(max(int(key * scale), 0), max_value) for key in keys
+            ])
+        return array(self.typecode, keys)
+
+###############################################################################
+
+class MappedRows:
+    """
+    Allocates rows (see ``KeyCodec``) in memory-mapped temporary files,
+    placed in a scratch ``directory``. This allows populations larger than
+    the available memory, since the operating system keeps in memory only
+    the pages in use, and writes back the others to the files.
+
+    Each call to ``new_rows()`` creates a file and maps it. The rows are
+    ``memoryview`` slices of the map, with the item format of the codec.
+    The files are anonymous (whenever the platform allows it) and are
+    removed once the rows are no longer used.
+
+    Since converting the rows to chromosomes of Python floats takes about
+    32 bytes per key, rows must be decoded in chunks of ``rows_per_chunk``
+    rows, such that the chromosomes of a chunk take about ``chunk_bytes``.
+
+    Note that the rows cannot be pickled nor copied.
+
+    Attributes:
+        codec (KeyCodec): the codec that defines the row format.
+
+        row_size (int): number of keys per row.
+
+        directory (str): the scratch directory.
+
+        chunk_bytes (int): memory budget for the chromosomes of a chunk.
+    """
+
+    def __init__(self, codec: KeyCodec, row_size: int, directory: str,
+                 chunk_bytes: int = 64 * 2**20):
+        """
+        Initializes a MappedRows object.
+        """
+        self.codec = codec
+        self.row_size = row_size
+        self.directory = directory
+        self.chunk_bytes = chunk_bytes
+
+        self._files = []
+        """(List[Tuple[file, mmap.mmap]]) The files and their maps. We keep
+           them alive while the rows are in use."""
+
+    ###########################################################################
+
+    @property
+    def rows_per_chunk(self) -> int:
+        """
+        Number of rows that can be decoded at once.
+        """
+        return max(1, self.chunk_bytes // (32 * self.row_size))
+
+    ###########################################################################
+
+    @property
+    def mapped_bytes(self) -> int:
+        """
+        Total of bytes mapped so far.
+        """
+        return sum(len(map_) for _, map_ in self._files)
+
+    ###########################################################################
+
+    def new_rows(self, count: int) -> List[memoryview]:
+        """
+        Returns ``count`` new rows filled with zeros, in a new mapped file.
+        """
+        row_bytes = self.row_size * self.codec.bytes_per_key
+        file_size = max(1, count * row_bytes)
+
+        file = tempfile.TemporaryFile(dir=self.directory)
+        file.truncate(file_size)
+        map_ = mmap.mmap(file.fileno(), file_size)
+        self._files.append((file, map_))
+
+        buffer = memoryview(map_)
+        return [
+            buffer[i * row_bytes:(i + 1) * row_bytes].cast(self.codec.typecode)
+            for i in range(count)
+        ]
+
+    ###########################################################################
+
+    def __getstate__(self):
+        raise TypeError("Memory-mapped populations cannot be pickled or "
+                        "copied")
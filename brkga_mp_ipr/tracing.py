@@ -0,0 +1,206 @@
+###############################################################################
+# tracing.py: Timeline of the optimization in trace-event format.
+#
+# (c) Copyright 2022, Carlos Eduardo de Andrade. All Rights Reserved.
+#
+# This code is released under LICENSE.md.
+#
+# Created on:  Oct 19, 2026 by ceandrade
+# Last update: Oct 19, 2026 by ceandrade
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+###############################################################################
+
+from __future__ import annotations
+from collections import deque
+import json
+import os
+import time
+from typing import List
+
+###############################################################################
+
+class TraceRecorder:
+    """
+    Records a timeline of the optimization as spans (named intervals of
+    time), and writes it in the trace-event JSON format, which can be viewed
+    in ``chrome://tracing`` or in Perfetto (https://ui.perfetto.dev).
+
+    Each span is placed in a *track*: a process (the process id) and a
+    thread (an integer). ``track_names`` gives the name of the tracks, which
+    are the same for all processes. The timestamps are taken with
+    ``time.perf_counter()`` and converted to the wall clock, so that spans
+    recorded by other processes (see ``take_events()`` and
+    ``add_events()``) fit in the same timeline.
+
+    At most ``max_events`` spans are kept, in a ring buffer: on long runs,
+    the oldest spans are discarded, and counted in ``dropped_events``. Each
+    span takes about 150 bytes.
+
+    .. code-block:: python
+
+        tracer = TraceRecorder()
+        brkga.set_tracer(tracer)
+        brkga.evolve(100)
+        tracer.write("brkga_trace.json")
+
+    Attributes:
+        max_events (int): maximum number of spans kept.
+
+        track_names (Dict[int, str]): the name of each thread track.
+
+        recorded_events (int): number of spans recorded so far, including
+            the dropped ones.
+    """
+
+    def __init__(self, max_events: int = 100000):
+        """
+        Initializes an empty TraceRecorder object.
+
+        Raises:
+            ``ValueError``: if ``max_events < 1``.
+        """
+        if max_events < 1:
+            raise ValueError(f"Maximum number of events must be larger than "
+                             f"zero, current {max_events}")
+
+        self.max_events = max_events
+        self.track_names = {}
+        self.recorded_events = 0
+
+        self._events = deque(maxlen=max_events)
+        """(deque) The spans, as tuples (name, category, start, duration,
+           process id, thread id, args), with times in microseconds since
+           the epoch."""
+
+        self._pid = os.getpid()
+        """(int) The process that owns the recorder."""
+
+        self._clock_offset = time.time() - time.perf_counter()
+        """(float) Converts ``time.perf_counter()`` to the wall clock."""
+
+    ###########################################################################
+
+    @property
+    def dropped_events(self) -> int:
+        """
+        Number of spans discarded because the buffer was full.
+        """
+        return self.recorded_events - len(self._events)
+
+    ###########################################################################
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    ###########################################################################
+
+    def span(self, name: str, start: float, track: int,
+             category: str = "brkga", args: dict = None,
+             end: float = None) -> float:
+        """
+        Records a span from ``start`` to ``end`` (or now), as given by
+        ``time.perf_counter()``, and returns its end, which can be used as
+        the start of the next span. ``args`` are shown with the span, and
+        may be shared among spans.
+        """
+        if end is None:
+            end = time.perf_counter()
+        self._events.append((name, category,
+                             (start + self._clock_offset) * 1e6,
+                             (end - start) * 1e6, self._pid, track, args))
+        self.recorded_events += 1
+        return end
+
+    ###########################################################################
+
+    def take_events(self) -> List[tuple]:
+        """
+        Removes and returns the recorded spans, such that they can be sent
+        to another recorder (see ``add_events()``).
+        """
+        events = list(self._events)
+        self._events.clear()
+        return events
+
+    ###########################################################################
+
+    def add_events(self, events: List[tuple]) -> None:
+        """
+        Adds the spans taken from another recorder.
+        """
+        self._events.extend(events)
+        self.recorded_events += len(events)
+
+    ###########################################################################
+
+    def clear(self) -> None:
+        """
+        Discards all spans.
+        """
+        self._events.clear()
+        self.recorded_events = 0
+
+    ###########################################################################
+
+    def trace_events(self) -> List[dict]:
+        """
+        Returns the spans as trace events (complete events, ``"ph": "X"``),
+        preceded by the metadata events that name the processes and tracks.
+        The timestamps are relative to the first span.
+        """
+        origin = min((event[2] for event in self._events), default=0.0)
+
+        pids = sorted({event[4] for event in self._events} | {self._pid})
+        metadata = []
+        for pid in pids:
+            metadata.append({
+                "name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                "args": {"name": "BrkgaMpIpr" if pid == self._pid
+                         else f"worker process-{pid}"}
+            })
+            for tid, track_name in self.track_names.items():
+                metadata.append({
+                    "name": "thread_name", "ph": "M", "pid": pid,
+                    "tid": tid, "args": {"name": track_name}
+                })
+
+        events = []
+        for name, category, start, duration, pid, tid, args in self._events:
+            event = {
+                "name": name, "cat": category, "ph": "X",
+                "ts": round(start - origin, 3), "dur": round(duration, 3),
+                "pid": pid, "tid": tid
+            }
+            if args:
+                event["args"] = args
+            events.append(event)
+        return metadata + events
+
+    ###########################################################################
+
+    def write(self, filename: str) -> None:
+        """
+        Writes the trace into ``filename``, in the JSON object format of the
+        trace events.
+        """
+        trace = {
+            "traceEvents": self.trace_events(),
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "recorded_events": self.recorded_events,
+                "dropped_events": self.dropped_events
+            }
+        }
+        with open(filename, "w") as hd:
+            json.dump(trace, hd)
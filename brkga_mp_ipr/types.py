@@ -22,10 +22,12 @@
 ###############################################################################
 
 from __future__ import annotations
+from collections.abc import Sequence
 import copy
+from typing import NamedTuple
 
-from brkga_mp_ipr.enums import BiasFunctionType, PathRelinkingType, \
-    PathRelinkingSelection
+from brkga_mp_ipr.enums import BiasFunctionType, CallbackEvent, \
+    PathRelinkingType, PathRelinkingSelection
 
 ###############################################################################
 
@@ -148,6 +150,124 @@ class BaseChromosome(list):
 
 ###############################################################################
 
+def copy_chromosome(chromosome: BaseChromosome) -> BaseChromosome:
+    """
+    Returns a copy of ``chromosome``. Since keys are immutable floats, a
+    plain ``BaseChromosome`` (or ``list``) is copied as a single slice, much
+    faster than ``copy.deepcopy()``, which visits each key. Other types,
+    which may hold mutable extra data, are deep copied.
+    """
+    chromosome_type = type(chromosome)
+    if chromosome_type is BaseChromosome or chromosome_type is list:
+        return chromosome_type(chromosome)
+    return copy.deepcopy(chromosome)
+
+###############################################################################
+
+class ReadOnlyView(Sequence):
+    """
+    Read-only view over a sequence, such as a chromosome or a fitness list,
+    that avoids copying it. The view reflects the current content of the
+    sequence. Therefore, views of the algorithm internals are valid only
+    until the populations change (e.g., by ``evolve()``). When a stable
+    copy is needed, use ``list(view)``.
+
+    Optionally, each item is passed through ``transform`` before being
+    returned, and only the first ``size`` items are exposed.
+
+    .. code-block:: python
+
+        view = ReadOnlyView(chromosome)
+        view[0]          # same as chromosome[0]
+        view[0] = 0.5    # TypeError
+
+        # Only the first 10 values of a list of pairs.
+        values = ReadOnlyView(fitness, lambda x: x[0], 10)
+    """
+
+    __slots__ = ("_data", "_transform", "_size")
+
+    def __init__(self, data: Sequence, transform: callable = None,
+                 size: int = None):
+        """
+        Initializes a ReadOnlyView object.
+        """
+        self._data = data
+        self._transform = transform
+        self._size = size
+
+    def __len__(self) -> int:
+        if self._size is None:
+            return len(self._data)
+        return min(self._size, len(self._data))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        size = len(self)
+        if index < 0:
+            index += size
+        if index < 0 or index >= size:
+            raise IndexError("view index out of range")
+
+        if self._transform is None:
+            return self._data[index]
+        return self._transform(self._data[index])
+
+    def __iter__(self):
+        if self._transform is None and self._size is None:
+            return iter(self._data)
+        return (self[i] for i in range(len(self)))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and \
+            all(x == y for x, y in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)})"
+
+###############################################################################
+
+class EventSummary(NamedTuple):
+    """
+    Read-only summary of an event, given to the callbacks registered by
+    ``BrkgaMpIpr.register_callback()``.
+
+    Attributes:
+        event (CallbackEvent): the event.
+
+        population_index (int): the population that triggered the event,
+            or ``None`` for migrations.
+
+        generation (int): the number of generations evolved by such
+            population, or ``None`` for migrations.
+
+        best_fitness (float): the best fitness of such population, or of
+            all populations for migrations.
+
+        global_best_fitness (float): the best fitness of all populations.
+
+        elapsed_time (float): wall time, in seconds, of the generation or
+            migration that triggered the event.
+
+        num_immigrants (int): number of immigrants sent by each population
+            to each other in a migration, or zero.
+    """
+    event: CallbackEvent
+    population_index: int
+    generation: int
+    best_fitness: float
+    global_best_fitness: float
+    elapsed_time: float
+    num_immigrants: int = 0
+
+###############################################################################
+
 class Population():
     """
     Encapsulates a population of chromosomes. Note that this struct is **NOT**
@@ -173,5 +293,9 @@ class Population():
         self.fitness = list()
 
         if other_population is not None:
-            self.chromosomes = copy.deepcopy(other_population.chromosomes)
-            self.fitness = copy.deepcopy(other_population.fitness)
+            self.chromosomes = [
+                copy_chromosome(chromosome)
+                for chromosome in other_population.chromosomes
+            ]
+            # Fitness pairs are immutable tuples.
+            self.fitness = list(other_population.fitness)
@@ -21,7 +21,11 @@
 # POSSIBILITY OF SUCH DAMAGE.
 ###############################################################################
 
+import ast
 from itertools import chain
+import mmap
+import struct
+import sys
 
 from brkga_mp_ipr.types import BrkgaParams, ExternalControlParams
 from brkga_mp_ipr.exceptions import LoadError
@@ -134,3 +138,70 @@ def write_configuration(filename: str, brkga_params: BrkgaParams,
 
     with open(filename, "w") as hd:
         hd.write(output_string)
+
+###############################################################################
+
+def load_npy_matrix(filename: str) -> memoryview:
+    """
+    Loads a matrix of floats from the NumPy file (``.npy``) `filename`,
+    without NumPy. The file is memory-mapped, i.e., the rows are read from
+    the disk only when they are used.
+
+    Args:
+        filename (str): A ``.npy`` file holding a two-dimensional array of
+            ``float64`` or ``float32`` in C order and in the byte order of
+            this machine.
+
+    Returns:
+        A read-only two-dimensional ``memoryview`` of the matrix.
+
+    Raises:
+        FileNotFoundError: If `filename` does not exist.
+
+        LoadError: If `filename` is not a valid ``.npy`` file, or the array
+            is not supported.
+    """
+
+    with open(filename, "rb") as hd:
+        preamble = hd.read(10)
+        if len(preamble) < 10 or preamble[:6] != b"\x93NUMPY":
+            raise LoadError(f"{filename} is not a .npy file")
+
+        major_version = preamble[6]
+        if major_version == 1:
+            header_size = struct.unpack("<H", preamble[8:10])[0]
+            offset = 10
+        elif major_version in (2, 3):
+            preamble += hd.read(2)
+            header_size = struct.unpack("<I", preamble[8:12])[0]
+            offset = 12
+        else:
+            raise LoadError(f"{filename}: unsupported .npy version "
+                            f"{major_version}")
+
+        try:
+            header = ast.literal_eval(hd.read(header_size).decode("latin1"))
+            descr = header["descr"]
+            fortran_order = header["fortran_order"]
+            shape = tuple(header["shape"])
+        except (ValueError, SyntaxError, KeyError, TypeError):
+            raise LoadError(f"{filename}: corrupted header")
+
+        native = "<" if sys.byteorder == "little" else ">"
+        typecodes = {native + "f8": "d", native + "f4": "f"}
+        if descr not in typecodes:
+            raise LoadError(f"{filename}: unsupported data type {descr} "
+                            f"(must be {native}f8 or {native}f4)")
+        if fortran_order or len(shape) != 2 or 0 in shape:
+            raise LoadError(f"{filename}: the array must be a non-empty "
+                            f"matrix in C order")
+
+        typecode = typecodes[descr]
+        offset += header_size
+        data_size = shape[0] * shape[1] * struct.calcsize(typecode)
+        if hd.seek(0, 2) < offset + data_size:
+            raise LoadError(f"{filename}: truncated data")
+
+        buffer = memoryview(mmap.mmap(hd.fileno(), 0,
+                                      access=mmap.ACCESS_READ))
+    return buffer[offset:offset + data_size].cast(typecode, shape)
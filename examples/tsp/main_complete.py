@@ -55,6 +55,7 @@ Options:
 
 from copy import deepcopy
 from datetime import datetime
+from math import sqrt
 from os.path import basename
 import random
 import time
@@ -62,7 +63,9 @@ import time
 import docopt
 
 from brkga_mp_ipr.algorithm import BrkgaMpIpr
-from brkga_mp_ipr.enums import ParsingEnum, Sense
+from brkga_mp_ipr.distances import HammingDistance, KendallTauDistance
+from brkga_mp_ipr.enums import ParsingEnum, PathRelinkingResult, \
+    PathRelinkingType, Sense
 from brkga_mp_ipr.types_io import load_configuration
 
 from tsp_instance import TSPInstance
@@ -84,7 +87,6 @@ class StopRule(ParsingEnum):
     TARGET = 1
     IMPROVEMENT = 2
 
-
 ###############################################################################
 
 def main() -> None:
@@ -212,9 +214,8 @@ def main() -> None:
 
     bogus_alg = deepcopy(brkga)
     bogus_alg.evolve(2)
-    # TODO (ceandrade): warm up path relink functions.
-    # bogus_alg.path_relink(brkga_params.pr_type, brkga_params.pr_selection,
-    #              (x, y) -> 1.0, (x, y) -> true, 0, 0.5, 1, 10.0, 1.0)
+    bogus_alg.path_relink(brkga_params.pr_type, brkga_params.pr_selection,
+                          lambda x, y: 1.0, 1, 0.5, 1, 1.0, 0.05)
     bogus_alg.get_best_fitness()
     bogus_alg.get_best_chromosome()
     bogus_alg = None
@@ -233,14 +234,25 @@ def main() -> None:
     last_update_time = 0.0
     last_update_iteration = 0
     large_offset = 0
-    # TODO (ceandrade): enable the following when path relink is ready.
-    # path_relink_time = 0.0
-    # num_path_relink_calls = 0
-    # num_homogenities = 0
-    # num_best_improvements = 0
-    # num_elite_improvements = 0
+    path_relink_time = 0.0
+    num_path_relink_calls = 0
+    num_homogenities = 0
+    num_best_improvements = 0
+    num_elite_improvements = 0
     run = True
 
+    # The block size for the path relink is proportional to the
+    # population size.
+    pr_block_size = max(1, int(brkga_params.alpha_block_size *
+                               sqrt(brkga_params.population_size)))
+
+    # Since the decoder uses the order of the keys, the Kendall tau distance
+    # is the natural choice for the permutation-based path relink.
+    if brkga_params.pr_type == PathRelinkingType.PERMUTATION:
+        pr_distance = KendallTauDistance(normalized=True)
+    else:
+        pr_distance = HammingDistance(normalized=True)
+
     # Main optimization loop. We evolve one generation at time,
     # keeping track of all changes during such process.
     start_time = time.time()
@@ -266,11 +278,51 @@ def main() -> None:
             print(f"* {iteration} | {best_cost:.0f} | {last_update_time:.2f}")
         # end if
 
-        # TODO (ceandrade): implement path relink calls here.
-        # Please, see Julia version for that.
-
         iter_without_improvement = iteration - last_update_iteration
 
+        # Here, we call the path relink when the algorithm gets stuck for
+        # some generations.
+        if brkga_params.pr_number_pairs > 0 and \
+           control_params.exchange_interval > 0 and \
+           iter_without_improvement > 0 and \
+           iter_without_improvement % control_params.exchange_interval == 0:
+
+            print(f"Path relink at {iteration}...", end="")
+            num_path_relink_calls += 1
+
+            pr_start_time = time.time()
+            result = brkga.path_relink(
+                brkga_params.pr_type,
+                brkga_params.pr_selection,
+                pr_distance,
+                brkga_params.pr_number_pairs,
+                brkga_params.pr_minimum_distance,
+                pr_block_size,
+                maximum_time - (time.time() - start_time),
+                brkga_params.pr_percentage
+            )
+            path_relink_time += time.time() - pr_start_time
+
+            if result == PathRelinkingResult.TOO_HOMOGENEOUS:
+                num_homogenities += 1
+                print(" populations too homogeneous")
+            elif result == PathRelinkingResult.NO_IMPROVEMENT:
+                print(" no improvement")
+            elif result == PathRelinkingResult.ELITE_IMPROVEMENT:
+                num_elite_improvements += 1
+                print(" improvement on the elite set but not in the best")
+            elif result == PathRelinkingResult.BEST_IMPROVEMENT:
+                num_best_improvements += 1
+                fitness = brkga.get_best_fitness()
+                print(f" best solution improved: {fitness:.0f}")
+                if fitness < best_cost:
+                    last_update_time = time.time() - start_time
+                    last_update_iteration = iteration
+                    best_cost = fitness
+                    best_chromosome = brkga.get_best_chromosome()
+                    iter_without_improvement = 0
+        # end if
+
         # Check stop criteria.
         run = not (
             (time.time() - start_time > maximum_time)
@@ -294,12 +346,11 @@ def main() -> None:
     print(f"Last update time: {last_update_time:.2f}")
     print(f"Large number of iterations between improvements: {large_offset}")
 
-    # TODO (ceandrade): enable when path relink is ready.
-    # print(f"\nTotal path relink time: {path_relink_time:.2f}")
-    # print(f"\nTotal path relink calls: {num_path_relink_calls}")
-    # print(f"\nNumber of homogenities: {num_homogenities}")
-    # print(f"\nImprovements in the elite set: {num_elite_improvements}")
-    # print(f"\nBest individual improvements: {num_best_improvements}")
+    print(f"\nTotal path relink time: {path_relink_time:.2f}")
+    print(f"Total path relink calls: {num_path_relink_calls}")
+    print(f"Number of homogenities: {num_homogenities}")
+    print(f"Improvements in the elite set: {num_elite_improvements}")
+    print(f"Best individual improvements: {num_best_improvements}")
 
     ########################################
     # Extracting the best tour
@@ -316,16 +367,17 @@ def main() -> None:
         print(node, end=" ")
 
     print("\n\nInstance,Seed,NumNodes,TotalIterations,TotalTime,"
-          #"TotalPRTime,PRCalls,NumHomogenities,NumPRImprovElite,"
-          #"NumPrImprovBest,"
+          "TotalPRTime,PRCalls,NumHomogenities,NumPRImprovElite,"
+          "NumPrImprovBest,"
           "LargeOffset,LastUpdateIteration,LastUpdateTime,"
           "Cost")
 
     print(f"{basename(instance_file)},"
           f"{seed},{instance.num_nodes},{total_num_iterations},"
           f"{total_elapsed_time:.2f},"
-          # f"{path_relink_time:.2f},{num_path_relink_calls},"
-          # f"{num_homogenities},{num_elite_improvements},{num_best_improvements},"
+          f"{path_relink_time:.2f},{num_path_relink_calls},"
+          f"{num_homogenities},{num_elite_improvements},"
+          f"{num_best_improvements},"
           f"{large_offset},{last_update_iteration},"
           f"{last_update_time:.2f},{best_cost:.0f}")
 
@@ -52,3 +52,18 @@ class RankDecode():
             for i in range(len(chromosome)):
                 chromosome[i] = tmp[i]
         return float(rank)
+
+################################################################################
+
+class BatchSumDecode(SumDecode):
+    """
+    SumDecode that also implements `decode_batch()`, keeping the size of each
+    batch it receives.
+    """
+    def __init__(self, instance: Instance):
+        super().__init__(instance)
+        self.batch_sizes = []
+
+    def decode_batch(self, chromosomes: list, rewrite: bool) -> list:
+        self.batch_sizes.append(len(chromosomes))
+        return [self.decode(chromosome, rewrite) for chromosome in chromosomes]
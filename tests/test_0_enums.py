@@ -164,6 +164,40 @@ class Test(unittest.TestCase):
         self.assertRaises(ValueError, ShakingType, "invalid")
         self.assertRaises(ValueError, ShakingType, -1)
 
+    ###########################################################################
+
+    def test_KeyStorage(self):
+        """
+        Tests KeyStorage constructor.
+        """
+
+        self.assertEqual(KeyStorage("FLOAT64"), KeyStorage.FLOAT64)
+        self.assertEqual(KeyStorage("float32"), KeyStorage.FLOAT32)
+        self.assertEqual(KeyStorage("UINT16"), KeyStorage.UINT16)
+        self.assertEqual(KeyStorage("uint32"), KeyStorage.UINT32)
+        self.assertEqual(KeyStorage(0), KeyStorage.FLOAT64)
+
+        self.assertRaises(ValueError, KeyStorage, "invalid")
+        self.assertRaises(ValueError, KeyStorage, -1)
+
+    ###########################################################################
+
+    def test_CallbackEvent(self):
+        """
+        Tests CallbackEvent constructor.
+        """
+
+        self.assertEqual(CallbackEvent("GENERATION_END"),
+                         CallbackEvent.GENERATION_END)
+        self.assertEqual(CallbackEvent("improvement"),
+                         CallbackEvent.IMPROVEMENT)
+        self.assertEqual(CallbackEvent("Island_Converged"),
+                         CallbackEvent.ISLAND_CONVERGED)
+        self.assertEqual(CallbackEvent(3), CallbackEvent.MIGRATION)
+
+        self.assertRaises(ValueError, CallbackEvent, "invalid")
+        self.assertRaises(ValueError, CallbackEvent, -1)
+
 ###############################################################################
 
 if __name__ == "__main__":
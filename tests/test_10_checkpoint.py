@@ -0,0 +1,342 @@
+"""
+test_checkpoint.py: Tests for the algorithm checkpoints.
+
+(c) Copyright 2022, Carlos Eduardo de Andrade. All Rights Reserved.
+
+This code is released under LICENSE.md.
+
+Created on:  Oct 19, 2026 by ceandrade
+Last update: Oct 19, 2026 by ceandrade
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+"""
+
+from array import array
+from copy import deepcopy
+import os
+import tempfile
+import unittest
+
+from brkga_mp_ipr.algorithm import BrkgaMpIpr
+from brkga_mp_ipr.checkpoint import append_checkpoint, read_checkpoint, \
+    read_checkpoint_log, write_checkpoint
+from brkga_mp_ipr.enums import *
+from brkga_mp_ipr.exceptions import LoadError
+from brkga_mp_ipr.types import BaseChromosome, BrkgaParams
+
+from tests.instance import Instance
+from tests.decoders import SumDecode
+
+###############################################################################
+
+class Test(unittest.TestCase):
+    """
+    Test units for the algorithm checkpoints.
+    """
+
+    ###########################################################################
+
+    def setUp(self):
+        """
+        Sets up some configurations.
+        """
+
+        Test.maxDiff = None
+
+        self.chromosome_size = 100
+
+        self.default_brkga_params = BrkgaParams()
+        self.default_brkga_params.population_size = 10
+        self.default_brkga_params.elite_percentage = 0.3
+        self.default_brkga_params.mutants_percentage = 0.1
+        self.default_brkga_params.num_elite_parents = 1
+        self.default_brkga_params.total_parents = 2
+        self.default_brkga_params.bias_type = BiasFunctionType.LOGINVERSE
+        self.default_brkga_params.num_independent_populations = 3
+
+        self.instance = Instance(self.chromosome_size)
+        self.sum_decoder = SumDecode(self.instance)
+
+        self.default_param_values = {
+            "decoder": self.sum_decoder,
+            "sense": Sense.MAXIMIZE,
+            "seed": 98747382473209,
+            "chromosome_size": self.chromosome_size,
+            "params": self.default_brkga_params,
+            "evolutionary_mechanism_on": True,
+            "chrmosome_type": BaseChromosome
+        }
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.filename = os.path.join(self.directory, "state.ckp")
+
+    ###########################################################################
+
+    def test_checkpoint_file(self):
+        """
+        Tests write_checkpoint() and read_checkpoint().
+        """
+
+        header = {"a": 1, "b": [1.5, "x"]}
+        columns = {
+            "bytes": array("B", [1, 2, 3]),
+            "doubles": array("d", [0.25, 0.5]),
+            "empty": array("q"),
+            "view": memoryview(array("H", [7, 8, 9]))
+        }
+        write_checkpoint(self.filename, header, columns)
+        self.assertFalse(os.path.exists(self.filename + ".tmp"))
+
+        read_header, read_columns = read_checkpoint(self.filename)
+        self.assertEqual(read_header, header)
+        self.assertEqual(list(read_columns.keys()), list(columns.keys()))
+        for name, column in columns.items():
+            self.assertEqual(read_columns[name].format,
+                             memoryview(column).format)
+            self.assertEqual(read_columns[name].tolist(), column.tolist())
+            self.assertTrue(read_columns[name].readonly)
+
+        write_checkpoint(self.filename, header, {})
+        self.assertEqual(read_checkpoint(self.filename), (header, {}))
+
+        # Invalid files.
+        self.assertRaises(FileNotFoundError, read_checkpoint,
+                          os.path.join(self.directory, "missing"))
+
+        with open(self.filename, "wb") as hd:
+            hd.write(b"BRKGA")
+        self.assertRaises(LoadError, read_checkpoint, self.filename)
+
+        with open(self.filename, "wb") as hd:
+            hd.write(b"X" * 100)
+        self.assertRaises(LoadError, read_checkpoint, self.filename)
+
+        write_checkpoint(self.filename, header, columns)
+        with open(self.filename, "rb") as hd:
+            data = hd.read()
+        with open(self.filename, "wb") as hd:
+            hd.write(data[:-20])
+        self.assertRaises(LoadError, read_checkpoint, self.filename)
+
+    ###########################################################################
+
+    def test_checkpoint_log(self):
+        """
+        Tests append_checkpoint() and read_checkpoint_log().
+        """
+
+        filename = self.filename + ".log"
+        for i in range(3):
+            append_checkpoint(filename, {"i": i},
+                              {"data": array("d", [i] * (i + 1))})
+
+        records = read_checkpoint_log(filename)
+        self.assertEqual(len(records), 3)
+        for i, (header, columns) in enumerate(records):
+            self.assertEqual(header, {"i": i})
+            self.assertEqual(columns["data"].tolist(), [i] * (i + 1))
+
+        # A torn record is discarded.
+        size = os.path.getsize(filename)
+        append_checkpoint(filename, {"i": 3}, {"data": array("d", [3.0])})
+        with open(filename, "r+b") as hd:
+            hd.truncate(os.path.getsize(filename) - 10)
+        self.assertEqual(len(read_checkpoint_log(filename)), 3)
+
+        with open(filename, "r+b") as hd:
+            hd.truncate(size + 24)
+        self.assertEqual(len(read_checkpoint_log(filename)), 3)
+
+        open(filename, "wb").close()
+        self.assertEqual(read_checkpoint_log(filename), [])
+
+    ###########################################################################
+
+    def test_save_load_state(self):
+        """
+        Tests save_state() and load_state().
+        """
+
+        brkga = BrkgaMpIpr(**self.default_param_values)
+        self.assertRaises(RuntimeError, brkga.save_state, self.filename)
+
+        for key_storage in KeyStorage:
+            for storage_directory in [None, self.directory]:
+                param_values = deepcopy(self.default_param_values)
+                param_values["key_storage"] = key_storage
+                param_values["storage_directory"] = storage_directory
+                brkga = BrkgaMpIpr(**param_values)
+                brkga.initialize()
+                brkga.evolve(2)
+                brkga.save_state(self.filename)
+
+                loaded = BrkgaMpIpr.load_state(
+                    self.filename, self.sum_decoder,
+                    storage_directory=storage_directory)
+
+                self.assertEqual(loaded.opt_sense, brkga.opt_sense)
+                self.assertEqual(loaded.chromosome_size,
+                                 brkga.chromosome_size)
+                self.assertEqual(loaded.key_storage, key_storage)
+                self.assertEqual(vars(loaded.params), vars(brkga.params))
+                self.assertEqual(loaded._rng.getstate(),
+                                 brkga._rng.getstate())
+                for pop1, pop2 in zip(loaded._current_populations,
+                                      brkga._current_populations):
+                    self.assertEqual(pop1.fitness, pop2.fitness)
+                    self.assertEqual(
+                        [loaded._row_keys(row) for row in pop1.chromosomes],
+                        [brkga._row_keys(row) for row in pop2.chromosomes])
+                    self.assertEqual(
+                        [type(row) for row in pop1.chromosomes],
+                        [type(row) for row in pop2.chromosomes])
+
+                # Both objects follow the same trajectory.
+                brkga.evolve(3)
+                loaded.evolve(3)
+                self.assertEqual(loaded.get_best_fitness(),
+                                 brkga.get_best_fitness())
+                self.assertEqual(loaded.get_best_chromosome(),
+                                 brkga.get_best_chromosome())
+                self.assertEqual(
+                    [list(loaded.get_fitness_array(i)) for i in range(3)],
+                    [list(brkga.get_fitness_array(i)) for i in range(3)])
+
+        # Custom bias functions must be set again.
+        param_values = deepcopy(self.default_param_values)
+        brkga = BrkgaMpIpr(**param_values)
+        brkga.set_bias_custom_function(lambda r: 1.0 / r)
+        brkga.initialize()
+        brkga.save_state(self.filename)
+
+        loaded = BrkgaMpIpr.load_state(self.filename, self.sum_decoder)
+        self.assertEqual(loaded.params.bias_type, BiasFunctionType.CUSTOM)
+        loaded.set_bias_custom_function(lambda r: 1.0 / r)
+        brkga.evolve(2)
+        loaded.evolve(2)
+        self.assertEqual(loaded.get_best_chromosome(),
+                         brkga.get_best_chromosome())
+
+        self.assertRaises(LoadError, BrkgaMpIpr.load_state,
+                          os.path.join(os.path.dirname(__file__),
+                                       "__init__.py"), self.sum_decoder)
+
+    ###########################################################################
+
+    def test_incremental_state(self):
+        """
+        Tests save_state() and load_state() in the incremental mode.
+        """
+
+        log_filename = self.filename + ".log"
+        brkga = BrkgaMpIpr(**self.default_param_values)
+        brkga.initialize()
+        self.assertRaises(ValueError, brkga.save_state, self.filename, True, 0)
+
+        def check_loaded(loaded, brkga):
+            self.assertEqual(loaded._rng.getstate(), brkga._rng.getstate())
+            self.assertEqual(loaded._generations, brkga._generations)
+            for pop1, pop2 in zip(loaded._current_populations,
+                                  brkga._current_populations):
+                self.assertEqual(pop1.fitness, pop2.fitness)
+                self.assertEqual(
+                    [loaded._row_keys(row) for row in pop1.chromosomes],
+                    [brkga._row_keys(row) for row in pop2.chromosomes])
+
+        for key_storage in [KeyStorage.FLOAT64, KeyStorage.UINT16]:
+            param_values = deepcopy(self.default_param_values)
+            param_values["key_storage"] = key_storage
+            brkga = BrkgaMpIpr(**param_values)
+            brkga.initialize()
+
+            brkga.save_state(self.filename, incremental=True,
+                             snapshot_interval=3)
+            snapshot_size = os.path.getsize(self.filename)
+            self.assertEqual(os.path.getsize(log_filename), 0)
+
+            for generation in range(1, 5):
+                brkga.evolve(1)
+                if generation == 2:
+                    brkga.inject_chromosome(brkga.get_chromosome(0, 0), 1, 5)
+                if generation == 4:
+                    brkga.exchange_elite(1)
+                brkga.save_state(self.filename, incremental=True,
+                                 snapshot_interval=3)
+
+                # Snapshot in the 4th call.
+                self.assertEqual(len(read_checkpoint_log(log_filename)),
+                                 generation % 3)
+
+                loaded = BrkgaMpIpr.load_state(self.filename,
+                                               self.sum_decoder)
+                check_loaded(loaded, brkga)
+
+            # The elite chromosomes are not written again.
+            header, columns = read_checkpoint_log(log_filename)[0]
+            self.assertLessEqual(len(columns["new_rows_0"]),
+                                 self.default_brkga_params.population_size -
+                                 brkga.elite_size)
+            self.assertLess(os.path.getsize(log_filename) /
+                            len(read_checkpoint_log(log_filename)),
+                            snapshot_size)
+
+            # Resume from the last complete record.
+            loaded = BrkgaMpIpr.load_state(self.filename, self.sum_decoder)
+            brkga.evolve(1)
+            brkga.save_state(self.filename, incremental=True,
+                             snapshot_interval=3)
+            with open(log_filename, "r+b") as hd:
+                hd.truncate(os.path.getsize(log_filename) - 10)
+            check_loaded(BrkgaMpIpr.load_state(self.filename,
+                                               self.sum_decoder), loaded)
+
+            # Both objects follow the same trajectory.
+            loaded.evolve(1)
+            check_loaded(loaded, brkga)
+
+            # Snapshots every 'snapshot_interval' calls.
+            snapshot_calls = []
+            snapshot_id = None
+            for call in range(1, 8):
+                brkga.evolve(1)
+                brkga.save_state(self.filename + ".cadence",
+                                 incremental=True, snapshot_interval=3)
+                header, _ = read_checkpoint(self.filename + ".cadence")
+                if header["snapshot_id"] != snapshot_id:
+                    snapshot_calls.append(call)
+                    snapshot_id = header["snapshot_id"]
+            self.assertEqual(snapshot_calls, [1, 4, 7])
+
+            # A full save restarts the incremental mode.
+            brkga.save_state(self.filename)
+            brkga.evolve(1)
+            brkga.save_state(self.filename, incremental=True)
+            self.assertEqual(os.path.getsize(log_filename), 0)
+            check_loaded(BrkgaMpIpr.load_state(self.filename,
+                                               self.sum_decoder), brkga)
+
+            # So does a reset.
+            brkga.save_state(self.filename, incremental=True)
+            self.assertGreater(os.path.getsize(log_filename), 0)
+            brkga.reset()
+            brkga.save_state(self.filename, incremental=True)
+            self.assertEqual(os.path.getsize(log_filename), 0)
+            check_loaded(BrkgaMpIpr.load_state(self.filename,
+                                               self.sum_decoder), brkga)
+
+###############################################################################
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,238 @@
+"""
+test_evaluation_log.py: Tests for the evaluation log.
+
+(c) Copyright 2022, Carlos Eduardo de Andrade. All Rights Reserved.
+
+This code is released under LICENSE.md.
+
+Created on:  Oct 19, 2026 by ceandrade
+Last update: Oct 19, 2026 by ceandrade
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+"""
+
+from copy import deepcopy
+import os
+import tempfile
+import unittest
+
+from brkga_mp_ipr.algorithm import BrkgaMpIpr
+from brkga_mp_ipr.enums import *
+from brkga_mp_ipr.evaluation_log import EvaluationLog, read_evaluation_log
+from brkga_mp_ipr.types import BaseChromosome, BrkgaParams
+
+from tests.instance import Instance
+from tests.decoders import SumDecode, BatchSumDecode
+
+###############################################################################
+
+class Test(unittest.TestCase):
+    """
+    Test units for the evaluation log.
+    """
+
+    ###########################################################################
+
+    def setUp(self):
+        """
+        Sets up some configurations.
+        """
+
+        Test.maxDiff = None
+
+        self.chromosome_size = 100
+
+        self.default_brkga_params = BrkgaParams()
+        self.default_brkga_params.population_size = 10
+        self.default_brkga_params.elite_percentage = 0.3
+        self.default_brkga_params.mutants_percentage = 0.1
+        self.default_brkga_params.num_elite_parents = 1
+        self.default_brkga_params.total_parents = 2
+        self.default_brkga_params.bias_type = BiasFunctionType.LOGINVERSE
+        self.default_brkga_params.num_independent_populations = 3
+
+        self.instance = Instance(self.chromosome_size)
+        self.sum_decoder = SumDecode(self.instance)
+
+        self.default_param_values = {
+            "decoder": self.sum_decoder,
+            "sense": Sense.MAXIMIZE,
+            "seed": 98747382473209,
+            "chromosome_size": self.chromosome_size,
+            "params": self.default_brkga_params,
+            "evolutionary_mechanism_on": True,
+            "chrmosome_type": BaseChromosome
+        }
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.filename = os.path.join(directory.name, "evaluations.log")
+
+    ###########################################################################
+
+    def test_EvaluationLog(self):
+        """
+        Tests EvaluationLog methods.
+        """
+
+        self.assertRaises(ValueError, EvaluationLog, self.filename, 2,
+                          buffer_size=0)
+        self.assertRaises(ValueError, EvaluationLog, self.filename, 2,
+                          max_pending_chunks=0)
+        self.assertRaises(ValueError, EvaluationLog, self.filename, 2,
+                          sampling_rate=0.0)
+
+        chromosomes = [[0.1 * i, 0.2 * i] for i in range(10)]
+        fitness = [float(i) for i in range(10)]
+        decode_times = [0.001 * i for i in range(10)]
+        elite = [i < 3 for i in range(10)]
+
+        with EvaluationLog(self.filename, 2, buffer_size=4) as log:
+            log.log(0, 0, chromosomes, fitness, decode_times, elite)
+            log.log(1, 5, chromosomes[:2], fitness[:2], decode_times[:2],
+                    elite[:2])
+            self.assertEqual(log.logged_records, 12)
+            log.flush()
+            self.assertEqual(len(read_evaluation_log(self.filename)), 3)
+        self.assertRaises(RuntimeError, log.log, 0, 0, [], [], [], [])
+        log.close()
+
+        chunks = read_evaluation_log(self.filename)
+        self.assertEqual([len(chunk["island"]) for chunk in chunks],
+                         [4, 4, 4])
+        self.assertEqual(chunks[0]["chromosome_size"], 2)
+
+        def column(name):
+            return [x for chunk in chunks for x in chunk[name]]
+
+        self.assertEqual(column("island"), [0] * 10 + [1] * 2)
+        self.assertEqual(column("generation"), [0] * 10 + [5] * 2)
+        self.assertEqual(column("fitness"), fitness + fitness[:2])
+        self.assertEqual(column("decode_time"),
+                         decode_times + decode_times[:2])
+        self.assertEqual(column("elite"),
+                         [int(x) for x in elite + elite[:2]])
+        self.assertEqual(column("chromosomes"),
+                         [x for chromosome in chromosomes + chromosomes[:2]
+                          for x in chromosome])
+
+        # Filters.
+        with EvaluationLog(self.filename, 2, elite_only=True) as log:
+            log.log(0, 0, chromosomes, fitness, decode_times, elite)
+        self.assertEqual(read_evaluation_log(self.filename)[0]["fitness"]
+                         .tolist(), [0.0, 1.0, 2.0])
+
+        with EvaluationLog(self.filename, 2,
+                           record_filter=lambda island, generation, value,
+                           is_elite: value > 6.0) as log:
+            log.log(0, 0, chromosomes, fitness, decode_times, elite)
+        self.assertEqual(read_evaluation_log(self.filename)[0]["fitness"]
+                         .tolist(), [7.0, 8.0, 9.0])
+
+        with EvaluationLog(self.filename, 2, sampling_rate=0.5) as log:
+            log.log(0, 0, chromosomes * 100, fitness * 100,
+                    decode_times * 100, elite * 100)
+            self.assertGreater(log.logged_records, 400)
+            self.assertLess(log.logged_records, 600)
+
+    ###########################################################################
+
+    def test_algorithm_evaluation_log(self):
+        """
+        Tests the evaluation log in the algorithm.
+        """
+
+        params = self.default_brkga_params
+        for decoder in [self.sum_decoder, BatchSumDecode(self.instance)]:
+            param_values = deepcopy(self.default_param_values)
+            param_values["decoder"] = decoder
+            brkga = BrkgaMpIpr(**param_values)
+
+            with EvaluationLog(self.filename, 5) as log:
+                self.assertRaises(ValueError, brkga.set_evaluation_log, log)
+
+            with EvaluationLog(self.filename, self.chromosome_size,
+                               buffer_size=7) as log:
+                brkga.set_evaluation_log(log)
+                brkga.initialize()
+                brkga.evolve(4)
+                brkga.set_evaluation_log(None)
+                brkga.evolve(1)
+
+            chunks = read_evaluation_log(self.filename)
+            islands = [x for chunk in chunks for x in chunk["island"]]
+            generations = [x for chunk in chunks for x in chunk["generation"]]
+            num_offspring = params.population_size - brkga.elite_size
+            self.assertEqual(
+                len(islands),
+                3 * params.population_size + 4 * 3 * num_offspring)
+            self.assertEqual(
+                generations,
+                [0] * 3 * params.population_size +
+                [g for g in range(1, 5) for _ in range(3 * num_offspring)])
+            self.assertEqual(
+                islands[:3 * params.population_size],
+                [i for i in range(3) for _ in range(params.population_size)])
+            self.assertEqual(brkga._generations, [5, 5, 5])
+
+            # The logged keys are the rewritten ones.
+            for chunk in chunks:
+                size = chunk["chromosome_size"]
+                for i, value in enumerate(chunk["fitness"]):
+                    self.assertAlmostEqual(
+                        sum(chunk["chromosomes"][i * size:(i + 1) * size]),
+                        value)
+                self.assertTrue(all(x >= 0.0 for x in chunk["decode_time"]))
+
+            # Exactly the elite of the initial populations is flagged.
+            elite = [x for chunk in chunks for x in chunk["elite"]]
+            self.assertEqual(sum(elite[:3 * params.population_size]),
+                             3 * brkga.elite_size)
+
+    ###########################################################################
+
+    def test_algorithm_evaluation_log_key_storage(self):
+        """
+        Tests the evaluation log in the algorithm, for each key storage.
+        """
+
+        params = self.default_brkga_params
+        num_offspring = params.population_size - 3
+        for key_storage in KeyStorage:
+            brkga = BrkgaMpIpr(**self.default_param_values,
+                               key_storage=key_storage)
+            with EvaluationLog(self.filename, self.chromosome_size) as log:
+                brkga.set_evaluation_log(log)
+                brkga.initialize()
+                brkga.evolve(2)
+                brkga.set_evaluation_log(None)
+
+            chunks = read_evaluation_log(self.filename)
+            fitness = [x for chunk in chunks for x in chunk["fitness"]]
+            keys = [x for chunk in chunks for x in chunk["chromosomes"]]
+            self.assertEqual(
+                len(fitness),
+                3 * params.population_size + 2 * 3 * num_offspring,
+                msg=key_storage)
+            self.assertEqual(len(keys), len(fitness) * self.chromosome_size,
+                             msg=key_storage)
+            # The logged keys are the stored ones, up to their precision.
+            size = self.chromosome_size
+            for i, value in enumerate(fitness):
+                self.assertAlmostEqual(sum(keys[i * size:(i + 1) * size]),
+                                       value, delta=0.01, msg=key_storage)
+
+###############################################################################
+
+if __name__ == "__main__":
+    unittest.main()
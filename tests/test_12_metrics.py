@@ -0,0 +1,406 @@
+"""
+test_metrics.py: Tests for the evaluation accounting.
+
+(c) Copyright 2022, Carlos Eduardo de Andrade. All Rights Reserved.
+
+This code is released under LICENSE.md.
+
+Created on:  Oct 19, 2026 by ceandrade
+Last update: Oct 19, 2026 by ceandrade
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+"""
+
+from copy import deepcopy
+import json
+import math
+import os
+import pickle
+import tempfile
+import unittest
+
+from brkga_mp_ipr.algorithm import BrkgaMpIpr
+from brkga_mp_ipr.enums import *
+from brkga_mp_ipr.metrics import EVALUATION_PHASES, EvaluationStats, \
+    LatencyHistogram, MetricsExporter, format_prometheus
+from brkga_mp_ipr.types import BaseChromosome, BrkgaParams
+
+from tests.instance import Instance
+from tests.decoders import SumDecode, BatchSumDecode
+
+###############################################################################
+
+class Test(unittest.TestCase):
+    """
+    Test units for the evaluation accounting.
+    """
+
+    ###########################################################################
+
+    def setUp(self):
+        """
+        Sets up some configurations.
+        """
+
+        Test.maxDiff = None
+
+        self.chromosome_size = 100
+
+        self.default_brkga_params = BrkgaParams()
+        self.default_brkga_params.population_size = 10
+        self.default_brkga_params.elite_percentage = 0.3
+        self.default_brkga_params.mutants_percentage = 0.1
+        self.default_brkga_params.num_elite_parents = 1
+        self.default_brkga_params.total_parents = 2
+        self.default_brkga_params.bias_type = BiasFunctionType.LOGINVERSE
+        self.default_brkga_params.num_independent_populations = 3
+
+        self.instance = Instance(self.chromosome_size)
+        self.sum_decoder = SumDecode(self.instance)
+
+        self.default_param_values = {
+            "decoder": self.sum_decoder,
+            "sense": Sense.MAXIMIZE,
+            "seed": 98747382473209,
+            "chromosome_size": self.chromosome_size,
+            "params": self.default_brkga_params,
+            "evolutionary_mechanism_on": True,
+            "chrmosome_type": BaseChromosome
+        }
+
+    ###########################################################################
+
+    def test_LatencyHistogram(self):
+        """
+        Tests LatencyHistogram methods.
+        """
+
+        self.assertRaises(ValueError, LatencyHistogram, 1)
+        self.assertRaises(ValueError, LatencyHistogram, 7, 6)
+
+        histogram = LatencyHistogram()
+        self.assertEqual(histogram.percentile(50.0), 0.0)
+        self.assertEqual(histogram.mean, 0.0)
+        self.assertRaises(ValueError, histogram.percentile, 100.1)
+
+        # Latencies from 1 microsecond to 1 second.
+        latencies = [i * 1e-6 for i in range(1, 1000001, 37)]
+        for latency in latencies:
+            histogram.record(latency)
+        self.assertEqual(histogram.count, len(latencies))
+        self.assertAlmostEqual(histogram.total, sum(latencies))
+        self.assertEqual(histogram.min, latencies[0])
+        self.assertEqual(histogram.max, latencies[-1])
+        self.assertEqual(histogram.percentile(100.0), latencies[-1])
+        for percentage in [0.0, 1.0, 25.0, 50.0, 90.0, 99.0, 99.9]:
+            exact = latencies[max(0, math.ceil(
+                percentage / 100.0 * len(latencies)) - 1)]
+            self.assertAlmostEqual(histogram.percentile(percentage) / exact,
+                                   1.0, delta=2.0**-6)
+
+        # Fixed memory.
+        size = len(histogram._counts)
+        histogram.record(1e6, 1000)
+        self.assertEqual(len(histogram._counts), size)
+        self.assertEqual(histogram.max, 1e6)
+
+        # Merging.
+        first = LatencyHistogram()
+        second = LatencyHistogram()
+        for i, latency in enumerate(latencies):
+            (first if i % 2 else second).record(latency)
+        first.merge(second)
+        self.assertEqual(first.count, len(latencies))
+        self.assertEqual(first._counts, pickle.loads(pickle.dumps(
+            first))._counts)
+        self.assertEqual(first.summary()["p99"], first.percentile(99.0))
+        self.assertRaises(ValueError, first.merge, LatencyHistogram(5))
+
+    ###########################################################################
+
+    def test_EvaluationStats(self):
+        """
+        Tests EvaluationStats methods.
+        """
+
+        stats = EvaluationStats()
+        self.assertEqual(stats.cache_hit_rate, 0.0)
+        self.assertEqual(stats.latency.count, 0)
+
+        stats.record("initialize", [0.001, 0.002], cache_hits=2)
+        stats.record_batch("evolve", 4, 0.0005)
+        self.assertEqual(stats.evaluations["initialize"], 2)
+        self.assertEqual(stats.evaluations["evolve"], 4)
+        self.assertEqual(stats.total_evaluations, 6)
+        self.assertEqual(stats.total_cache_hits, 2)
+        self.assertEqual(stats.cache_hit_rate, 0.25)
+        self.assertEqual(list(stats.worker_latency), ["main"])
+        self.assertEqual(stats.latency.count, 6)
+
+        worker = EvaluationStats("process-1")
+        worker.record("path_relink", [0.01] * 3)
+        stats.merge(worker)
+        stats.merge(worker)
+        self.assertEqual(stats.evaluations["path_relink"], 6)
+        self.assertEqual(sorted(stats.worker_latency),
+                         ["main", "process-1"])
+        self.assertEqual(stats.worker_latency["process-1"].count, 6)
+        self.assertEqual(worker.worker_latency["process-1"].count, 3)
+        self.assertEqual(stats.latency.count, 12)
+
+    ###########################################################################
+
+    def test_algorithm_evaluation_stats(self):
+        """
+        Tests the accounting of the evaluations in the algorithm.
+        """
+
+        params = self.default_brkga_params
+        num_offspring = params.population_size - \
+            int(params.elite_percentage * params.population_size)
+
+        def dist(chr1, chr2):
+            return float(sum((x < 0.5) != (y < 0.5)
+                             for x, y in zip(chr1, chr2)))
+
+        for decoder in [self.sum_decoder, BatchSumDecode(self.instance)]:
+            param_values = deepcopy(self.default_param_values)
+            param_values["decoder"] = decoder
+            brkga = BrkgaMpIpr(**param_values)
+
+            warm_starter = BaseChromosome([0.5] * self.chromosome_size)
+            brkga.set_initial_population([warm_starter], [50.0])
+            brkga.initialize()
+            brkga.evolve(2)
+            brkga.inject_chromosome(warm_starter, 0, 9)
+            brkga.inject_chromosome(warm_starter, 0, 9, 50.0)
+            brkga.inject_chromosomes([warm_starter] * 3, 1,
+                                     fitness=[50.0, 50.0, 50.0])
+            brkga.reset()
+
+            stats = brkga.get_evaluation_stats()
+            self.assertEqual(stats.evaluations, {
+                "initialize": 3 * params.population_size - 1,
+                "reset": 3 * params.population_size,
+                "evolve": 2 * 3 * num_offspring,
+                "inject": 1,
+                "path_relink": 0
+            })
+            self.assertEqual(stats.cache_hits, {
+                "initialize": 1,
+                "reset": 0,
+                "evolve": 0,
+                "inject": 4,
+                "path_relink": 0
+            })
+            self.assertEqual(stats.latency.count, stats.total_evaluations)
+            self.assertEqual(list(stats.worker_latency), ["main"])
+
+            # The copy is not changed by the algorithm.
+            brkga.evolve(1)
+            self.assertEqual(stats.evaluations["evolve"],
+                             2 * 3 * num_offspring)
+            brkga.reset_evaluation_stats()
+            self.assertEqual(brkga.get_evaluation_stats().total_evaluations,
+                             0)
+
+            # Path relink, serial and in worker processes, accounts the same
+            # evaluations.
+            parallel_brkga = deepcopy(brkga)
+            for algorithm, num_workers in [(brkga, 1), (parallel_brkga, 2)]:
+                algorithm.path_relink(
+                    PathRelinkingType.DIRECT,
+                    PathRelinkingSelection.RANDOMELITE, dist, 10, 1.0,
+                    block_size=5, percentage=0.3, num_workers=num_workers)
+
+            serial_stats = brkga.get_evaluation_stats()
+            parallel_stats = parallel_brkga.get_evaluation_stats()
+            self.assertGreater(serial_stats.evaluations["path_relink"], 0)
+            self.assertEqual(serial_stats.evaluations,
+                             parallel_stats.evaluations)
+            self.assertEqual(serial_stats.cache_hits,
+                             parallel_stats.cache_hits)
+            self.assertEqual(parallel_stats.latency.count,
+                             parallel_stats.total_evaluations)
+            self.assertNotIn("main", parallel_stats.worker_latency)
+            self.assertTrue(all(worker.startswith("process-")
+                                for worker in parallel_stats.worker_latency))
+
+        # Objects pickled by previous versions get a fresh accounting.
+        state = brkga.__dict__.copy()
+        del state["_evaluation_stats"]
+        brkga = BrkgaMpIpr.__new__(BrkgaMpIpr)
+        brkga.__setstate__(state)
+        self.assertEqual(brkga.get_evaluation_stats().evaluations,
+                         {phase: 0 for phase in EVALUATION_PHASES})
+
+    ###########################################################################
+
+    def test_MetricsExporter(self):
+        """
+        Tests MetricsExporter methods and format_prometheus().
+        """
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        textfile = os.path.join(directory.name, "brkga.prom")
+        jsonl_file = os.path.join(directory.name, "brkga.jsonl")
+
+        self.assertRaises(ValueError, MetricsExporter)
+        self.assertRaises(ValueError, MetricsExporter, textfile,
+                          interval=-1.0)
+
+        snapshot = {
+            "generations": [3, 4],
+            "evaluations_per_second": 12.5,
+            "best_fitness": [math.inf, -1.0],
+            "worker_utilization": {"main": 0.5, "a\"b": 0.25}
+        }
+        self.assertEqual(
+            format_prometheus(snapshot, "opt", {"job": "tsp"}),
+            "# HELP opt_generations_total Generations evolved by each "
+            "island.\n"
+            "# TYPE opt_generations_total counter\n"
+            'opt_generations_total{job="tsp",island="0"} 3\n'
+            'opt_generations_total{job="tsp",island="1"} 4\n'
+            "# HELP opt_evaluations_per_second Chromosome evaluations per "
+            "second since the last export.\n"
+            "# TYPE opt_evaluations_per_second gauge\n"
+            'opt_evaluations_per_second{job="tsp"} 12.5\n'
+            "# HELP opt_best_fitness Best fitness of each island.\n"
+            "# TYPE opt_best_fitness gauge\n"
+            'opt_best_fitness{job="tsp",island="0"} +Inf\n'
+            'opt_best_fitness{job="tsp",island="1"} -1.0\n'
+            "# HELP opt_worker_utilization Fraction of the time each worker "
+            "spent decoding since the last export.\n"
+            "# TYPE opt_worker_utilization gauge\n"
+            'opt_worker_utilization{job="tsp",worker="main"} 0.5\n'
+            'opt_worker_utilization{job="tsp",worker="a\\"b"} 0.25\n')
+
+        with MetricsExporter(textfile, jsonl_file, interval=3600.0,
+                             labels={"job": "tsp"}) as exporter:
+            self.assertTrue(exporter.due())
+            exporter.export(snapshot)
+            self.assertFalse(exporter.due())
+            exporter.flush()
+            exporter.export({"generations": [5, 6]})
+        self.assertRaises(RuntimeError, exporter.export, snapshot)
+        exporter.close()
+
+        self.assertEqual(exporter.exported_snapshots, 2)
+        with open(textfile) as hd:
+            self.assertIn('brkga_generations_total{job="tsp",island="1"} 6',
+                          hd.read())
+        with open(jsonl_file) as hd:
+            lines = [json.loads(line) for line in hd]
+        self.assertEqual(len(lines), exporter.exported_snapshots)
+        self.assertEqual(lines[0]["job"], "tsp")
+        self.assertEqual(lines[0]["generations"], [3, 4])
+        self.assertFalse(os.path.exists(textfile + ".tmp"))
+
+    ###########################################################################
+
+    def test_algorithm_metrics(self):
+        """
+        Tests the metrics of the algorithm and their export.
+        """
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        jsonl_file = os.path.join(directory.name, "brkga.jsonl")
+
+        brkga = BrkgaMpIpr(**self.default_param_values)
+        with self.assertRaises(RuntimeError) as context:
+            brkga.get_metrics()
+        self.assertEqual(str(context.exception).strip(),
+                         "The algorithm hasn't been initialized. "
+                         "Call 'initialize()' before 'get_metrics()'")
+
+        brkga.initialize()
+        metrics = brkga.get_metrics()
+        self.assertEqual(metrics["generations"], [0, 0, 0])
+        self.assertEqual(metrics["evaluations"]["initialize"], 30)
+        self.assertEqual(metrics["best_fitness"],
+                         [pop.fitness[0][0]
+                          for pop in brkga._current_populations])
+        population = brkga._current_populations[0]
+        deviations = []
+        for keys in zip(*population.chromosomes):
+            mean = sum(keys) / len(keys)
+            deviations.append(math.sqrt(
+                sum((key - mean)**2 for key in keys) / len(keys)))
+        self.assertAlmostEqual(metrics["diversity"][0],
+                               sum(deviations) / self.chromosome_size)
+        self.assertEqual(list(metrics["worker_utilization"]), ["main"])
+        self.assertEqual(metrics["decode_latency"]["count"], 30)
+        json.dumps(metrics)
+
+        with MetricsExporter(jsonl_file=jsonl_file,
+                             interval=0.0) as exporter:
+            brkga.set_metrics_exporter(exporter)
+            brkga.evolve(2)
+            brkga.set_metrics_exporter(None)
+            brkga.evolve(1)
+
+        with open(jsonl_file) as hd:
+            lines = [json.loads(line) for line in hd]
+        self.assertEqual(len(lines) + exporter.dropped_snapshots, 6)
+        # The writer may drop snapshots, but never reorders them.
+        totals = [sum(line["generations"]) for line in lines]
+        self.assertEqual(totals, sorted(set(totals)))
+        self.assertLessEqual(totals[-1], 6)
+        metrics = brkga.get_metrics()
+        self.assertEqual(metrics["generations"], [3, 3, 3])
+        self.assertGreater(metrics["evaluations_per_second"], 0.0)
+        self.assertGreater(metrics["generations_per_second"], 0.0)
+        self.assertLessEqual(metrics["worker_utilization"]["main"], 1.0)
+
+    ###########################################################################
+
+    def test_metrics_windows(self):
+        """
+        Tests that get_metrics() does not change the rate window of the
+        metrics exporter, nor its own.
+        """
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        jsonl_file = os.path.join(directory.name, "brkga.jsonl")
+
+        brkga = BrkgaMpIpr(**self.default_param_values)
+        brkga.initialize()
+        brkga.evolve(2)
+
+        # Rates are measured since the initialization, so repeated calls
+        # keep reporting the generations already evolved.
+        exporter_sample = brkga._metrics_sample
+        for _ in range(3):
+            metrics = brkga.get_metrics()
+            self.assertGreater(metrics["generations_per_second"], 0.0)
+            self.assertGreater(metrics["evaluations_per_second"], 0.0)
+        self.assertIs(brkga._metrics_sample, exporter_sample)
+
+        # The exporter measures its rates since its previous snapshot.
+        with MetricsExporter(jsonl_file=jsonl_file,
+                             interval=0.0) as exporter:
+            brkga.set_metrics_exporter(exporter)
+            brkga.evolve(1)
+            brkga.set_metrics_exporter(None)
+        self.assertEqual(brkga._metrics_sample[1], 9)
+        brkga.get_metrics()
+        self.assertEqual(brkga._metrics_sample[1], 9)
+
+###############################################################################
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,241 @@
+"""
+test_tracing.py: Tests for the trace recorder.
+
+(c) Copyright 2022, Carlos Eduardo de Andrade. All Rights Reserved.
+
+This code is released under LICENSE.md.
+
+Created on:  Oct 19, 2026 by ceandrade
+Last update: Oct 19, 2026 by ceandrade
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+"""
+
+from copy import deepcopy
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from brkga_mp_ipr.algorithm import BrkgaMpIpr
+from brkga_mp_ipr.enums import *
+from brkga_mp_ipr.tracing import TraceRecorder
+from brkga_mp_ipr.types import BaseChromosome, BrkgaParams
+
+from tests.instance import Instance
+from tests.decoders import SumDecode, BatchSumDecode
+
+###############################################################################
+
+class Test(unittest.TestCase):
+    """
+    Test units for the trace recorder.
+    """
+
+    ###########################################################################
+
+    def setUp(self):
+        """
+        Sets up some configurations.
+        """
+
+        Test.maxDiff = None
+
+        self.chromosome_size = 100
+
+        self.default_brkga_params = BrkgaParams()
+        self.default_brkga_params.population_size = 10
+        self.default_brkga_params.elite_percentage = 0.3
+        self.default_brkga_params.mutants_percentage = 0.1
+        self.default_brkga_params.num_elite_parents = 1
+        self.default_brkga_params.total_parents = 2
+        self.default_brkga_params.bias_type = BiasFunctionType.LOGINVERSE
+        self.default_brkga_params.num_independent_populations = 3
+
+        self.instance = Instance(self.chromosome_size)
+        self.sum_decoder = SumDecode(self.instance)
+
+        self.default_param_values = {
+            "decoder": self.sum_decoder,
+            "sense": Sense.MAXIMIZE,
+            "seed": 98747382473209,
+            "chromosome_size": self.chromosome_size,
+            "params": self.default_brkga_params,
+            "evolutionary_mechanism_on": True,
+            "chrmosome_type": BaseChromosome
+        }
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.filename = os.path.join(directory.name, "trace.json")
+
+    ###########################################################################
+
+    def test_TraceRecorder(self):
+        """
+        Tests TraceRecorder methods.
+        """
+
+        self.assertRaises(ValueError, TraceRecorder, 0)
+
+        tracer = TraceRecorder(max_events=3)
+        tracer.track_names[0] = "main"
+        start = time.perf_counter()
+        end = tracer.span("first", start, 0, end=start + 0.5)
+        self.assertEqual(end, start + 0.5)
+        end = tracer.span("second", start, 1, "test", {"x": 1})
+        self.assertGreaterEqual(end, start)
+        self.assertEqual(len(tracer), 2)
+
+        # The oldest spans are dropped.
+        for i in range(3):
+            tracer.span(f"span {i}", start, 0, end=start + i)
+        self.assertEqual(len(tracer), 3)
+        self.assertEqual(tracer.recorded_events, 5)
+        self.assertEqual(tracer.dropped_events, 2)
+
+        # Moving spans between recorders.
+        other = TraceRecorder()
+        other.add_events(tracer.take_events())
+        self.assertEqual(len(tracer), 0)
+        self.assertEqual(len(other), 3)
+
+        tracer.clear()
+        tracer.span("first", start, 0, end=start + 0.5)
+        tracer.span("second", start + 1.0, 1, "test", {"x": 1},
+                    start + 1.25)
+        tracer.write(self.filename)
+        with open(self.filename) as hd:
+            trace = json.load(hd)
+
+        self.assertEqual(trace["otherData"],
+                         {"recorded_events": 2, "dropped_events": 0})
+        metadata = trace["traceEvents"][:2]
+        self.assertEqual(metadata[0]["name"], "process_name")
+        self.assertEqual(metadata[1]["args"], {"name": "main"})
+        first, second = trace["traceEvents"][2:]
+        self.assertEqual((first["name"], first["cat"], first["ph"],
+                          first["ts"], first["dur"], first["tid"]),
+                         ("first", "brkga", "X", 0.0, 500000.0, 0))
+        self.assertNotIn("args", first)
+        self.assertEqual((second["name"], second["cat"], second["tid"],
+                          second["args"]), ("second", "test", 1, {"x": 1}))
+        self.assertAlmostEqual(second["ts"], 1e6, delta=1.0)
+        self.assertAlmostEqual(second["dur"], 250000.0, delta=1.0)
+        self.assertEqual(first["pid"], os.getpid())
+
+    ###########################################################################
+
+    def test_algorithm_tracing(self):
+        """
+        Tests the tracing of the algorithm.
+        """
+
+        def dist(chr1, chr2):
+            return float(sum((x < 0.5) != (y < 0.5)
+                             for x, y in zip(chr1, chr2)))
+
+        params = self.default_brkga_params
+        num_offspring = params.population_size - \
+            int(params.elite_percentage * params.population_size)
+
+        for decoder in [self.sum_decoder, BatchSumDecode(self.instance)]:
+            param_values = deepcopy(self.default_param_values)
+            param_values["decoder"] = decoder
+            brkga = BrkgaMpIpr(**param_values)
+            brkga.initialize()
+
+            tracer = TraceRecorder()
+            brkga.set_tracer(tracer)
+            self.assertEqual(tracer.track_names, {
+                0: "algorithm", 1: "decoder", 2: "island 0", 3: "island 1",
+                4: "island 2"
+            })
+
+            brkga.evolve(2)
+            brkga.exchange_elite(1)
+            brkga.path_relink(PathRelinkingType.DIRECT,
+                              PathRelinkingSelection.RANDOMELITE, dist, 10,
+                              1.0, block_size=5, percentage=0.3,
+                              num_workers=2)
+            brkga.set_tracer(None)
+            brkga.evolve(1)
+
+            events = [event for event in tracer.trace_events()
+                      if event["ph"] == "X"]
+
+            def spans(name):
+                return [event for event in events if event["name"] == name]
+
+            generations = spans("generation")
+            self.assertEqual(
+                [(event["tid"], event["args"]["generation"])
+                 for event in generations],
+                [(2 + i, g) for g in [1, 2] for i in range(3)])
+            for name in ["mating", "mutants", "decoding", "sorting"]:
+                self.assertEqual(len(spans(name)), 6)
+            self.assertEqual(len(spans("elite")), 12)
+
+            # The phases are nested in their generation.
+            for generation in generations:
+                phases = [
+                    event for event in events
+                    if event["tid"] == generation["tid"] and
+                    event["name"] != "generation" and
+                    generation["ts"] <= event["ts"] <=
+                    generation["ts"] + generation["dur"]
+                ]
+                self.assertEqual(len(phases), 6)
+
+            migrations = spans("exchange_elite")
+            self.assertEqual(len(migrations), 1)
+            self.assertEqual(migrations[0]["args"], {"num_immigrants": 1})
+
+            # The pairs are relinked by the worker processes.
+            self.assertEqual(len(spans("path_relink")), 1)
+            pairs = spans("path_relink_pair")
+            self.assertEqual(len(pairs), 3)
+            self.assertTrue(all(event["pid"] != os.getpid()
+                                for event in pairs))
+
+            decode_name = "decode" if decoder is self.sum_decoder \
+                else "decode_batch"
+            decodes = spans(decode_name)
+            self.assertTrue(all(event["tid"] == 1 for event in decodes))
+            evolve_decodes = [event for event in decodes
+                              if event["args"]["phase"] == "evolve"]
+            relink_decodes = [event for event in decodes
+                              if event["args"]["phase"] == "path_relink"]
+            if decoder is self.sum_decoder:
+                self.assertEqual(len(evolve_decodes), 2 * 3 * num_offspring)
+            else:
+                self.assertEqual(len(evolve_decodes), 2 * 3)
+                self.assertEqual(
+                    sum(event["args"]["size"] for event in evolve_decodes),
+                    2 * 3 * num_offspring)
+            self.assertGreater(len(relink_decodes), 0)
+            for event in relink_decodes:
+                self.assertNotEqual(event["pid"], os.getpid())
+                self.assertEqual(event["args"]["worker"],
+                                 f"process-{event['pid']}")
+
+            tracer.write(self.filename)
+            with open(self.filename) as hd:
+                self.assertEqual(len(json.load(hd)["traceEvents"]),
+                                 len(tracer.trace_events()))
+
+###############################################################################
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+test_benchmarks.py: Tests for the benchmark suite.
+
+(c) Copyright 2022, Carlos Eduardo de Andrade. All Rights Reserved.
+
+This code is released under LICENSE.md.
+
+Created on:  Oct 19, 2026 by ceandrade
+Last update: Oct 19, 2026 by ceandrade
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks.suite import METRICS, BenchmarkCase, build_matrix, main, \
+    run_suite
+
+###############################################################################
+
+class Test(unittest.TestCase):
+    """
+    Test units for the benchmark suite.
+    """
+
+    ###########################################################################
+
+    def test_build_matrix(self):
+        """
+        Tests build_matrix().
+        """
+
+        cases = build_matrix(["sum", "tsp:burma14"], [10, 20], [5, 50],
+                             ["loginverse", "CONSTANT"], [1, 2])
+        self.assertEqual(len(cases), 16 + 8)
+        self.assertEqual(cases[0], BenchmarkCase("sum", 10, 5, "LOGINVERSE",
+                                                 1))
+        self.assertEqual(
+            {case.chromosome_size for case in cases
+             if case.decoder == "tsp:burma14"}, {14})
+        self.assertEqual(len({case.name for case in cases}), len(cases))
+
+        self.assertRaises(ValueError, build_matrix, ["knapsack"], [10], [5],
+                          ["LINEAR"], [1])
+        self.assertRaises(ValueError, build_matrix, ["sum"], [10], [5],
+                          ["UNKNOWN"], [1])
+
+    ###########################################################################
+
+    def test_run_suite(self):
+        """
+        Tests run_suite() and main().
+        """
+
+        cases = build_matrix(["rank", "tsp:burma14"], [20], [8],
+                             ["LINEAR"], [2])
+        results = run_suite(cases, generations=2, repeats=2)
+        json.dumps(results)
+
+        self.assertIn("python_version", results["environment"])
+        self.assertEqual(results["config"]["repeats"], 2)
+        self.assertEqual([result["case"] for result in results["results"]],
+                         [case.name for case in cases])
+        for result in results["results"]:
+            self.assertEqual(set(result["metrics"]), set(METRICS))
+            for summary in result["metrics"].values():
+                self.assertEqual(len(summary["samples"]), 2)
+                self.assertGreater(summary["min"], 0.0)
+                self.assertLessEqual(summary["min"], summary["mean"])
+            self.assertGreater(result["peak_memory"], 0)
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        filename = os.path.join(directory.name, "results.json")
+        main(["--decoders", "sum", "--population-sizes", "20",
+              "--chromosome-sizes", "5", "--islands", "1", "--generations",
+              "1", "--repeats", "1", "--no-memory", "--output", filename])
+        with open(filename) as hd:
+            results = json.load(hd)
+        self.assertEqual(len(results["results"]), 1)
+        self.assertIsNone(results["results"][0]["peak_memory"])
+
+###############################################################################
+
+if __name__ == "__main__":
+    unittest.main()
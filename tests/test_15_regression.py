@@ -0,0 +1,228 @@
+"""
+test_regression.py: Tests for the performance regression gate.
+
+(c) Copyright 2022, Carlos Eduardo de Andrade. All Rights Reserved.
+
+This code is released under LICENSE.md.
+
+Created on:  Oct 19, 2026 by ceandrade
+Last update: Oct 19, 2026 by ceandrade
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import contextlib
+import copy
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks.regression import baseline_filename, compare, \
+    format_report, machine_fingerprint, main, slowdown_interval, t_critical
+from benchmarks.suite import environment_metadata
+
+###############################################################################
+
+class Test(unittest.TestCase):
+    """
+    Test units for the performance regression gate.
+    """
+
+    ###########################################################################
+
+    def setUp(self):
+        """
+        Sets up some configurations.
+        """
+
+        Test.maxDiff = None
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+        def result(case, rates, memory):
+            metrics = {
+                metric: {"samples": list(rates)}
+                for metric in ["generations_per_second",
+                               "evaluations_per_second"]
+            }
+            return {"case": case, "metrics": metrics, "peak_memory": memory}
+
+        self.make_result = result
+        self.baseline = {
+            "environment": environment_metadata(),
+            "config": {"generations": 1, "repeats": 5, "seed": 1},
+            "results": [result("a", [100.0, 102.0, 98.0, 101.0, 99.0], 1000)]
+        }
+
+    ###########################################################################
+
+    def test_machine_fingerprint(self):
+        """
+        Tests machine_fingerprint().
+        """
+
+        environment = environment_metadata()
+        fingerprint = machine_fingerprint(environment)
+        self.assertEqual(len(fingerprint), 16)
+        self.assertEqual(machine_fingerprint(), fingerprint)
+
+        # The revision of the code does not matter, the hardware does.
+        other = dict(environment, git_revision="abc", timestamp="now")
+        self.assertEqual(machine_fingerprint(other), fingerprint)
+        other = dict(environment, cpu_count=environment["cpu_count"] + 1)
+        self.assertNotEqual(machine_fingerprint(other), fingerprint)
+
+        self.assertEqual(baseline_filename("abc", "dir"),
+                         os.path.join("dir", "abc.json"))
+
+    ###########################################################################
+
+    def test_slowdown_interval(self):
+        """
+        Tests slowdown_interval() and t_critical().
+        """
+
+        self.assertEqual(t_critical(1), 12.706)
+        self.assertEqual(t_critical(4.9), 2.776)
+        self.assertEqual(t_critical(1000), 1.960)
+        self.assertEqual(t_critical(0.5), float("inf"))
+
+        low, high = slowdown_interval([10.0, 10.0], [8.0, 8.0])
+        self.assertAlmostEqual(low, 0.2)
+        self.assertAlmostEqual(high, 0.2)
+
+        baseline = [100.0, 102.0, 98.0, 101.0, 99.0]
+        low, high = slowdown_interval(baseline, [80.0, 82.0, 78.0, 81.0,
+                                                 79.0])
+        self.assertLess(low, 0.2)
+        self.assertGreater(high, 0.2)
+        self.assertGreater(low, 0.1)
+
+        # Noisy runs give wide intervals.
+        low, high = slowdown_interval(baseline, [50.0, 110.0, 80.0])
+        self.assertLess(low, 0.0)
+
+    ###########################################################################
+
+    def test_compare(self):
+        """
+        Tests compare().
+        """
+
+        current = copy.deepcopy(self.baseline)
+        report = compare(self.baseline, current)
+        self.assertEqual([entry["metric"] for entry in report],
+                         ["generations_per_second", "evaluations_per_second",
+                          "peak_memory"])
+        self.assertFalse(any(entry["regressed"] for entry in report))
+
+        # A clear slowdown of 20% and 15% more memory.
+        current["results"] = [
+            self.make_result("a", [80.0, 82.0, 78.0, 81.0, 79.0], 1150),
+            self.make_result("new case", [1.0], 1)
+        ]
+        report = compare(self.baseline, current)
+        self.assertEqual(len(report), 3)
+        self.assertTrue(all(entry["regressed"] for entry in report))
+        self.assertAlmostEqual(report[0]["change"], -0.2)
+        self.assertAlmostEqual(report[2]["change"], 0.15)
+
+        report = compare(self.baseline, current, threshold=0.25,
+                         memory_threshold=0.2)
+        self.assertFalse(any(entry["regressed"] for entry in report))
+
+        # A slowdown that is not significant.
+        current["results"] = [
+            self.make_result("a", [50.0, 110.0, 80.0], 1000)
+        ]
+        report = compare(self.baseline, current)
+        self.assertFalse(any(entry["regressed"] for entry in report))
+
+        # A baseline case missing in the current run.
+        current["results"] = [self.make_result("new case", [1.0], 1)]
+        report = compare(self.baseline, current)
+        self.assertEqual(len(report), 1)
+        self.assertEqual(report[0]["case"], "a")
+        self.assertTrue(report[0]["missing"])
+        self.assertIn("MISSING", format_report(report))
+
+    ###########################################################################
+
+    def test_main(self):
+        """
+        Tests the command line.
+        """
+
+        results_file = os.path.join(self.directory, "results.json")
+        with open(results_file, "w") as hd:
+            json.dump(self.baseline, hd)
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), \
+             contextlib.redirect_stderr(output):
+            self.assertEqual(main(["check", "--baseline-dir", self.directory,
+                                   "--results", results_file]), 2)
+            self.assertEqual(main(["record", "--baseline-dir",
+                                   self.directory, "--results",
+                                   results_file]), 0)
+            self.assertTrue(os.path.exists(baseline_filename(
+                machine_fingerprint(), self.directory)))
+            self.assertEqual(main(["check", "--baseline-dir", self.directory,
+                                   "--results", results_file]), 0)
+
+            slower = copy.deepcopy(self.baseline)
+            slower["results"] = [
+                self.make_result("a", [80.0, 82.0, 78.0, 81.0, 79.0], 1000)
+            ]
+            with open(results_file, "w") as hd:
+                json.dump(slower, hd)
+            self.assertEqual(main(["check", "--baseline-dir", self.directory,
+                                   "--results", results_file]), 1)
+            renamed = copy.deepcopy(self.baseline)
+            renamed["results"] = [
+                self.make_result("b", [100.0, 102.0, 98.0, 101.0, 99.0],
+                                 1000)
+            ]
+            with open(results_file, "w") as hd:
+                json.dump(renamed, hd)
+            self.assertEqual(main(["check", "--baseline-dir", self.directory,
+                                   "--results", results_file]), 1)
+        self.assertIn("REGRESSED", output.getvalue())
+        self.assertIn("1 baseline case(s) missing", output.getvalue())
+
+        # Running the suite with the matrix of the baseline.
+        with contextlib.redirect_stdout(output), \
+             contextlib.redirect_stderr(output):
+            self.assertEqual(main(["record", "--baseline-dir",
+                                   self.directory, "--decoders", "rank",
+                                   "--population-sizes", "20",
+                                   "--chromosome-sizes", "5", "--islands",
+                                   "1", "--generations", "2", "--repeats",
+                                   "3"]), 0)
+            self.assertEqual(main(["check", "--baseline-dir",
+                                   self.directory, "--threshold", "0.9",
+                                   "--memory-threshold", "0.9"]), 0)
+        with open(baseline_filename(machine_fingerprint(),
+                                    self.directory)) as hd:
+            baseline = json.load(hd)
+        self.assertEqual(len(baseline["results"]), 1)
+        self.assertEqual(baseline["config"]["repeats"], 3)
+
+###############################################################################
+
+if __name__ == "__main__":
+    unittest.main()
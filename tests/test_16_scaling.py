@@ -0,0 +1,162 @@
+"""
+test_scaling.py: Tests for the scaling benchmarks.
+
+(c) Copyright 2022, Carlos Eduardo de Andrade. All Rights Reserved.
+
+This code is released under LICENSE.md.
+
+Created on:  Oct 19, 2026 by ceandrade
+Last update: Oct 19, 2026 by ceandrade
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from benchmarks.scaling import ScalingCase, SyntheticDecoder, build_matrix, \
+    main, run_scaling, time_to_target
+from brkga_mp_ipr.types import BaseChromosome
+
+###############################################################################
+
+class Test(unittest.TestCase):
+    """
+    Test units for the scaling benchmarks.
+    """
+
+    ###########################################################################
+
+    def test_SyntheticDecoder(self):
+        """
+        Tests SyntheticDecoder.
+        """
+
+        self.assertRaises(ValueError, SyntheticDecoder, -1.0)
+        self.assertRaises(ValueError, SyntheticDecoder, 0.0, True, 0)
+        self.assertRaises(ValueError, SyntheticDecoder, 0.0, True, 2, "gpu")
+
+        chromosomes = [BaseChromosome([0.1 * i, 0.2, 0.3]) for i in range(10)]
+        expected = [sum(chromosome) for chromosome in chromosomes]
+
+        for release_gil in (True, False):
+            for num_workers, backend in ((1, "thread"), (3, "thread"),
+                                         (2, "process")):
+                with SyntheticDecoder(1e-3, release_gil, num_workers,
+                                      backend) as decoder:
+                    self.assertEqual(decoder.decode_batch(chromosomes, False),
+                                     expected)
+                    self.assertEqual(decoder.decode(chromosomes[1], False),
+                                     expected[1])
+                    self.assertEqual(decoder.evaluations, 10)
+                    self.assertGreaterEqual(decoder.busy_time, 10e-3)
+                    self.assertGreaterEqual(
+                        decoder.wall_time, decoder.busy_time / num_workers)
+                    self.assertGreaterEqual(
+                        decoder.overhead_per_evaluation(), 0.0)
+
+                    decoder.reset_counters()
+                    self.assertEqual(decoder.evaluations, 0)
+                    self.assertEqual(decoder.overhead_per_evaluation(), 0.0)
+                decoder.close()
+
+        # Spinning threads serialize on the GIL, no matter the number of
+        # processors.
+        with SyntheticDecoder(0.02, False, 4, "thread") as decoder:
+            start_time = time.perf_counter()
+            decoder.decode_batch(chromosomes[:8], False)
+            self.assertGreaterEqual(time.perf_counter() - start_time, 0.15)
+            self.assertGreaterEqual(decoder.busy_time, 0.16)
+
+    ###########################################################################
+
+    def test_build_matrix(self):
+        """
+        Tests build_matrix() and time_to_target().
+        """
+
+        cases = build_matrix([1e-5, 0.1], ["release", "hold"], ["process"])
+        self.assertEqual(len(cases), 4)
+        self.assertEqual(cases[1], ScalingCase(1e-5, False, "process"))
+        self.assertEqual(cases[1].name, "cost=1e-05/gil=hold/backend=process")
+        self.assertRaises(ValueError, build_matrix, [0.1], ["yes"],
+                          ["thread"])
+        self.assertRaises(ValueError, build_matrix, [0.1], ["hold"], ["gpu"])
+
+        curve = [[0.1, 1.0], [0.2, 3.0], [0.3, 5.0]]
+        self.assertEqual(time_to_target(curve, 3.0), 0.2)
+        self.assertEqual(time_to_target(curve, 0.0), 0.1)
+        self.assertIsNone(time_to_target(curve, 6.0))
+
+    ###########################################################################
+
+    def test_run_scaling(self):
+        """
+        Tests run_scaling() and main().
+        """
+
+        case = ScalingCase(1e-4, True, "thread")
+        self.assertRaises(ValueError, run_scaling, case, "linear", [1], 20,
+                          5, 1)
+
+        strong = run_scaling(case, "strong", [1, 2], 20, 5, generations=3,
+                             repeats=2)
+        json.dumps(strong)
+        self.assertEqual([point["population_size"]
+                          for point in strong["points"]], [20, 20])
+        base = strong["points"][0]
+        self.assertEqual(base["speedup"], 1.0)
+        self.assertEqual(base["efficiency"], 1.0)
+        self.assertEqual(len(base["time_per_generation"]["samples"]), 2)
+        self.assertEqual(strong["target"], base["curve"][-1][1])
+
+        # Same decoder and seed, so same trajectory.
+        for point in strong["points"]:
+            self.assertEqual(len(point["curve"]), 3)
+            self.assertEqual([fitness for _, fitness in point["curve"]],
+                             [fitness for _, fitness in base["curve"]])
+            self.assertIsNotNone(point["time_to_target"])
+            self.assertGreater(point["evaluations_per_second"], 0.0)
+            self.assertAlmostEqual(point["efficiency"],
+                                   point["speedup"] / point["workers"])
+
+        weak = run_scaling(case, "weak", [1, 2], 20, 5, generations=2,
+                           target=-1.0)
+        self.assertEqual([point["population_size"]
+                          for point in weak["points"]], [20, 40])
+        self.assertEqual(weak["target"], -1.0)
+        for point in weak["points"]:
+            self.assertAlmostEqual(point["speedup"],
+                                   point["efficiency"] * point["workers"])
+            self.assertEqual(point["time_to_target"], point["curve"][0][0])
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        filename = os.path.join(directory.name, "scaling.json")
+        main(["--modes", "strong", "--workers", "1", "2", "--costs", "0",
+              "--gil", "hold", "--backends", "thread", "--population-size",
+              "20", "--chromosome-size", "5", "--generations", "1",
+              "--output", filename])
+        with open(filename) as hd:
+            results = json.load(hd)
+        self.assertEqual(len(results["results"]), 1)
+        self.assertEqual(results["config"]["workers"], [1, 2])
+        self.assertEqual(len(results["results"][0]["points"]), 2)
+
+###############################################################################
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,288 @@
+"""
+test_memory.py: Tests for the memory accounting.
+
+(c) Copyright 2022, Carlos Eduardo de Andrade. All Rights Reserved.
+
+This code is released under LICENSE.md.
+
+Created on:  Oct 19, 2026 by ceandrade
+Last update: Oct 19, 2026 by ceandrade
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+"""
+
+from array import array
+from collections import deque
+from copy import deepcopy
+import sys
+import tempfile
+import tracemalloc
+import unittest
+
+from brkga_mp_ipr.algorithm import BrkgaMpIpr
+from brkga_mp_ipr.enums import *
+from brkga_mp_ipr.memory import MemoryProfile, deep_sizeof
+from brkga_mp_ipr.tracing import TraceRecorder
+from brkga_mp_ipr.types import BaseChromosome, BrkgaParams
+
+from tests.instance import Instance
+from tests.decoders import SumDecode
+
+###############################################################################
+
+class Test(unittest.TestCase):
+    """
+    Test units for the memory accounting.
+    """
+
+    ###########################################################################
+
+    def setUp(self):
+        """
+        Sets up some configurations.
+        """
+
+        Test.maxDiff = None
+
+        self.chromosome_size = 100
+
+        self.default_brkga_params = BrkgaParams()
+        self.default_brkga_params.population_size = 10
+        self.default_brkga_params.elite_percentage = 0.3
+        self.default_brkga_params.mutants_percentage = 0.1
+        self.default_brkga_params.num_elite_parents = 1
+        self.default_brkga_params.total_parents = 2
+        self.default_brkga_params.bias_type = BiasFunctionType.LOGINVERSE
+        self.default_brkga_params.num_independent_populations = 3
+
+        self.instance = Instance(self.chromosome_size)
+        self.sum_decoder = SumDecode(self.instance)
+
+        self.default_param_values = {
+            "decoder": self.sum_decoder,
+            "sense": Sense.MAXIMIZE,
+            "seed": 98747382473209,
+            "chromosome_size": self.chromosome_size,
+            "params": self.default_brkga_params,
+            "evolutionary_mechanism_on": True,
+            "chrmosome_type": BaseChromosome
+        }
+
+    ###########################################################################
+
+    def test_deep_sizeof(self):
+        """
+        Tests deep_sizeof().
+        """
+
+        self.assertEqual(deep_sizeof(1.5), sys.getsizeof(1.5))
+
+        keys = [0.5 + i for i in range(10)]
+        expected = sys.getsizeof(keys) + \
+            sum(sys.getsizeof(key) for key in keys)
+        self.assertEqual(deep_sizeof(keys), expected)
+
+        # Shared objects are counted once.
+        self.assertEqual(deep_sizeof([keys, keys]),
+                         sys.getsizeof([keys, keys]) + expected)
+        seen = set()
+        self.assertEqual(deep_sizeof(keys, seen), expected)
+        self.assertEqual(deep_sizeof((keys,), seen), sys.getsizeof((keys,)))
+
+        row = array("d", keys)
+        self.assertEqual(deep_sizeof(row), sys.getsizeof(row))
+        self.assertGreater(deep_sizeof(row), 80)
+
+        # Attributes, dictionaries, and deques.
+        instance = Instance(10)
+        instance.data = {"a": deque([keys])}
+        self.assertGreaterEqual(deep_sizeof(instance),
+                                sys.getsizeof(instance) + expected)
+
+        # Classes and functions are not accounted.
+        self.assertEqual(deep_sizeof([Instance, len]),
+                         sys.getsizeof([Instance, len]))
+
+    ###########################################################################
+
+    def test_MemoryProfile(self):
+        """
+        Tests MemoryProfile.
+        """
+
+        profile = MemoryProfile()
+        self.assertEqual(profile.summary(), {"samples": 0, "peak": 0,
+                                             "steady_state": 0, "current": 0})
+
+        profile.samples = [(1, 100, 500), (2, 300, 400), (3, 200, 300),
+                           (4, 220, 250), (5, 240, 260)]
+        self.assertEqual(profile.peak, 500)
+        self.assertEqual(profile.steady_state, 220)
+        self.assertEqual(profile.summary(), {"samples": 5, "peak": 500,
+                                             "steady_state": 220,
+                                             "current": 240})
+
+        profile = MemoryProfile()
+        tracemalloc.start()
+        try:
+            data = [0.5] * 100000
+            profile.sample(1)
+            del data
+            profile.sample(2)
+        finally:
+            tracemalloc.stop()
+        self.assertEqual([generation for generation, _, _ in profile.samples],
+                         [1, 2])
+        self.assertGreaterEqual(profile.samples[0][1], 800000)
+        self.assertLess(profile.samples[1][1], profile.samples[0][1])
+        for _, current, peak in profile.samples:
+            self.assertLessEqual(current, peak)
+
+        # The peak of tracing started by others is not reset.
+        tracemalloc.start()
+        try:
+            data = [0.5] * 200000
+            del data
+            _, user_peak = tracemalloc.get_traced_memory()
+            profile = MemoryProfile(reset_peak=False)
+            data = [0.5] * 400000
+            del data
+            profile.sample(1)
+            data = [0.5] * 100000
+            del data
+            profile.sample(2)
+            self.assertGreaterEqual(tracemalloc.get_traced_memory()[1],
+                                    user_peak)
+        finally:
+            tracemalloc.stop()
+        self.assertGreaterEqual(profile.samples[0][2], 3200000)
+        # The peak of the second generation is not observable.
+        self.assertLess(profile.samples[1][2], 800000)
+        self.assertGreaterEqual(profile.samples[1][2],
+                                profile.samples[1][1])
+
+    ###########################################################################
+
+    def test_algorithm_memory_report(self):
+        """
+        Tests get_memory_report().
+        """
+
+        structures = ["current_populations", "previous_populations",
+                      "initial_population", "distance_cache", "lsh_index",
+                      "evaluation_stats", "evaluation_log", "tracer",
+                      "decoder", "total", "mapped_files"]
+
+        brkga = BrkgaMpIpr(**self.default_param_values)
+        report = brkga.get_memory_report()
+        self.assertEqual(list(report), structures)
+        self.assertEqual(report["current_populations"], sys.getsizeof([]))
+        self.assertEqual(report["tracer"], 0)
+
+        brkga.set_tracer(TraceRecorder())
+        brkga.initialize()
+        brkga.evolve(2)
+        report = brkga.get_memory_report()
+
+        # 3 populations of 10 chromosomes of 100 floats.
+        num_keys = 3 * 10 * self.chromosome_size
+        self.assertGreater(report["current_populations"], num_keys * 8)
+        self.assertGreater(report["previous_populations"], 0)
+        self.assertGreater(report["evaluation_stats"], 0)
+        self.assertGreater(report["tracer"], 0)
+        self.assertGreater(report["decoder"], 0)
+        self.assertEqual(report["distance_cache"], 0)
+        self.assertEqual(report["evaluation_log"], 0)
+        self.assertEqual(report["mapped_files"], 0)
+        self.assertEqual(report["total"],
+                         sum(report[name] for name in structures[:-2]))
+
+        # The decoder shares the instance with the test.
+        self.assertGreaterEqual(report["decoder"],
+                                deep_sizeof(self.instance))
+
+        # Compact keys take less memory.
+        param_values = deepcopy(self.default_param_values)
+        param_values["key_storage"] = KeyStorage.UINT16
+        brkga = BrkgaMpIpr(**param_values)
+        brkga.initialize()
+        compact = brkga.get_memory_report()
+        self.assertLess(compact["current_populations"],
+                        report["current_populations"] / 4)
+
+        # Mapped populations are out of the heap.
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        param_values["storage_directory"] = directory.name
+        brkga = BrkgaMpIpr(**param_values)
+        brkga.initialize()
+        mapped = brkga.get_memory_report()
+        self.assertGreaterEqual(mapped["mapped_files"], num_keys * 2)
+        self.assertLess(mapped["current_populations"],
+                        report["current_populations"])
+
+    ###########################################################################
+
+    def test_algorithm_memory_sampling(self):
+        """
+        Tests set_memory_sampling() and get_memory_profile().
+        """
+
+        brkga = BrkgaMpIpr(**self.default_param_values)
+        with self.assertRaises(RuntimeError) as context:
+            brkga.get_memory_profile()
+        self.assertEqual(str(context.exception).strip(),
+                         "The memory sampling is off. Call "
+                         "'set_memory_sampling(True)' before "
+                         "'get_memory_profile()'")
+
+        self.assertFalse(tracemalloc.is_tracing())
+        brkga.set_memory_sampling(True)
+        self.assertTrue(tracemalloc.is_tracing())
+        try:
+            brkga.initialize()
+            brkga.evolve(4)
+            profile = brkga.get_memory_profile()
+        finally:
+            brkga.set_memory_sampling(False)
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertRaises(RuntimeError, brkga.get_memory_profile)
+
+        self.assertEqual([generation for generation, _, _ in profile.samples],
+                         [1, 2, 3, 4])
+        summary = profile.summary()
+        self.assertEqual(summary["samples"], 4)
+        self.assertGreater(summary["steady_state"],
+                           3 * 10 * self.chromosome_size * 8)
+        self.assertGreaterEqual(summary["peak"], summary["steady_state"])
+
+        # Tracing started by others is not stopped.
+        tracemalloc.start()
+        try:
+            brkga.set_memory_sampling(True)
+            data = [0.5] * 200000
+            del data
+            _, user_peak = tracemalloc.get_traced_memory()
+            brkga.evolve(1)
+            self.assertEqual(len(brkga.get_memory_profile().samples), 1)
+            self.assertGreaterEqual(tracemalloc.get_traced_memory()[1],
+                                    user_peak)
+            brkga.set_memory_sampling(False)
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
+
+###############################################################################
+
+if __name__ == "__main__":
+    unittest.main()
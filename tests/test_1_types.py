@@ -110,6 +110,76 @@ class Test(unittest.TestCase):
 
     ###########################################################################
 
+    def test_copy_chromosome(self):
+        """
+        Tests copy_chromosome() function.
+        """
+
+        chromosome = BaseChromosome([0.1, 0.2, 0.3])
+        tmp = copy_chromosome(chromosome)
+        self.assertEqual(tmp, chromosome)
+        self.assertIsNot(tmp, chromosome)
+        self.assertIs(type(tmp), BaseChromosome)
+
+        class SchedulingChromosome(BaseChromosome):
+            def __init__(self, value):
+                super().__init__(value)
+                self.jobs = []
+
+        chromosome = SchedulingChromosome([0.1, 0.2, 0.3])
+        chromosome.jobs.append(1)
+        tmp = copy_chromosome(chromosome)
+        self.assertEqual(tmp, chromosome)
+        self.assertIs(type(tmp), SchedulingChromosome)
+        self.assertEqual(tmp.jobs, [1])
+        self.assertIsNot(tmp.jobs, chromosome.jobs)
+
+        # Populations copy each chromosome.
+        pop1 = Population()
+        pop1.chromosomes = [BaseChromosome([0.1, 0.2]), chromosome]
+        pop1.fitness = [(1.0, 0), (2.0, 1)]
+        pop2 = Population(pop1)
+        for chr1, chr2 in zip(pop1.chromosomes, pop2.chromosomes):
+            self.assertEqual(chr1, chr2)
+            self.assertIsNot(chr1, chr2)
+
+    ###########################################################################
+
+    def test_ReadOnlyView(self):
+        """
+        Tests ReadOnlyView methods.
+        """
+
+        data = [1.0, 2.0, 3.0, 4.0]
+        view = ReadOnlyView(data)
+        self.assertEqual(len(view), 4)
+        self.assertEqual(view, data)
+        self.assertEqual(view[1], 2.0)
+        self.assertEqual(view[-1], 4.0)
+        self.assertEqual(view[1:3], [2.0, 3.0])
+        self.assertEqual(list(view), data)
+        self.assertNotEqual(view, [1.0, 2.0])
+        self.assertNotEqual(view, "abcd")
+        self.assertRaises(IndexError, view.__getitem__, 4)
+        self.assertRaises(IndexError, view.__getitem__, -5)
+        self.assertRaises(TypeError, hash, view)
+        with self.assertRaises(TypeError):
+            view[0] = 10.0
+
+        data[0] = 10.0
+        self.assertEqual(view[0], 10.0)
+
+        pairs = [(1.0, 2), (2.0, 0), (3.0, 1)]
+        view = ReadOnlyView(pairs, lambda x: x[0], 2)
+        self.assertEqual(len(view), 2)
+        self.assertEqual(view, [1.0, 2.0])
+        self.assertEqual(view[-1], 2.0)
+        self.assertEqual(view[::-1], [2.0, 1.0])
+        self.assertRaises(IndexError, view.__getitem__, 2)
+        self.assertEqual(repr(view), "ReadOnlyView([1.0, 2.0])")
+
+    ###########################################################################
+
     def test_Population(self):
         """
         Tests BaseChromosome constructor.
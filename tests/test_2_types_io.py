@@ -21,6 +21,9 @@ ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 POSSIBILITY OF SUCH DAMAGE.
 """
 
+from array import array
+import os
+import sys
 import tempfile
 import unittest
 
@@ -28,6 +31,25 @@ from brkga_mp_ipr.types import *
 from brkga_mp_ipr.types_io import *
 from tests.paths_constants import *
 
+###############################################################################
+
+def write_npy(filename: str, descr: str, shape: tuple, data: bytes,
+              version: int = 1, fortran_order: bool = False) -> None:
+    """
+    Writes a .npy file as NumPy does.
+    """
+    header = (f"{{'descr': '{descr}', 'fortran_order': {fortran_order}, "
+              f"'shape': {shape}, }}").encode("latin1")
+    preamble_size = 10 if version == 1 else 12
+    header += b" " * (-(preamble_size + len(header) + 1) % 64) + b"\n"
+    with open(filename, "wb") as hd:
+        hd.write(b"\x93NUMPY" + bytes([version, 0]))
+        hd.write(len(header).to_bytes(2 if version == 1 else 4, "little"))
+        hd.write(header)
+        hd.write(data)
+
+###############################################################################
+
 class Test(unittest.TestCase):
     """
     Test units for types I/O functions.
@@ -164,6 +186,49 @@ reset_interval 600
         # TODO: From direct building
         #########################
 
+    ###########################################################################
+
+    def test_load_npy_matrix(self):
+        """
+        Test load_npy_matrix().
+        """
+
+        native = "<" if sys.byteorder == "little" else ">"
+        keys = [0.1 * i for i in range(12)]
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        filename = os.path.join(directory.name, "keys.npy")
+
+        for typecode, descr, version in [("d", "f8", 1), ("f", "f4", 1),
+                                         ("d", "f8", 2), ("d", "f8", 3)]:
+            data = array(typecode, keys)
+            write_npy(filename, native + descr, (3, 4), data.tobytes(),
+                      version)
+            matrix = load_npy_matrix(filename)
+            self.assertEqual(matrix.shape, (3, 4))
+            self.assertEqual(matrix.format, typecode)
+            self.assertTrue(matrix.readonly)
+            self.assertEqual(matrix.tolist(),
+                             [data[i:i + 4].tolist() for i in range(0, 12, 4)])
+
+        self.assertRaises(FileNotFoundError, load_npy_matrix,
+                          os.path.join(directory.name, "missing.npy"))
+
+        data = array("d", keys).tobytes()
+        for descr, shape, fortran_order, data_size in [
+                (native + "i8", (3, 4), False, 96),
+                (native + "f8", (12,), False, 96),
+                (native + "f8", (3, 4), True, 96),
+                (native + "f8", (0, 4), False, 0),
+                (native + "f8", (3, 4), False, 95)]:
+            write_npy(filename, descr, shape, data[:data_size],
+                      fortran_order=fortran_order)
+            self.assertRaises(LoadError, load_npy_matrix, filename)
+
+        with open(filename, "wb") as hd:
+            hd.write(b"\x93NUMPX" + bytes(100))
+        self.assertRaises(LoadError, load_npy_matrix, filename)
+
 ###############################################################################
 
 if __name__ == "__main__":
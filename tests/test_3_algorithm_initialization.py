@@ -21,9 +21,13 @@ ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 POSSIBILITY OF SUCH DAMAGE.
 """
 
+from array import array
 from copy import deepcopy
 import math
+import os
 from random import Random
+import sys
+import tempfile
 import unittest
 
 from brkga_mp_ipr.algorithm import BrkgaMpIpr
@@ -34,6 +38,7 @@ from brkga_mp_ipr.types_io import load_configuration
 from tests.instance import Instance
 from tests.decoders import SumDecode, RankDecode
 from tests.paths_constants import *
+from tests.test_2_types_io import write_npy
 
 ###############################################################################
 
@@ -525,6 +530,109 @@ class Test(unittest.TestCase):
 
     ###########################################################################
 
+    def test_set_initial_population_bulk(self):
+        """
+        Tests set_initial_population() method with matrices, distribution,
+        and known fitness values.
+        """
+
+        param_values = deepcopy(self.default_param_values)
+        param_values["chromosome_size"] = 3
+        param_values["params"].num_independent_populations = 2
+        brkga = BrkgaMpIpr(**param_values)
+
+        local_rng = Random(param_values["seed"])
+        keys = array("d", [local_rng.random() for _ in range(15 * 3)])
+        matrix = memoryview(keys).cast("B").cast("d", (15, 3))
+        rows = [keys[i:i + 3].tolist() for i in range(0, 45, 3)]
+
+        with self.assertRaises(ValueError) as context:
+            brkga.set_initial_population(matrix)
+        self.assertEqual(str(context.exception).strip(),
+                         "Number of given chromosomes (15) is large than "
+                         "the population size (10)")
+
+        with self.assertRaises(ValueError) as context:
+            brkga.set_initial_population(
+                memoryview(keys).cast("B").cast("d", (9, 5)))
+        self.assertEqual(str(context.exception).strip(),
+                         "Error on setting initial population: chromosomes "
+                         "do not have the required dimension (actual size: "
+                         "5, required size: 3)")
+
+        with self.assertRaises(ValueError) as context:
+            brkga.set_initial_population(keys)
+        self.assertEqual(str(context.exception).strip(),
+                         "Error on setting initial population: the "
+                         "chromosome matrix must be a two-dimensional array "
+                         "of floats in C order (actual dimensions: 1, "
+                         "format: d)")
+
+        with self.assertRaises(ValueError) as context:
+            brkga.set_initial_population(matrix, [0.0] * 14, distribute=True)
+        self.assertEqual(str(context.exception).strip(),
+                         "Number of given fitness values (14) differs from "
+                         "the number of chromosomes (15)")
+
+        brkga.set_initial_population(matrix[:10])
+        self.assertEqual(brkga._current_populations[0].chromosomes,
+                         rows[:10])
+        self.assertEqual(brkga._current_populations[1].chromosomes, [])
+
+        # Round-robin distribution.
+        brkga.set_initial_population(matrix, distribute=True)
+        self.assertEqual(brkga._current_populations[0].chromosomes,
+                         rows[0::2])
+        self.assertEqual(brkga._current_populations[1].chromosomes,
+                         rows[1::2])
+        self.assertTrue(all(
+            type(chromosome) is BaseChromosome
+            for chromosome in brkga._current_populations[0].chromosomes))
+
+        brkga.set_initial_population(
+            [BaseChromosome(row) for row in rows[:3]], distribute=True)
+        self.assertEqual(brkga._current_populations[0].chromosomes,
+                         [rows[0], rows[2]])
+        self.assertEqual(brkga._current_populations[1].chromosomes,
+                         [rows[1]])
+
+        # Known fitness values are not decoded again.
+        fitness_values = [-float(i) for i in range(15)]
+        brkga.set_initial_population(matrix, fitness_values, distribute=True)
+        brkga.initialize()
+        for pop_idx in range(2):
+            population = brkga._current_populations[pop_idx]
+            known = fitness_values[pop_idx::2]
+            self.assertEqual(
+                sorted(value for value, idx in population.fitness
+                       if idx < len(known)),
+                sorted(known))
+            self.assertTrue(all(
+                value >= 0.0 for value, idx in population.fitness
+                if idx >= len(known)))
+        self.assertEqual(brkga._initial_fitness, [[], []])
+
+        # Reset decodes everything.
+        brkga.reset()
+        self.assertTrue(all(value >= 0.0 for value, _ in
+                            brkga._current_populations[0].fitness))
+
+        # From .npy files.
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        filename = os.path.join(directory.name, "keys.npy")
+        native = "<" if sys.byteorder == "little" else ">"
+        write_npy(filename, native + "f4", (5, 3),
+                  array("f", keys[:15]).tobytes())
+
+        brkga = BrkgaMpIpr(**param_values)
+        brkga.set_initial_population(filename)
+        self.assertEqual(brkga._current_populations[0].chromosomes,
+                         [array("f", row).tolist() for row in rows[:5]])
+        self.assertEqual(brkga._initial_population, True)
+
+    ###########################################################################
+
     def test_set_bias_custom_function(self):
         """
         Tests set_bias_custom_function() method.
@@ -676,16 +784,11 @@ class Test(unittest.TestCase):
                              params.population_size)
             self.assertEqual(len(brkga._current_populations[i].fitness),
                              params.population_size)
-            self.assertEqual(len(brkga._previous_populations[i].chromosomes),
-                             params.population_size)
-            self.assertEqual(len(brkga._previous_populations[i].fitness),
-                             params.population_size)
-
-            self.assertEqual(brkga._current_populations[i].chromosomes,
-                             brkga._previous_populations[i].chromosomes)
 
-            self.assertIsNot(brkga._current_populations[i].chromosomes,
-                             brkga._previous_populations[i].chromosomes)
+            # The previous populations are allocated in the first evolution.
+            self.assertEqual(len(brkga._previous_populations[i].chromosomes),
+                             0)
+            self.assertEqual(len(brkga._previous_populations[i].fitness), 0)
 
             correct_order = True
             for j in range(1, brkga.params.population_size):
@@ -738,16 +841,11 @@ class Test(unittest.TestCase):
                              params.population_size)
             self.assertEqual(len(brkga._current_populations[i].fitness),
                              params.population_size)
-            self.assertEqual(len(brkga._previous_populations[i].chromosomes),
-                             params.population_size)
-            self.assertEqual(len(brkga._previous_populations[i].fitness),
-                             params.population_size)
 
-            self.assertEqual(brkga._current_populations[i].chromosomes,
-                             brkga._previous_populations[i].chromosomes)
-
-            self.assertIsNot(brkga._current_populations[i].chromosomes,
-                             brkga._previous_populations[i].chromosomes)
+            # The previous populations are allocated in the first evolution.
+            self.assertEqual(len(brkga._previous_populations[i].chromosomes),
+                             0)
+            self.assertEqual(len(brkga._previous_populations[i].fitness), 0)
         # end for
 
         old_chr = deepcopy(chromosomes[0])
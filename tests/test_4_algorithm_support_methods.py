@@ -351,6 +351,77 @@ class Test(unittest.TestCase):
 
     ###########################################################################
 
+    def test_get_views(self):
+        """
+        Tests get_best_chromosome_view(), get_chromosome_view(),
+        get_elite_matrix(), and get_fitness_array() methods.
+        """
+
+        param_values = deepcopy(self.default_param_values)
+        param_values["params"].num_independent_populations = 3
+        brkga = BrkgaMpIpr(**param_values)
+
+        # Not initialized
+        for method, args in [("get_best_chromosome_view", ()),
+                             ("get_chromosome_view", (0, 0)),
+                             ("get_elite_matrix", (0,)),
+                             ("get_fitness_array", (0,))]:
+            with self.assertRaises(RuntimeError) as context:
+                getattr(brkga, method)(*args)
+            self.assertEqual(str(context.exception).strip(),
+                             f"The algorithm hasn't been initialized. "
+                             f"Call 'initialize()' before '{method}()'")
+
+        brkga.initialize()
+
+        # Test invalid indices.
+        for method, args, message in [
+                ("get_chromosome_view", (-1, 0), "[0, 2]: -1"),
+                ("get_elite_matrix", (3,), "[0, 2]: 3"),
+                ("get_fitness_array", (-1,), "[0, 2]: -1")]:
+            with self.assertRaises(ValueError) as context:
+                getattr(brkga, method)(*args)
+            self.assertEqual(str(context.exception).strip(),
+                             "Population must be in " + message)
+
+        with self.assertRaises(ValueError) as context:
+            brkga.get_chromosome_view(0, 10)
+        self.assertEqual(str(context.exception).strip(),
+                         "Chromosome position must be in [0, 9]: 10")
+
+        # The views match the copies, but cannot change the populations.
+        best = brkga.get_best_chromosome_view()
+        self.assertEqual(best, brkga.get_best_chromosome())
+        with self.assertRaises(TypeError):
+            best[0] = 0.0
+
+        for population_index in range(3):
+            population = brkga._current_populations[population_index]
+            for position in [0, 5, 9]:
+                self.assertEqual(
+                    brkga.get_chromosome_view(population_index, position),
+                    brkga.get_chromosome(population_index, position))
+
+            elite = brkga.get_elite_matrix(population_index)
+            self.assertEqual(len(elite), brkga.elite_size)
+            for position, row in enumerate(elite):
+                self.assertEqual(
+                    row, brkga.get_chromosome(population_index, position))
+
+            fitness = brkga.get_fitness_array(population_index)
+            self.assertEqual(fitness, [x[0] for x in population.fitness])
+            with self.assertRaises(TypeError):
+                fitness[0] = 0.0
+
+        # The views reflect the current populations.
+        view = brkga.get_chromosome_view(0, 0)
+        chromosome = brkga._current_populations[0].chromosomes[
+            brkga._current_populations[0].fitness[0][1]]
+        chromosome[0] = 0.123
+        self.assertEqual(view[0], 0.123)
+
+    ###########################################################################
+
     def test_get_current_population(self):
         """
         Tests get_current_population() method.
@@ -90,7 +90,80 @@ class Test(unittest.TestCase):
 
         param_values = deepcopy(self.default_param_values)
         brkga = BrkgaMpIpr(**param_values)
-        self.assertRaises(NotImplementedError, brkga.exchange_elite, 0)
+
+        # Not initialized
+        with self.assertRaises(RuntimeError) as context:
+            brkga.exchange_elite(1)
+        self.assertEqual(str(context.exception).strip(),
+                         "The algorithm hasn't been initialized. "
+                         "Call 'initialize()' before 'exchange_elite()'")
+
+        brkga.initialize()
+        for num_immigrants in [0, 5, 6]:
+            with self.assertRaises(ValueError) as context:
+                brkga.exchange_elite(num_immigrants)
+            self.assertEqual(str(context.exception).strip(),
+                             f"Number of immigrants ({num_immigrants}) less "
+                             f"than one, or larger than or equal to "
+                             f"population size / num_independent_populations "
+                             f"(5)")
+
+        for sense in Sense:
+            for key_storage in [KeyStorage.FLOAT64, KeyStorage.UINT16]:
+                param_values = deepcopy(self.default_param_values)
+                param_values["sense"] = sense
+                param_values["key_storage"] = key_storage
+                brkga = BrkgaMpIpr(**param_values)
+                brkga.initialize()
+                brkga.evolve(2)
+
+                num_immigrants = 2
+                num_populations = brkga.params.num_independent_populations
+                population_size = brkga.params.population_size
+                before = [
+                    [(brkga.get_current_population(i).fitness[m][0],
+                      brkga.get_chromosome(i, m))
+                     for m in range(population_size)]
+                    for i in range(num_populations)
+                ]
+
+                brkga.exchange_elite(num_immigrants)
+
+                for i in range(num_populations):
+                    # Each population keeps its best individuals, and gets
+                    # the best ones of the others instead of its worst.
+                    expected = before[i][:population_size -
+                                         2 * num_immigrants]
+                    for j in range(num_populations):
+                        if j != i:
+                            expected += before[j][:num_immigrants]
+
+                    population = brkga.get_current_population(i)
+                    after = [(population.fitness[m][0],
+                              brkga.get_chromosome(i, m))
+                             for m in range(population_size)]
+                    self.assertEqual(
+                        sorted(value for value, _ in after),
+                        sorted(value for value, _ in expected))
+                    for item in expected:
+                        self.assertIn(item, after)
+
+                    self.assertEqual(
+                        population.fitness,
+                        sorted(population.fitness,
+                               reverse=(sense == Sense.MAXIMIZE)))
+                    self.assertEqual(
+                        sorted(idx for _, idx in population.fitness),
+                        list(range(population_size)))
+
+        # Nothing to exchange.
+        param_values = deepcopy(self.default_param_values)
+        param_values["params"].num_independent_populations = 1
+        brkga = BrkgaMpIpr(**param_values)
+        brkga.initialize()
+        fitness = list(brkga.get_current_population(0).fitness)
+        brkga.exchange_elite(1)
+        self.assertEqual(brkga.get_current_population(0).fitness, fitness)
 
     ###########################################################################
 
@@ -156,9 +229,193 @@ class Test(unittest.TestCase):
         """
 
         param_values = deepcopy(self.default_param_values)
+        params = param_values["params"]
+        brkga = BrkgaMpIpr(**param_values)
+
+        local_rng = Random(param_values["seed"])
+        local_chr = BaseChromosome([
+            local_rng.random() for _ in range(param_values["chromosome_size"])
+        ])
+
+        with self.assertRaises(RuntimeError) as context:
+            brkga.inject_chromosome(local_chr, 0, 0)
+        self.assertEqual(str(context.exception).strip(),
+                         "The algorithm hasn't been initialized. "
+                         "Call 'initialize()' before 'inject_chromosome()'")
+
+        brkga.initialize()
+
+        with self.assertRaises(ValueError) as context:
+            brkga.inject_chromosome(local_chr, -1, 0)
+        self.assertEqual(str(context.exception).strip(),
+                         "Population must be in [0, 2]: -1")
+
+        with self.assertRaises(ValueError) as context:
+            brkga.inject_chromosome(local_chr, 3, 0)
+        self.assertEqual(str(context.exception).strip(),
+                         "Population must be in [0, 2]: 3")
+
+        with self.assertRaises(ValueError) as context:
+            brkga.inject_chromosome(local_chr, 0, -1)
+        self.assertEqual(str(context.exception).strip(),
+                         "Chromosome position must be in [0, 9]: -1")
+
+        with self.assertRaises(ValueError) as context:
+            brkga.inject_chromosome(local_chr, 0, params.population_size)
+        self.assertEqual(str(context.exception).strip(),
+                         "Chromosome position must be in [0, 9]: 10")
+
+        with self.assertRaises(ValueError) as context:
+            brkga.inject_chromosome(local_chr[1:], 0, 0)
+        self.assertEqual(str(context.exception).strip(),
+                         "Wrong chromosome size: 99 != 100")
+
+        # Inject a chromosome without fitness, so it must be decoded.
+        expected_chr = deepcopy(local_chr)
+        expected_fitness = param_values["decoder"].decode(expected_chr,
+                                                          rewrite=True)
+        brkga.inject_chromosome(local_chr, 1, params.population_size - 1)
+        pop = brkga._current_populations[1]
+        self.assertIn((expected_fitness,
+                       pop.fitness[[x[0] for x in pop.fitness]
+                                   .index(expected_fitness)][1]),
+                      pop.fitness)
+        self.assertIn(expected_chr, pop.chromosomes)
+        self.assertEqual(pop.fitness,
+                         sorted(pop.fitness, reverse=True))
+
+        # Inject the best chromosome ever with a given fitness.
+        brkga.inject_chromosome(local_chr, 2, 5, 1000.0)
+        self.assertEqual(brkga.get_best_fitness(), 1000.0)
+        self.assertEqual(brkga.get_best_chromosome(), local_chr)
+        self.assertEqual(brkga.get_chromosome(2, 0), local_chr)
+        pop = brkga._current_populations[2]
+        self.assertEqual(pop.fitness, sorted(pop.fitness, reverse=True))
+
+        # Now, the worst for a minimization problem.
+        param_values["sense"] = Sense.MINIMIZE
+        brkga = BrkgaMpIpr(**param_values)
+        brkga.initialize()
+        brkga.inject_chromosome(local_chr, 0, 0, 1000.0)
+        pop = brkga._current_populations[0]
+        self.assertEqual(pop.fitness[-1][0], 1000.0)
+        self.assertEqual(pop.chromosomes[pop.fitness[-1][1]], local_chr)
+        self.assertEqual(pop.fitness, sorted(pop.fitness))
+
+        # A decoder failure leaves the population untouched.
+        class FailingDecode():
+            def decode(self, chromosome: BaseChromosome,
+                       rewrite: bool) -> float:
+                raise ArithmeticError("decoding failed")
+
+        expected_fitness = list(pop.fitness)
+        expected_chrs = deepcopy(pop.chromosomes)
+        brkga._decoder = FailingDecode()
+        with self.assertRaises(ArithmeticError):
+            brkga.inject_chromosome(local_chr, 0, 3)
+        self.assertEqual(pop.fitness, expected_fitness)
+        self.assertEqual(pop.chromosomes, expected_chrs)
+
+        brkga._decoder = param_values["decoder"]
+        brkga.evolve(1)
+        self.assertEqual(len(brkga._current_populations[0].fitness),
+                         params.population_size)
+
+    ###########################################################################
+
+    def test_inject_chromosomes(self):
+        """
+        Tests inject_chromosomes() method.
+        """
+
+        param_values = deepcopy(self.default_param_values)
+        params = param_values["params"]
         brkga = BrkgaMpIpr(**param_values)
-        self.assertRaises(NotImplementedError, brkga.inject_chromosome,
-                          BaseChromosome(), 0, 0, 0)
+
+        local_rng = Random(param_values["seed"])
+        local_chrs = [
+            BaseChromosome([
+                local_rng.random()
+                for _ in range(param_values["chromosome_size"])
+            ])
+            for _ in range(4)
+        ]
+
+        with self.assertRaises(RuntimeError) as context:
+            brkga.inject_chromosomes(local_chrs, 0)
+        self.assertEqual(str(context.exception).strip(),
+                         "The algorithm hasn't been initialized. "
+                         "Call 'initialize()' before 'inject_chromosomes()'")
+
+        brkga.initialize()
+
+        with self.assertRaises(ValueError) as context:
+            brkga.inject_chromosomes(local_chrs * 3, 0)
+        self.assertEqual(str(context.exception).strip(),
+                         "Number of given chromosomes (12) is large than "
+                         "the population size (10)")
+
+        with self.assertRaises(ValueError) as context:
+            brkga.inject_chromosomes(local_chrs, 0, [0, 1])
+        self.assertEqual(str(context.exception).strip(),
+                         "Number of positions (2) does not match the number "
+                         "of chromosomes (4)")
+
+        with self.assertRaises(ValueError) as context:
+            brkga.inject_chromosomes(local_chrs, 0, fitness=[0.0])
+        self.assertEqual(str(context.exception).strip(),
+                         "Number of fitness values (1) does not match the "
+                         "number of chromosomes (4)")
+
+        with self.assertRaises(ValueError) as context:
+            brkga.inject_chromosomes(local_chrs, 0, [0, 1, 1, 2])
+        self.assertEqual(str(context.exception).strip(),
+                         "Repeated chromosome position: 1")
+
+        with self.assertRaises(ValueError) as context:
+            brkga.inject_chromosomes(local_chrs, 0, [0, 1, 2, 10])
+        self.assertEqual(str(context.exception).strip(),
+                         "Chromosome position must be in [0, 9]: 10")
+
+        with self.assertRaises(ValueError) as context:
+            brkga.inject_chromosomes(local_chrs + [local_chrs[0][1:]], 0)
+        self.assertEqual(str(context.exception).strip(),
+                         "Wrong chromosome size for chromosome 4: 99 != 100")
+
+        # Replace the worst ones, decoding all of them. The result must be the
+        # same as injecting one by one over the original worst ones.
+        other = deepcopy(brkga)
+        worst_indices = [
+            idx for _, idx in other._current_populations[1].fitness[-4:]
+        ]
+        brkga.inject_chromosomes(local_chrs, 1)
+        for chromosome, idx in zip(local_chrs, worst_indices):
+            position = [
+                x[1] for x in other._current_populations[1].fitness
+            ].index(idx)
+            other.inject_chromosome(chromosome, 1, position)
+
+        pop = brkga._current_populations[1]
+        other_pop = other._current_populations[1]
+        self.assertEqual(pop.fitness, sorted(pop.fitness, reverse=True))
+        self.assertEqual(
+            sorted((value, pop.chromosomes[idx])
+                   for value, idx in pop.fitness),
+            sorted((value, other_pop.chromosomes[idx])
+                   for value, idx in other_pop.fitness)
+        )
+
+        # Mix of given and unknown fitness values at given positions.
+        fitness = [1000.0, math.inf, -1.0, math.inf]
+        brkga.inject_chromosomes(local_chrs, 2, [0, 3, 5, 9], fitness)
+        pop = brkga._current_populations[2]
+        self.assertEqual(len(pop.fitness), params.population_size)
+        self.assertEqual(pop.fitness, sorted(pop.fitness, reverse=True))
+        self.assertEqual(sorted(x[1] for x in pop.fitness),
+                         list(range(params.population_size)))
+        self.assertEqual(brkga.get_chromosome(2, 0), local_chrs[0])
+        self.assertEqual(pop.fitness[-1][0], -1.0)
+        self.assertEqual(pop.chromosomes[pop.fitness[-1][1]], local_chrs[2])
 
 
 ###############################################################################
@@ -28,9 +28,9 @@ import dill as pickle
 import math
 import unittest
 
-from brkga_mp_ipr.algorithm import BrkgaMpIpr
+from brkga_mp_ipr.algorithm import BrkgaMpIpr, PROFILE_PHASES
 from brkga_mp_ipr.enums import *
-from brkga_mp_ipr.types import BaseChromosome, BrkgaParams
+from brkga_mp_ipr.types import BaseChromosome, BrkgaParams, EventSummary
 from brkga_mp_ipr.types_io import load_configuration
 
 from tests.instance import Instance
@@ -139,12 +139,25 @@ class Test(unittest.TestCase):
                                 brkga._previous_populations[i].chromosomes)
 
             # The current the from this generation is equal to the previous
-            # of the next generation.
-            self.assertEqual(current[i].chromosomes,
-                             brkga._previous_populations[i].chromosomes)
+            # of the next generation, but the elite chromosomes, which are
+            # moved to the next generation.
             self.assertEqual(current[i].fitness,
                              brkga._previous_populations[i].fitness)
 
+            elite_indices = set(idx for _, idx in
+                                current[i].fitness[:brkga.elite_size])
+            for idx, chromosome in enumerate(current[i].chromosomes):
+                if idx not in elite_indices:
+                    self.assertEqual(
+                        chromosome,
+                        brkga._previous_populations[i].chromosomes[idx])
+
+            new_chromosomes = brkga._current_populations[i].chromosomes
+            for j, (_, idx) in enumerate(
+                    current[i].fitness[:brkga.elite_size]):
+                self.assertEqual(current[i].chromosomes[idx],
+                                 new_chromosomes[j])
+
             # The previous of this generation is lost. Just make sure that
             # the internal swap gets the new generation, not the current one.
             self.assertNotEqual(previous[i].chromosomes,
@@ -156,6 +169,37 @@ class Test(unittest.TestCase):
 
     ###########################################################################
 
+    def test_evolve_population_buffer(self):
+        """
+        Tests that the first evolve_population() allocates the buffer of the
+        next generation without copying the current population.
+        """
+
+        class CountedChromosome(BaseChromosome):
+            copies = 0
+
+            def __deepcopy__(self, memo):
+                CountedChromosome.copies += 1
+                return CountedChromosome(self)
+
+        param_values = deepcopy(self.default_param_values)
+        param_values["chrmosome_type"] = CountedChromosome
+        brkga = BrkgaMpIpr(**param_values)
+        brkga.initialize()
+        self.assertEqual(len(brkga._previous_populations[0].chromosomes), 0)
+
+        brkga.evolve_population(0)
+        self.assertEqual(CountedChromosome.copies, 0)
+        for population in (brkga._current_populations[0],
+                           brkga._previous_populations[0]):
+            self.assertEqual(len(population.chromosomes),
+                             brkga.params.population_size)
+            for chromosome in population.chromosomes:
+                self.assertIsInstance(chromosome, CountedChromosome)
+                self.assertEqual(len(chromosome), self.chromosome_size)
+
+    ###########################################################################
+
     def test_evolve_population1(self):
         """
         Tests evolve_population() method.
@@ -315,6 +359,188 @@ class Test(unittest.TestCase):
 
     ###########################################################################
 
+    def test_sort_fitness(self):
+        """
+        Tests _sort_fitness() method, which must produce the same order as
+        sorting the fitness pairs, even with ties.
+        """
+
+        rng = Random(2718)
+        for sense in Sense:
+            param_values = deepcopy(self.default_param_values)
+            param_values["sense"] = sense
+            brkga = BrkgaMpIpr(**param_values)
+
+            for _ in range(20):
+                # An already sorted block followed by new values.
+                size = rng.randint(1, 50)
+                elite_size = rng.randint(0, size)
+                values = sorted([float(rng.randint(0, 10))
+                                 for _ in range(elite_size)],
+                                reverse=(sense == Sense.MAXIMIZE))
+                values += [float(rng.randint(0, 10))
+                           for _ in range(size - elite_size)]
+
+                fitness = [(value, i) for i, value in enumerate(values)]
+                expected = sorted(fitness, reverse=(sense == Sense.MAXIMIZE))
+                brkga._sort_fitness(fitness)
+                self.assertEqual(fitness, expected)
+
+    ###########################################################################
+
+    def test_profile(self):
+        """
+        Tests set_profiling(), get_profile(), and reset_profile() methods.
+        """
+
+        param_values = deepcopy(self.default_param_values)
+        brkga = BrkgaMpIpr(**param_values)
+        brkga.initialize()
+
+        with self.assertRaises(RuntimeError) as context:
+            brkga.get_profile()
+        self.assertEqual(str(context.exception).strip(),
+                         "The profiling is off. Call 'set_profiling(True)' "
+                         "before 'get_profile()'")
+
+        # Profiling does not change the evolution.
+        reference = BrkgaMpIpr(**param_values)
+        reference.initialize()
+        brkga.set_profiling(True)
+        brkga.evolve(3)
+        brkga.evolve_population(1)
+        reference.evolve(3)
+        reference.evolve_population(1)
+        self.assertEqual(brkga.get_best_chromosome(),
+                         reference.get_best_chromosome())
+
+        num_offspring = brkga.params.population_size - brkga.elite_size - \
+            brkga.num_mutants
+        profile = brkga.get_profile()
+        self.assertEqual(len(profile), 3)
+        for pop_idx, num_generations in enumerate([3, 4, 3]):
+            self.assertEqual(tuple(profile[pop_idx].keys()), PROFILE_PHASES)
+            self.assertEqual(
+                {phase: count for phase, (_, count)
+                 in profile[pop_idx].items()},
+                {
+                    "elite": num_generations,
+                    "selection": num_generations * num_offspring,
+                    "crossover": num_generations * num_offspring,
+                    "mutants": num_generations,
+                    "decoding": num_generations,
+                    "sorting": num_generations
+                })
+            self.assertTrue(all(
+                seconds > 0.0 for seconds, _ in profile[pop_idx].values()))
+
+        # The profile is a copy.
+        profile[0]["elite"] = (0.0, 0)
+        self.assertEqual(brkga.get_profile()[0]["elite"][1], 3)
+
+        brkga.reset_profile()
+        self.assertTrue(all(
+            entry == (0.0, 0)
+            for population in brkga.get_profile()
+            for entry in population.values()))
+
+        brkga.set_profiling(False)
+        self.assertRaises(RuntimeError, brkga.get_profile)
+        brkga.evolve(1)
+        brkga.reset_profile()
+        self.assertEqual(brkga.get_profile()[0]["sorting"], (0.0, 0))
+
+    ###########################################################################
+
+    def test_callbacks(self):
+        """
+        Tests register_callback() and unregister_callback() methods, and
+        the triggered events.
+        """
+
+        param_values = deepcopy(self.default_param_values)
+        brkga = BrkgaMpIpr(**param_values)
+        reference = BrkgaMpIpr(**param_values)
+
+        summaries = {event: [] for event in CallbackEvent}
+        callbacks = {
+            event: summaries[event].append for event in CallbackEvent
+        }
+        for event, callback in callbacks.items():
+            brkga.register_callback(event, callback)
+        brkga.register_callback("generation_end",
+                                summaries[CallbackEvent.GENERATION_END]
+                                .append)
+
+        brkga.initialize()
+        reference.initialize()
+        previous_best = brkga.get_best_fitness()
+        brkga.evolve(5)
+        reference.evolve(5)
+
+        # Callbacks do not change the evolution.
+        self.assertEqual(brkga.get_best_chromosome(),
+                         reference.get_best_chromosome())
+
+        # Two callbacks per generation and population.
+        generation_end = summaries[CallbackEvent.GENERATION_END]
+        self.assertEqual(len(generation_end), 2 * 5 * 3)
+        for k, summary in enumerate(generation_end[::2]):
+            self.assertIsInstance(summary, EventSummary)
+            self.assertEqual(summary.event, CallbackEvent.GENERATION_END)
+            self.assertEqual(summary.population_index, k % 3)
+            self.assertEqual(summary.generation, k // 3 + 1)
+            self.assertGreaterEqual(summary.global_best_fitness,
+                                    summary.best_fitness)
+            self.assertGreater(summary.elapsed_time, 0.0)
+            self.assertEqual(summary.num_immigrants, 0)
+        self.assertEqual(generation_end[-1].best_fitness,
+                         brkga.get_current_population(2).fitness[0][0])
+        self.assertEqual(generation_end[-1].global_best_fitness,
+                         brkga.get_best_fitness())
+
+        # The improvements are strictly increasing (maximization).
+        improvements = [summary.global_best_fitness for summary in
+                        summaries[CallbackEvent.IMPROVEMENT]]
+        self.assertEqual(improvements, sorted(set(improvements)))
+        if improvements:
+            self.assertGreater(improvements[0], previous_best)
+            self.assertEqual(improvements[-1], brkga.get_best_fitness())
+
+        # With a large tolerance, all populations converge once.
+        self.assertEqual(summaries[CallbackEvent.ISLAND_CONVERGED], [])
+        brkga.convergence_tolerance = math.inf
+        brkga.evolve(2)
+        self.assertEqual(
+            [summary.population_index for summary in
+             summaries[CallbackEvent.ISLAND_CONVERGED]], [0, 1, 2])
+
+        brkga.exchange_elite(2)
+        migration = summaries[CallbackEvent.MIGRATION]
+        self.assertEqual(len(migration), 1)
+        self.assertEqual(migration[0].population_index, None)
+        self.assertEqual(migration[0].num_immigrants, 2)
+        self.assertEqual(migration[0].best_fitness, brkga.get_best_fitness())
+
+        # A callback returning True stops the evolution.
+        brkga.register_callback(
+            CallbackEvent.GENERATION_END,
+            lambda summary: summary.generation >= 10)
+        brkga.evolve(100)
+        self.assertEqual(brkga._generations, [10, 10, 10])
+        brkga.evolve(1)
+        self.assertEqual(brkga._generations, [11, 11, 11])
+
+        for event, callback in callbacks.items():
+            brkga.unregister_callback(event, callback)
+        with self.assertRaises(ValueError) as context:
+            brkga.unregister_callback(CallbackEvent.MIGRATION,
+                                      callbacks[CallbackEvent.MIGRATION])
+        self.assertEqual(str(context.exception).strip(),
+                         "Callback not registered for MIGRATION")
+
+    ###########################################################################
+
     def test_evolve(self):
         """
         Tests evolve() method.
@@ -23,16 +23,20 @@ POSSIBILITY OF SUCH DAMAGE.
 
 from copy import deepcopy
 import math
+import os
 from random import Random
+import tempfile
+from time import time
 import unittest
 
 from brkga_mp_ipr.algorithm import BrkgaMpIpr
+from brkga_mp_ipr.distances import HammingDistance, LSHIndex
 from brkga_mp_ipr.enums import *
 from brkga_mp_ipr.types import BaseChromosome, BrkgaParams
 from brkga_mp_ipr.types_io import load_configuration
 
 from tests.instance import Instance
-from tests.decoders import SumDecode, RankDecode
+from tests.decoders import SumDecode, RankDecode, BatchSumDecode
 from tests.paths_constants import *
 
 ###############################################################################
@@ -90,9 +94,65 @@ class Test(unittest.TestCase):
         """
 
         param_values = deepcopy(self.default_param_values)
+        param_values["decoder"] = BatchSumDecode(self.instance)
+        decoder = param_values["decoder"]
         brkga = BrkgaMpIpr(**param_values)
-        self.assertRaises(NotImplementedError, brkga._direct_path_relink,
-            None, None, None, None, 0, 0, 0.0)
+        brkga.initialize()
+
+        local_rng = Random(param_values["seed"])
+        chr1 = BaseChromosome([
+            local_rng.random() for _ in range(self.chromosome_size)
+        ])
+        chr2 = BaseChromosome([
+            local_rng.random() for _ in range(self.chromosome_size)
+        ])
+        worst = (-math.inf, None)
+
+        # Full path, key by key: each step evaluates all remaining keys in
+        # one batch.
+        decoder.batch_sizes = []
+        brkga._pr_start_time = time()
+        best_found = brkga._direct_path_relink(
+            deepcopy(chr1), deepcopy(chr2), None, worst, 1, 0, 1.0)
+        self.assertEqual(decoder.batch_sizes,
+                         list(range(self.chromosome_size, 0, -1)))
+        self.assertEqual(
+            best_found[0],
+            self.sum_decoder.decode(deepcopy(best_found[1]), rewrite=False))
+
+        # An incumbent that cannot be beaten is kept.
+        unbeatable = (math.inf, chr1)
+        self.assertIs(
+            brkga._direct_path_relink(deepcopy(chr1), deepcopy(chr2), None,
+                                      unbeatable, 1, 0, 1.0),
+            unbeatable)
+
+        # Blocks of 10 keys and half path.
+        decoder.batch_sizes = []
+        brkga._direct_path_relink(deepcopy(chr1), deepcopy(chr2), None,
+                                  worst, 10, 0, 0.5)
+        self.assertEqual(decoder.batch_sizes, [10, 9, 8, 7, 6])
+
+        # The last block is smaller than the others.
+        decoder.batch_sizes = []
+        brkga._direct_path_relink(deepcopy(chr1), deepcopy(chr2), None,
+                                  worst, 30, 0, 1.0)
+        self.assertEqual(decoder.batch_sizes, [4, 3, 2, 1])
+
+        # Blocks with the same keys are not evaluated.
+        chr3 = deepcopy(chr1)
+        chr3[0:50] = chr2[0:50]
+        decoder.batch_sizes = []
+        brkga._direct_path_relink(deepcopy(chr1), chr3, None, worst, 10, 0,
+                                  1.0)
+        self.assertEqual(decoder.batch_sizes, [5, 4, 3, 2, 1])
+
+        # Time is over, so only one batch is evaluated.
+        decoder.batch_sizes = []
+        brkga._pr_start_time = time() - 10
+        brkga._direct_path_relink(deepcopy(chr1), deepcopy(chr2), None,
+                                  worst, 1, 1, 1.0)
+        self.assertEqual(decoder.batch_sizes, [self.chromosome_size])
 
     ###########################################################################
 
@@ -102,9 +162,108 @@ class Test(unittest.TestCase):
         """
 
         param_values = deepcopy(self.default_param_values)
+        param_values["decoder"] = BatchSumDecode(self.instance)
+        decoder = param_values["decoder"]
         brkga = BrkgaMpIpr(**param_values)
-        self.assertRaises(NotImplementedError, brkga._permutation_based_path_relink,
-            None, None, None, None, 0, 0, 0.0)
+        brkga.initialize()
+
+        local_rng = Random(param_values["seed"])
+        chr1 = BaseChromosome([
+            local_rng.random() for _ in range(self.chromosome_size)
+        ])
+        chr2 = BaseChromosome([
+            local_rng.random() for _ in range(self.chromosome_size)
+        ])
+        worst = (-math.inf, None)
+
+        def permutation(chromosome):
+            return sorted(range(len(chromosome)), key=chromosome.__getitem__)
+
+        # Full path. At the end, the base and guide chromosomes must induce
+        # the same permutation, and each batch must have one candidate per
+        # misplaced rank.
+        base = deepcopy(chr1)
+        guide = deepcopy(chr2)
+        decoder.batch_sizes = []
+        brkga._pr_start_time = time()
+        best_found = brkga._permutation_based_path_relink(
+            base, guide, None, worst, 1, 0, 1.0)
+        self.assertEqual(permutation(base), permutation(guide))
+        self.assertEqual(sorted(base), sorted(chr1))
+        self.assertEqual(sorted(guide), sorted(chr2))
+        self.assertEqual(
+            best_found[0],
+            self.sum_decoder.decode(deepcopy(best_found[1]), rewrite=False))
+        self.assertEqual(decoder.batch_sizes,
+                         sorted(decoder.batch_sizes, reverse=True))
+        self.assertLessEqual(decoder.batch_sizes[0], self.chromosome_size)
+
+        # Check the batch contents against a naive implementation that
+        # re-sorts the chromosomes at each step.
+        base = deepcopy(chr1)
+        guide = deepcopy(chr2)
+        brkga._permutation_based_path_relink(base, guide, None, worst, 1, 0,
+                                             0.1)
+        naive_base = deepcopy(chr1)
+        naive_guide = deepcopy(chr2)
+        for _ in range(int(0.1 * self.chromosome_size)):
+            perm_base = permutation(naive_base)
+            perm_guide = permutation(naive_guide)
+            best_value = -math.inf
+            best_candidate = None
+            for pos_base, pos_guide in zip(perm_base, perm_guide):
+                if pos_base == pos_guide:
+                    continue
+                candidate = deepcopy(naive_base)
+                candidate[pos_base], candidate[pos_guide] = \
+                    candidate[pos_guide], candidate[pos_base]
+                value = self.sum_decoder.decode(candidate, rewrite=False)
+                if value > best_value:
+                    best_value = value
+                    best_candidate = candidate
+            naive_base[:] = best_candidate
+            naive_base, naive_guide = naive_guide, naive_base
+        self.assertEqual(sorted([base, guide]),
+                         sorted([naive_base, naive_guide]))
+
+        # Without decode_batch(), the swaps are evaluated in place, and the
+        # path is the same.
+        base = deepcopy(chr1)
+        guide = deepcopy(chr2)
+        batch_best = brkga._permutation_based_path_relink(
+            base, guide, None, worst, 1, 0, 0.5)
+        sequential_brkga = BrkgaMpIpr(**self.default_param_values)
+        sequential_brkga.initialize()
+        sequential_brkga._pr_start_time = time()
+        sequential_base = deepcopy(chr1)
+        sequential_guide = deepcopy(chr2)
+        self.assertEqual(
+            sequential_brkga._permutation_based_path_relink(
+                sequential_base, sequential_guide, None, worst, 1, 0, 0.5),
+            batch_best)
+        self.assertEqual([sequential_base, sequential_guide], [base, guide])
+
+        # Percentage limits the number of steps.
+        decoder.batch_sizes = []
+        brkga._permutation_based_path_relink(deepcopy(chr1), deepcopy(chr2),
+                                             None, worst, 1, 0, 0.05)
+        self.assertEqual(len(decoder.batch_sizes), 5)
+
+        # Same permutation, nothing to do.
+        decoder.batch_sizes = []
+        self.assertIs(
+            brkga._permutation_based_path_relink(deepcopy(chr1),
+                                                 deepcopy(chr1), None, worst,
+                                                 1, 0, 1.0),
+            worst)
+        self.assertEqual(decoder.batch_sizes, [])
+
+        # Time is over, so only one batch is evaluated.
+        decoder.batch_sizes = []
+        brkga._pr_start_time = time() - 10
+        brkga._permutation_based_path_relink(deepcopy(chr1), deepcopy(chr2),
+                                             None, worst, 1, 1, 1.0)
+        self.assertEqual(len(decoder.batch_sizes), 1)
 
     ###########################################################################
 
@@ -115,8 +274,237 @@ class Test(unittest.TestCase):
 
         param_values = deepcopy(self.default_param_values)
         brkga = BrkgaMpIpr(**param_values)
-        self.assertRaises(NotImplementedError, brkga.path_relink,
-            None, None, None, 0, 0.0)
+
+        def dist(chr1, chr2):
+            return float(sum((x < 0.5) != (y < 0.5)
+                             for x, y in zip(chr1, chr2)))
+
+        with self.assertRaises(RuntimeError) as context:
+            brkga.path_relink(PathRelinkingType.DIRECT,
+                              PathRelinkingSelection.BESTSOLUTION, dist,
+                              1, 0.0)
+        self.assertEqual(str(context.exception).strip(),
+                         "The algorithm hasn't been initialized. "
+                         "Call 'initialize()' before 'path_relink()'")
+
+        brkga.initialize()
+
+        with self.assertRaises(ValueError) as context:
+            brkga.path_relink(PathRelinkingType.DIRECT,
+                              PathRelinkingSelection.BESTSOLUTION, dist,
+                              1, 0.0, percentage=0.0)
+        self.assertEqual(str(context.exception).strip(),
+                         "Percentage/size of path relinking invalid, "
+                         "current: 0.0")
+
+        with self.assertRaises(ValueError) as context:
+            brkga.path_relink(PathRelinkingType.DIRECT,
+                              PathRelinkingSelection.BESTSOLUTION, dist,
+                              1, 0.0, block_size=0)
+        self.assertEqual(str(context.exception).strip(),
+                         "Block size must be larger than zero, current: 0")
+
+        # Too far from each other.
+        result = brkga.path_relink(PathRelinkingType.DIRECT,
+                                   PathRelinkingSelection.RANDOMELITE, dist,
+                                   10, self.chromosome_size + 1.0)
+        self.assertEqual(result, PathRelinkingResult.TOO_HOMOGENEOUS)
+
+        for pr_type, selection in zip(
+                [PathRelinkingType.DIRECT, PathRelinkingType.DIRECT,
+                 PathRelinkingType.PERMUTATION, PathRelinkingType.PERMUTATION],
+                list(PathRelinkingSelection) * 2):
+            best_fitness = brkga.get_best_fitness()
+            result = brkga.path_relink(pr_type, selection, dist, 10, 1.0,
+                                       block_size=5, percentage=0.2)
+            self.assertIn(result, [PathRelinkingResult.NO_IMPROVEMENT,
+                                   PathRelinkingResult.ELITE_IMPROVEMENT,
+                                   PathRelinkingResult.BEST_IMPROVEMENT])
+            if result == PathRelinkingResult.BEST_IMPROVEMENT:
+                self.assertGreater(brkga.get_best_fitness(), best_fitness)
+            else:
+                self.assertEqual(brkga.get_best_fitness(), best_fitness)
+
+            for pop in brkga._current_populations:
+                self.assertEqual(pop.fitness,
+                                 sorted(pop.fitness, reverse=True))
+                self.assertEqual(sorted(x[1] for x in pop.fitness),
+                                 list(range(brkga.params.population_size)))
+
+        # Relinking the pairs in a process pool must give the same result
+        # as relinking them serially.
+        param_values = deepcopy(self.default_param_values)
+        param_values["params"].num_independent_populations = 4
+        serial_brkga = BrkgaMpIpr(**param_values)
+        serial_brkga.initialize()
+        parallel_brkga = deepcopy(serial_brkga)
+        for pr_type in PathRelinkingType:
+            serial_result = serial_brkga.path_relink(
+                pr_type, PathRelinkingSelection.RANDOMELITE, dist, 10, 1.0,
+                block_size=5, percentage=0.3)
+            parallel_result = parallel_brkga.path_relink(
+                pr_type, PathRelinkingSelection.RANDOMELITE, dist, 10, 1.0,
+                block_size=5, percentage=0.3, num_workers=3)
+            self.assertEqual(serial_result, parallel_result)
+            for serial_pop, parallel_pop in \
+                zip(serial_brkga._current_populations,
+                    parallel_brkga._current_populations):
+                self.assertEqual(serial_pop.fitness, parallel_pop.fitness)
+                self.assertEqual(serial_pop.chromosomes,
+                                 parallel_pop.chromosomes)
+
+        # Only one population, so the pair comes from the same elite set.
+        param_values["params"].num_independent_populations = 1
+        brkga = BrkgaMpIpr(**param_values)
+        brkga.initialize()
+        result = brkga.path_relink(PathRelinkingType.DIRECT,
+                                   PathRelinkingSelection.BESTSOLUTION, dist,
+                                   1, 1.0)
+        self.assertNotEqual(result, PathRelinkingResult.TOO_HOMOGENEOUS)
+
+    ###########################################################################
+
+    def test_path_relink_pair_selection(self):
+        """
+        Tests the elite distance cache and the LSH index used to select the
+        path relink pairs.
+        """
+
+        param_values = deepcopy(self.default_param_values)
+        brkga = BrkgaMpIpr(**param_values)
+        brkga.initialize()
+
+        calls = []
+        def dist(chr1, chr2):
+            calls.append(1)
+            return float(sum((x < 0.5) != (y < 0.5)
+                             for x, y in zip(chr1, chr2)))
+
+        # The best solutions do not change when the relink fails, so the
+        # second selection uses the cached distance.
+        for _ in range(2):
+            result = brkga.path_relink(PathRelinkingType.DIRECT,
+                                       PathRelinkingSelection.BESTSOLUTION,
+                                       dist, 1, self.chromosome_size + 1.0)
+            self.assertEqual(result, PathRelinkingResult.TOO_HOMOGENEOUS)
+        num_pairs = brkga.params.num_independent_populations
+        self.assertEqual(brkga._pr_distance_cache.hits, num_pairs)
+        self.assertEqual(brkga._pr_distance_cache.misses, num_pairs)
+        self.assertEqual(len(calls), num_pairs)
+
+        # A new distance function resets the cache.
+        brkga.path_relink(PathRelinkingType.DIRECT,
+                          PathRelinkingSelection.BESTSOLUTION,
+                          lambda x, y: 0.0, 1, 1.0)
+        self.assertEqual(brkga._pr_distance_cache.misses, num_pairs)
+        self.assertEqual(brkga._pr_distance_cache.hits, 0)
+
+        # Random elite selection must not be affected by the cache.
+        cached_brkga = deepcopy(brkga)
+        for _ in range(3):
+            cached_brkga.path_relink(PathRelinkingType.DIRECT,
+                                     PathRelinkingSelection.RANDOMELITE,
+                                     dist, 10, 1.0, block_size=5,
+                                     percentage=0.2)
+            brkga._pr_distance_cache = None
+            brkga.path_relink(PathRelinkingType.DIRECT,
+                              PathRelinkingSelection.RANDOMELITE,
+                              dist, 10, 1.0, block_size=5, percentage=0.2)
+        for pop1, pop2 in zip(brkga._current_populations,
+                              cached_brkga._current_populations):
+            self.assertEqual(pop1.fitness, pop2.fitness)
+            self.assertEqual(pop1.chromosomes, pop2.chromosomes)
+
+        # The cached distances follow the rows changed by the evolution,
+        # the migration, the injection, and the path relink.
+        dist = HammingDistance()
+        for _ in range(3):
+            brkga.path_relink(PathRelinkingType.DIRECT,
+                              PathRelinkingSelection.RANDOMELITE,
+                              dist, 20, 1.0, block_size=5, percentage=0.2)
+            brkga.evolve(1)
+            brkga.exchange_elite(1)
+            brkga.inject_chromosome(
+                brkga.get_chromosome(0, brkga.elite_size - 1), 0, 0)
+        cache = brkga._pr_distance_cache
+        self.assertGreater(len(cache), 0)
+        for (slot1, slot2), value in cache._distances.items():
+            self.assertEqual(value, dist(
+                brkga._current_populations[slot1[0]].chromosomes[slot1[1]],
+                brkga._current_populations[slot2[0]].chromosomes[slot2[1]]))
+
+        # LSH index.
+        with self.assertRaises(ValueError) as context:
+            brkga.set_path_relink_lsh_index(LSHIndex(self.chromosome_size + 1))
+        self.assertEqual(str(context.exception).strip(),
+                         f"LSH index chromosome size differs from the "
+                         f"algorithm's: {self.chromosome_size + 1} != "
+                         f"{self.chromosome_size}")
+
+        brkga.set_path_relink_lsh_index(
+            LSHIndex(self.chromosome_size, order_based=False))
+        result = brkga.path_relink(PathRelinkingType.DIRECT,
+                                   PathRelinkingSelection.RANDOMELITE,
+                                   dist, 10, self.chromosome_size + 1.0)
+        self.assertEqual(result, PathRelinkingResult.TOO_HOMOGENEOUS)
+
+        del calls[:]
+        brkga._pr_distance_cache = None
+        result = brkga.path_relink(PathRelinkingType.PERMUTATION,
+                                   PathRelinkingSelection.RANDOMELITE,
+                                   dist, 10, 1.0, block_size=5,
+                                   percentage=0.2)
+        self.assertNotEqual(result, PathRelinkingResult.TOO_HOMOGENEOUS)
+        self.assertLessEqual(len(calls), 10 * num_pairs)
+
+        brkga.set_path_relink_lsh_index(None)
+        self.assertIsNone(brkga._pr_lsh_index)
+
+        # A single population with a single elite chromosome has no guide
+        # besides the base chromosome.
+        param_values = deepcopy(self.default_param_values)
+        param_values["params"].num_independent_populations = 1
+        param_values["params"].elite_percentage = 0.1
+        brkga = BrkgaMpIpr(**param_values)
+        self.assertEqual(brkga.elite_size, 1)
+        brkga.initialize()
+        brkga.set_path_relink_lsh_index(LSHIndex(self.chromosome_size))
+        for pr_type in (PathRelinkingType.DIRECT,
+                        PathRelinkingType.PERMUTATION):
+            result = brkga.path_relink(pr_type,
+                                       PathRelinkingSelection.RANDOMELITE,
+                                       HammingDistance(), 5, 0.0)
+            self.assertEqual(result, PathRelinkingResult.TOO_HOMOGENEOUS)
+
+    ###########################################################################
+
+    def test__path_relink_worker_copy(self):
+        """
+        Tests that the copy sent to the path relinking workers does not carry
+        the per-run state of the algorithm.
+        """
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        brkga = BrkgaMpIpr(**self.default_param_values)
+        brkga.set_profiling(True)
+        brkga.initialize()
+        brkga.evolve(1)
+        brkga.save_state(os.path.join(directory.name, "state.chk"),
+                         incremental=True)
+        brkga._initial_fitness[0].append(1.0)
+
+        worker_copy = brkga._path_relink_worker_copy()
+        self.assertIsNone(worker_copy._profile)
+        self.assertIsNone(worker_copy._checkpoint_log)
+        self.assertEqual(worker_copy._initial_fitness, [[], [], []])
+        self.assertEqual(worker_copy._current_populations, [])
+
+        # The original object keeps its state.
+        self.assertIsNotNone(brkga._profile)
+        self.assertIsNotNone(brkga._checkpoint_log)
+        self.assertEqual(brkga._initial_fitness[0], [1.0])
 
 ###############################################################################
 
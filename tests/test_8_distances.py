@@ -0,0 +1,227 @@
+"""
+test_distances.py: Tests for distance functions.
+
+(c) Copyright 2022, Carlos Eduardo de Andrade. All Rights Reserved.
+
+This code is released under LICENSE.md.
+
+Created on:  Oct 19, 2026 by ceandrade
+Last update: Oct 19, 2026 by ceandrade
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+"""
+
+from itertools import combinations
+from random import Random
+import unittest
+
+from brkga_mp_ipr.distances import DistanceFunctionBase, HammingDistance, \
+    KendallTauDistance, EliteDistanceCache, LSHIndex
+from brkga_mp_ipr.types import BaseChromosome
+
+###############################################################################
+
+class Test(unittest.TestCase):
+    """
+    Test units for distance functions.
+    """
+
+    ###########################################################################
+
+    def setUp(self):
+        """
+        Sets up some configurations.
+        """
+
+        Test.maxDiff = None
+
+        rng = Random(2700001)
+        self.chromosomes = [
+            BaseChromosome([rng.random() for _ in range(50)])
+            for _ in range(6)
+        ]
+
+    ###########################################################################
+
+    def test_DistanceFunctionBase(self):
+        """
+        Tests DistanceFunctionBase methods.
+        """
+
+        dist = DistanceFunctionBase()
+        self.assertRaises(NotImplementedError, dist, self.chromosomes[0],
+                          self.chromosomes[1])
+
+    ###########################################################################
+
+    def test_HammingDistance(self):
+        """
+        Tests HammingDistance methods.
+        """
+
+        chr1 = BaseChromosome([0.1, 0.2, 0.3, 0.4])
+        chr2 = BaseChromosome([0.1, 0.25, 0.3, 0.9])
+
+        self.assertEqual(HammingDistance()(chr1, chr1), 0.0)
+        self.assertEqual(HammingDistance()(chr1, chr2), 2.0)
+        self.assertEqual(HammingDistance(epsilon=0.0)(chr1, chr2), 2.0)
+        self.assertEqual(HammingDistance(epsilon=0.1)(chr1, chr2), 1.0)
+        self.assertEqual(HammingDistance(epsilon=0.5)(chr1, chr2), 0.0)
+        self.assertEqual(HammingDistance(normalized=True)(chr1, chr2), 0.5)
+
+        dist = HammingDistance(epsilon=0.2)
+        self.check_bulk_methods(dist)
+
+    ###########################################################################
+
+    def test_KendallTauDistance(self):
+        """
+        Tests KendallTauDistance methods.
+        """
+
+        chr1 = BaseChromosome([0.1, 0.2, 0.3, 0.4])
+        chr2 = BaseChromosome([0.4, 0.3, 0.2, 0.1])
+        chr3 = BaseChromosome([0.2, 0.1, 0.3, 0.4])
+
+        dist = KendallTauDistance()
+        self.assertEqual(dist(chr1, chr1), 0.0)
+        self.assertEqual(dist(chr1, chr2), 6.0)
+        self.assertEqual(dist(chr1, chr3), 1.0)
+        self.assertEqual(dist(chr2, chr3), 5.0)
+        self.assertEqual(KendallTauDistance(normalized=True)(chr1, chr2), 1.0)
+
+        # Compare against the quadratic definition.
+        def naive(chr1, chr2):
+            return float(sum(
+                (chr1[i] < chr1[j]) != (chr2[i] < chr2[j])
+                for i, j in combinations(range(len(chr1)), 2)
+            ))
+
+        for chr1, chr2 in combinations(self.chromosomes, 2):
+            self.assertEqual(dist(chr1, chr2), naive(chr1, chr2))
+            self.assertEqual(dist(chr1, chr2), dist(chr2, chr1))
+
+        self.check_bulk_methods(dist)
+        self.check_bulk_methods(KendallTauDistance(normalized=True))
+
+    ###########################################################################
+
+    def test_EliteDistanceCache(self):
+        """
+        Tests EliteDistanceCache methods.
+        """
+
+        dist = HammingDistance()
+        cache = EliteDistanceCache(dist)
+        chr0, chr1, chr2 = self.chromosomes[:3]
+
+        self.assertEqual(cache.distance((0, 0), chr0, (1, 0), chr1),
+                         dist(chr0, chr1))
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 1, 1))
+
+        # The chromosomes are not read on hits.
+        self.assertEqual(cache.distance((0, 0), None, (1, 0), None),
+                         dist(chr0, chr1))
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 1, 1))
+
+        cache.distance((0, 0), chr0, (0, 2), chr2)
+        cache.distance((0, 2), chr2, (1, 0), chr1)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 3, 3))
+
+        # Rewritten rows are invalidated.
+        cache.invalidate((0, 2))
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.distance((0, 2), chr1, (1, 0), chr1), 0.0)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 4, 2))
+        cache.invalidate((5, 5))
+        self.assertEqual(len(cache), 2)
+
+        # Moved rows keep their distances, and the other rows of the
+        # population are discarded.
+        cache.distance((0, 3), chr2, (0, 0), chr0)
+        cache.move_rows(0, {0: 1, 3: 0})
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.distance((0, 1), None, (1, 0), None),
+                         dist(chr0, chr1))
+        self.assertEqual(cache.distance((0, 0), None, (0, 1), None),
+                         dist(chr2, chr0))
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (3, 5, 2))
+
+        cache.move_rows(1, {})
+        self.assertEqual(len(cache), 1)
+        cache.move_rows(0, {})
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache._pairs_by_slot, {})
+
+    ###########################################################################
+
+    def test_LSHIndex(self):
+        """
+        Tests LSHIndex methods.
+        """
+
+        self.assertRaises(ValueError, LSHIndex, 1)
+        self.assertRaises(ValueError, LSHIndex, 10, num_tables=0)
+        self.assertRaises(ValueError, LSHIndex, 10, bits_per_table=0)
+
+        size = len(self.chromosomes[0])
+        base = self.chromosomes[0]
+        reverse = BaseChromosome([1.0 - x for x in base])
+        for order_based in [True, False]:
+            index = LSHIndex(size, num_tables=4, bits_per_table=8,
+                             order_based=order_based)
+
+            signature = index.signature(base)
+            self.assertEqual(len(signature), 4)
+            self.assertTrue(all(0 <= x < 2**8 for x in signature))
+            self.assertEqual(index.estimated_distance(signature, signature),
+                             0.0)
+
+            # All order relations and thresholds are inverted (but ties).
+            self.assertEqual(
+                index.estimated_distance(signature, index.signature(reverse)),
+                1.0)
+
+            order = index.farthest_first(base, [base, reverse, base])
+            self.assertEqual(order, [1, 0, 2])
+            self.assertEqual(
+                sorted(index.farthest_first(base, self.chromosomes)),
+                list(range(len(self.chromosomes))))
+
+        # Same seed, same index.
+        self.assertEqual(LSHIndex(size, seed=7).signature(base),
+                         LSHIndex(size, seed=7).signature(base))
+
+    ###########################################################################
+
+    def check_bulk_methods(self, dist: DistanceFunctionBase):
+        """
+        Checks whether one_to_many() and all_pairs() match distance().
+        """
+
+        chromosome = self.chromosomes[0]
+        self.assertEqual(
+            dist.one_to_many(chromosome, self.chromosomes),
+            [dist(chromosome, other) for other in self.chromosomes])
+        self.assertEqual(dist.one_to_many(chromosome, []), [])
+
+        matrix = dist.all_pairs(self.chromosomes)
+        for i, chr1 in enumerate(self.chromosomes):
+            for j, chr2 in enumerate(self.chromosomes):
+                self.assertAlmostEqual(matrix[i][j], dist(chr1, chr2))
+        self.assertEqual(dist.all_pairs([]), [])
+
+###############################################################################
+
+if __name__ == "__main__":
+    unittest.main()
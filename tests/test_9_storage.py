@@ -0,0 +1,236 @@
+"""
+test_storage.py: Tests for the compact storage of random keys.
+
+(c) Copyright 2022, Carlos Eduardo de Andrade. All Rights Reserved.
+
+This code is released under LICENSE.md.
+
+Created on:  Oct 19, 2026 by ceandrade
+Last update: Oct 19, 2026 by ceandrade
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+"""
+
+from array import array
+from copy import deepcopy
+from random import Random
+import tempfile
+import unittest
+
+from brkga_mp_ipr.algorithm import BrkgaMpIpr
+from brkga_mp_ipr.distances import HammingDistance
+from brkga_mp_ipr.enums import *
+from brkga_mp_ipr.storage import KeyCodec, MappedRows
+from brkga_mp_ipr.types import BaseChromosome, BrkgaParams
+
+from tests.instance import Instance
+from tests.decoders import SumDecode
+
+###############################################################################
+
+class Test(unittest.TestCase):
+    """
+    Test units for the storage of random keys.
+    """
+
+    ###########################################################################
+
+    def setUp(self):
+        """
+        Sets up some configurations.
+        """
+
+        Test.maxDiff = None
+
+        self.chromosome_size = 100
+
+        self.default_brkga_params = BrkgaParams()
+        self.default_brkga_params.population_size = 10
+        self.default_brkga_params.elite_percentage = 0.3
+        self.default_brkga_params.mutants_percentage = 0.1
+        self.default_brkga_params.num_elite_parents = 1
+        self.default_brkga_params.total_parents = 2
+        self.default_brkga_params.bias_type = BiasFunctionType.LOGINVERSE
+        self.default_brkga_params.num_independent_populations = 3
+
+        self.instance = Instance(self.chromosome_size)
+        self.sum_decoder = SumDecode(self.instance)
+
+        self.default_param_values = {
+            "decoder": self.sum_decoder,
+            "sense": Sense.MAXIMIZE,
+            "seed": 98747382473209,
+            "chromosome_size": self.chromosome_size,
+            "params": self.default_brkga_params,
+            "evolutionary_mechanism_on": True,
+            "chrmosome_type": BaseChromosome
+        }
+
+    ###########################################################################
+
+    def test_KeyCodec(self):
+        """
+        Tests KeyCodec methods.
+        """
+
+        for key_storage, bytes_per_key, max_error in [
+                (KeyStorage.FLOAT64, 8, 0.0),
+                (KeyStorage.FLOAT32, 4, 1e-7),
+                (KeyStorage.UINT16, 2, 2.0**-16),
+                (KeyStorage.UINT32, 4, 2.0**-32)]:
+            codec = KeyCodec(key_storage)
+            self.assertEqual(codec.bytes_per_key, bytes_per_key)
+            self.assertEqual(codec.fixed_point,
+                             key_storage in (KeyStorage.UINT16,
+                                             KeyStorage.UINT32))
+
+            row = codec.random_row(Random(2701), 1000)
+            self.assertIsInstance(row, array)
+            self.assertEqual(len(row), 1000)
+
+            keys = codec.to_keys(row)
+            self.assertTrue(all(0.0 <= key < 1.0 for key in keys))
+            self.assertEqual(keys, [codec.to_key(value) for value in row])
+            self.assertEqual(codec.from_keys(keys), row)
+
+            keys = [Random(2702).random() for _ in range(1000)]
+            for key, stored in zip(keys, codec.to_keys(
+                    codec.from_keys(keys))):
+                self.assertLessEqual(abs(key - stored), max_error)
+
+            codec.fill_row(Random(2703), row)
+            self.assertNotEqual(row, codec.random_row(Random(2701), 1000))
+
+        # Out of range keys are clamped in fixed-point.
+        codec = KeyCodec(KeyStorage.UINT16)
+        self.assertEqual(codec.from_keys([-0.5, 1.0, 2.0]).tolist(),
+                         [0, 65535, 65535])
+
+    ###########################################################################
+
+    def test_MappedRows(self):
+        """
+        Tests MappedRows methods.
+        """
+
+        codec = KeyCodec(KeyStorage.UINT16)
+        with tempfile.TemporaryDirectory() as directory:
+            mapped_rows = MappedRows(codec, 10, directory, chunk_bytes=1000)
+            self.assertEqual(mapped_rows.rows_per_chunk, 3)
+            self.assertEqual(MappedRows(codec, 10**6, directory)
+                             .rows_per_chunk, 2)
+
+            rows = mapped_rows.new_rows(4)
+            self.assertEqual(len(rows), 4)
+            self.assertEqual(mapped_rows.mapped_bytes, 4 * 10 * 2)
+            for row in rows:
+                self.assertEqual(row.tolist(), [0] * 10)
+
+            codec.fill_row(Random(2705), rows[1])
+            rows[2][:] = codec.from_keys([0.5] * 10)
+            self.assertEqual(rows[0].tolist(), [0] * 10)
+            self.assertNotEqual(rows[1].tolist(), [0] * 10)
+            self.assertEqual(codec.to_keys(rows[2]), [32768.5 / 65536] * 10)
+            self.assertEqual(rows[3].tolist(), [0] * 10)
+
+            self.assertRaises(TypeError, deepcopy, mapped_rows)
+
+    ###########################################################################
+
+    def test_algorithm_key_storage(self):
+        """
+        Tests the algorithm using each storage format.
+        """
+
+        dist = HammingDistance(epsilon=0.01)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        for key_storage, storage_directory in \
+                [(key_storage, None) for key_storage in KeyStorage] + \
+                [(key_storage, directory.name) for key_storage in KeyStorage]:
+            param_values = deepcopy(self.default_param_values)
+            param_values["key_storage"] = key_storage
+            param_values["storage_directory"] = storage_directory
+            brkga = BrkgaMpIpr(**param_values)
+            self.assertEqual(brkga.key_storage, key_storage)
+            if storage_directory is not None:
+                # Decode the populations in several chunks.
+                brkga._mapped_rows.chunk_bytes = 3 * 32 * self.chromosome_size
+
+            local_rng = Random(2704)
+            brkga.set_initial_population([
+                BaseChromosome([local_rng.random()
+                                for _ in range(self.chromosome_size)])
+            ])
+            brkga.initialize()
+            brkga.evolve(5)
+            brkga.path_relink(PathRelinkingType.DIRECT,
+                              PathRelinkingSelection.RANDOMELITE, dist,
+                              10, 1.0, block_size=10, percentage=0.5)
+            brkga.inject_chromosome(brkga.get_chromosome(1, 0), 0, 9)
+            brkga.evolve(2)
+
+            for population in brkga._current_populations:
+                for chromosome in population.chromosomes:
+                    if storage_directory is not None:
+                        self.assertIsInstance(chromosome, memoryview)
+                        self.assertEqual(chromosome.format,
+                                         KeyCodec(key_storage).typecode)
+                    elif key_storage == KeyStorage.FLOAT64:
+                        self.assertIsInstance(chromosome, BaseChromosome)
+                    else:
+                        self.assertIsInstance(chromosome, array)
+                        self.assertEqual(chromosome.typecode,
+                                         KeyCodec(key_storage).typecode)
+
+            # The user always gets chromosomes of floats.
+            best = brkga.get_best_chromosome()
+            self.assertIsInstance(best, BaseChromosome)
+            self.assertTrue(all(isinstance(key, float) for key in best))
+            self.assertEqual(brkga.get_best_chromosome_view(), best)
+
+            fitness = list(brkga.get_fitness_array(0))
+            self.assertEqual(fitness, sorted(fitness, reverse=True))
+
+            for position, row in enumerate(brkga.get_elite_matrix(2)):
+                self.assertEqual(row, brkga.get_chromosome(2, position))
+                self.assertTrue(all(isinstance(key, float) for key in row))
+
+            # Restarting keeps the storage.
+            types = [type(chromosome) for chromosome in
+                     brkga._current_populations[0].chromosomes]
+            brkga.reset()
+            self.assertEqual(types, [
+                type(chromosome) for chromosome in
+                brkga._current_populations[0].chromosomes])
+
+        # Memory-mapped populations produce the same results as in-memory
+        # ones.
+        for key_storage in KeyStorage:
+            results = []
+            for storage_directory in [None, directory.name]:
+                param_values = deepcopy(self.default_param_values)
+                param_values["key_storage"] = key_storage
+                param_values["storage_directory"] = storage_directory
+                brkga = BrkgaMpIpr(**param_values)
+                brkga.initialize()
+                brkga.evolve(3)
+                results.append([brkga.get_chromosome(i, j)
+                                for i in range(3) for j in range(10)])
+            self.assertEqual(results[0], results[1])
+
+###############################################################################
+
+if __name__ == "__main__":
+    unittest.main()